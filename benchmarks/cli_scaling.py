@@ -0,0 +1,75 @@
+"""
+Measure how the ``datpro`` command scales with its number of worker processes.
+
+The script writes ``--files`` synthetic CSV files of ``--rows`` rows to a
+temporary directory, profiles them with ``python -m datpro`` once per
+``--workers`` value, and reports the wall time of each run and its speedup
+over the first. Every run is a fresh command, so process start-up and the
+import of datpro in each worker are included, as they are in a real batch.
+The speedup can only show on a machine with as many CPUs as workers.
+
+Example
+-------
+::
+
+    $ python benchmarks/cli_scaling.py --files 32 --rows 200000 --workers 1 2 4 8
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+
+def write_files(directory, n_files, n_rows, seed=0):
+    """Write ``n_files`` CSV files of mixed numeric and categorical data."""
+    rng = np.random.default_rng(seed)
+    for i in range(n_files):
+        df = pd.DataFrame({
+            **{f"x{j}": rng.normal(size=n_rows) for j in range(6)},
+            **{f"c{j}": rng.choice(["a", "b", "c", "d"], n_rows) for j in range(2)},
+        })
+        df.to_csv(os.path.join(directory, f"part-{i:04d}.csv"), index=False)
+
+
+def run_once(directory, workers):
+    """Profile every file of ``directory`` with ``workers`` processes; return the wall time in seconds."""
+    command = [sys.executable, "-m", "datpro", os.path.join(directory, "*.csv"),
+               "--output", os.path.join(directory, f"reports-{workers}"), "--workers", str(workers), "--quiet"]
+    start = time.perf_counter()
+    subprocess.run(command, check=True)
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure the scaling of the datpro command with worker processes.")
+    parser.add_argument("--files", type=int, default=16, help="Number of CSV files (default: 16).")
+    parser.add_argument("--rows", type=int, default=100_000, help="Rows per file (default: 100,000).")
+    parser.add_argument("--workers", nargs="+", type=int, default=[1, 2, 4],
+                        help="Worker counts to compare; the first is the reference (default: 1 2 4).")
+    parser.add_argument("--output", default=None, help="Also write the timings to this JSON file.")
+    args = parser.parse_args(argv)
+
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        write_files(directory, args.files, args.rows)
+        for workers in args.workers:
+            seconds = run_once(directory, workers)
+            speedup = results[0]["seconds"] / seconds if results else 1.0
+            results.append({"workers": workers, "seconds": round(seconds, 3), "speedup": round(speedup, 2)})
+            print(f"{workers:>3} workers: {seconds:7.2f} s  speedup {speedup:.2f}x")
+    print(f"{os.cpu_count()} CPUs, {args.files} files of {args.rows:,} rows")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"cpus": os.cpu_count(), "files": args.files, "rows": args.rows, "runs": results}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
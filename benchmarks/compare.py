@@ -0,0 +1,60 @@
+"""
+Compare two benchmark result files and flag regressions.
+
+Cases are matched on name, rows and columns. A case is reported as a
+regression when its time or peak memory grew by more than ``--threshold``
+(a ratio, 1.25 by default) relative to the baseline.
+
+Example
+-------
+::
+
+    $ python benchmarks/compare.py benchmarks/results/1.1.7-*.json benchmarks/results/1.2.0-*.json
+"""
+import argparse
+import json
+import sys
+
+
+def load(path):
+    with open(path) as f:
+        data = json.load(f)
+    return data["environment"], {(r["case"], r["rows"], r["columns"]): r for r in data["results"]}
+
+
+def compare(baseline, candidate):
+    """Return ``(key, metric, old, new, ratio)`` rows for cases present in both runs."""
+    rows = []
+    for key in baseline.keys() & candidate.keys():
+        for metric in ("seconds", "peak_memory_mb"):
+            old, new = baseline[key][metric], candidate[key][metric]
+            ratio = new / old if old > 0 else float("inf") if new > 0 else 1.0
+            rows.append((key, metric, old, new, ratio))
+    return sorted(rows, key=lambda row: row[0])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files.")
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="Ratio above which a slowdown or memory increase is a regression (default: 1.25).")
+    args = parser.parse_args(argv)
+
+    base_env, baseline = load(args.baseline)
+    cand_env, candidate = load(args.candidate)
+    print(f"baseline:  datpro {base_env['datpro']} ({base_env.get('commit')}) on {base_env['platform']}")
+    print(f"candidate: datpro {cand_env['datpro']} ({cand_env.get('commit')}) on {cand_env['platform']}")
+
+    regressions = 0
+    for (case, n_rows, n_columns), metric, old, new, ratio in compare(baseline, candidate):
+        flag = "REGRESSION" if ratio > args.threshold else ""
+        regressions += bool(flag)
+        print(f"{case:<40} {n_rows:>12,} x {n_columns:<6} {metric:<15} "
+              f"{old:>12.4f} -> {new:>12.4f} ({ratio:5.2f}x) {flag}")
+    print(f"{regressions} regression(s) above {args.threshold:.2f}x")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+"""
+Measure how long ``import datpro`` takes in a fresh interpreter, and guard what it loads.
+
+Each run starts a new Python process with ``-X importtime`` and reads the
+cumulative time of the ``datpro`` package from its report. The script fails
+(exit status 1) if the median exceeds ``--max-ms`` or if the import loaded a
+module that should only load on demand, such as Altair.
+
+Example
+-------
+::
+
+    $ python benchmarks/import_time.py --runs 10 --max-ms 1500
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+# Modules only plotify needs; importing datpro alone must not load them
+DEFERRED_MODULES = ['altair', 'jsonschema', 'matplotlib', 'wordcloud', 'importlib.metadata', 'asyncio']
+
+
+def import_once():
+    """Return datpro's cumulative import time in ms and the deferred modules that were loaded."""
+    code = ("import sys, datpro; "
+            f"print(','.join(m for m in {DEFERRED_MODULES!r} if m in sys.modules))")
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                            capture_output=True, text=True, check=True)
+    cumulative_us = None
+    for line in result.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        parts = [part.strip() for part in line.split("|")]
+        if len(parts) == 3 and parts[2] == "datpro":
+            cumulative_us = int(parts[1])
+    loaded = [name for name in result.stdout.strip().split(",") if name]
+    return cumulative_us / 1000, loaded
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure the import time of datpro.")
+    parser.add_argument("--runs", type=int, default=5, help="Number of fresh imports (default: 5).")
+    parser.add_argument("--max-ms", type=float, default=None,
+                        help="Fail if the median import time exceeds this many milliseconds.")
+    parser.add_argument("--output", default=None, help="Also write the timings to this JSON file.")
+    args = parser.parse_args(argv)
+
+    timings, loaded = [], set()
+    for _ in range(args.runs):
+        ms, modules = import_once()
+        timings.append(ms)
+        loaded.update(modules)
+    median = statistics.median(timings)
+    print(f"import datpro: median {median:.1f} ms, min {min(timings):.1f} ms over {args.runs} runs")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"runs_ms": timings, "median_ms": median, "deferred_loaded": sorted(loaded)}, f, indent=2)
+
+    failed = False
+    if loaded:
+        print(f"FAIL: import datpro loaded {', '.join(sorted(loaded))}")
+        failed = True
+    if args.max_ms is not None and median > args.max_ms:
+        print(f"FAIL: median import time exceeds {args.max_ms:.0f} ms")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,177 @@
+"""
+Time and memory-profile datpro's public functions on synthetic data.
+
+Every case runs on a frame from ``scripts/generate_data.py`` at each requested
+size. Wall time is the best of ``--repeat`` runs; peak memory is measured with
+``tracemalloc`` in one extra run, so tracing does not slow the timed runs.
+Results are written as JSON, one file per run, to be compared across
+releases with ``benchmarks/compare.py``.
+
+Examples
+--------
+Quick run at the default sizes::
+
+    $ python benchmarks/run_benchmarks.py
+
+Production scale, profiling functions only::
+
+    $ python benchmarks/run_benchmarks.py --rows 1e6 1e7 1e8 --columns 10 1000 \\
+        --cases summarize_data detect_anomalies
+"""
+import argparse
+import datetime
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, os.pardir, "scripts"))
+
+import datpro  # noqa: E402
+from datpro import detect_anomalies, plotify, summarize_data, top_correlations  # noqa: E402
+from generate_data import generate_example_data  # noqa: E402
+
+ANOMALY_TYPES = ['missing_values', 'outliers', 'duplicates']
+PLOT_TYPES = ['histogram', 'density', 'bar', 'scatter', 'correlation', 'box', 'stacked_bar']
+# Altair refuses to serialize charts embedding more rows than this
+ALTAIR_MAX_ROWS = 5000
+
+
+def _render(charts):
+    """Serialize every chart, since building a chart object alone defers most of the work."""
+    for chart in charts.values():
+        chart.to_json()
+
+
+def benchmark_cases(n_rows):
+    """Return ``(name, function)`` pairs to run on a frame of ``n_rows`` rows."""
+    cases = [('summarize_data', summarize_data)]
+    for anomaly_type in ANOMALY_TYPES:
+        cases.append((f'detect_anomalies[{anomaly_type}]',
+                      lambda df, anomaly_type=anomaly_type: detect_anomalies(df, anomaly_type=anomaly_type)))
+    cases.append(('top_correlations', top_correlations))
+    for plot_type in PLOT_TYPES:
+        cases.append((f'plotify[{plot_type},aggregate]',
+                      lambda df, plot_type=plot_type: _render(plotify(df, plot_types=[plot_type], aggregate=True))))
+        if n_rows <= ALTAIR_MAX_ROWS:
+            cases.append((f'plotify[{plot_type}]',
+                          lambda df, plot_type=plot_type: _render(plotify(df, plot_types=[plot_type]))))
+    return cases
+
+
+def make_frame(n_rows, n_columns, missing_rate, duplicate_rate, numeric_fraction):
+    """Build a benchmark frame with ``n_columns`` columns split between numeric and categorical."""
+    num_numeric = max(1, round(n_columns * numeric_fraction))
+    return generate_example_data(
+        num_rows=n_rows,
+        num_numeric=num_numeric,
+        num_categorical=n_columns - num_numeric,
+        missing_rate=missing_rate,
+        duplicate_rate=duplicate_rate
+    )
+
+
+def measure(func, df, repeat):
+    """Return the best wall time over ``repeat`` runs and the peak traced memory of one run."""
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func(df)
+        times.append(time.perf_counter() - start)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func(df)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return min(times), peak
+
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], cwd=HERE, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def environment():
+    """Versions and machine details stored with the results."""
+    return {
+        "datpro": datpro.__version__,
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds")
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--rows", nargs="+", type=float, default=[1e3, 1e4, 1e5],
+                        help="Row counts to benchmark (default: 1e3 1e4 1e5).")
+    parser.add_argument("--columns", nargs="+", type=int, default=[10],
+                        help="Column counts to benchmark (default: 10).")
+    parser.add_argument("--numeric-fraction", type=float, default=0.6,
+                        help="Share of numeric columns; the rest are categorical (default: 0.6).")
+    parser.add_argument("--missing-rate", type=float, default=0.05,
+                        help="Fraction of missing values per numeric column (default: 0.05).")
+    parser.add_argument("--duplicate-rate", type=float, default=0.01,
+                        help="Fraction of duplicated rows (default: 0.01).")
+    parser.add_argument("--cases", nargs="+", default=None,
+                        help="Only run cases whose name starts with one of these prefixes.")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Timed runs per case; the best is reported (default: 3).")
+    parser.add_argument("--output", default=None,
+                        help="Result file (default: benchmarks/results/<version>-<time>.json).")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    env = environment()
+    results = []
+    for n_rows in (int(rows) for rows in args.rows):
+        for n_columns in args.columns:
+            df = make_frame(n_rows, n_columns, args.missing_rate, args.duplicate_rate, args.numeric_fraction)
+            for name, func in benchmark_cases(n_rows):
+                if args.cases and not name.startswith(tuple(args.cases)):
+                    continue
+                seconds, peak = measure(func, df, args.repeat)
+                results.append({
+                    "case": name,
+                    "rows": len(df),
+                    "columns": n_columns,
+                    "seconds": seconds,
+                    "peak_memory_mb": peak / 1024 ** 2
+                })
+                print(f"{name:<40} {len(df):>12,} rows {n_columns:>6} cols "
+                      f"{seconds:>10.4f} s {peak / 1024 ** 2:>10.1f} MiB", flush=True)
+            del df
+
+    output = args.output
+    if output is None:
+        stamp = env["timestamp"].replace(":", "").replace("-", "")
+        output = os.path.join(HERE, "results", f"{env['datpro']}-{stamp}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump({"environment": env, "results": results}, f, indent=2)
+    print(f"Results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,8 @@
 import pandas as pd
 import numpy as np
 
-def generate_example_data():
+def generate_example_data(num_rows=1000, num_numeric=3, num_categorical=2, missing_rate=None,
+                          duplicate_rate=0.01, seed=42):
     """
     Generate a synthetic dataset for demonstrating the package's functionality.
 
@@ -12,44 +13,86 @@ def generate_example_data():
     - Outliers in numeric data
     - Duplicated rows
 
+    With the default arguments the result is the 1,010-row example dataset
+    stored in ``data/example_data.csv``. The arguments scale it up for
+    benchmarks.
+
+    Parameters
+    ----------
+    num_rows : int, optional
+        Number of distinct rows before duplicates are added. Default is 1000.
+    num_numeric : int, optional
+        Number of numeric columns. The first three are ``Age``, ``Income`` and
+        ``Spending_Score``; further ones are named ``num_3``, ``num_4``, ...
+        Default is 3.
+    num_categorical : int, optional
+        Number of categorical columns. The first two are ``Gender`` and
+        ``Region``; further ones are named ``cat_2``, ``cat_3``, ... with
+        between 3 and 50 categories. Default is 2.
+    missing_rate : float, optional
+        Fraction of missing values in every numeric column except ``Age``. If
+        None, ``Income`` has 5% and ``Spending_Score`` 3% missing values and
+        the other columns none. Default is None.
+    duplicate_rate : float, optional
+        Number of duplicated rows appended, as a fraction of ``num_rows``.
+        Default is 0.01.
+    seed : int, optional
+        Random seed. Default is 42.
+
     Returns
     -------
     pandas.DataFrame
         A synthetic DataFrame with diverse data types and properties.
     """
-    np.random.seed(42)  # For reproducibility
-    
+    np.random.seed(seed)  # For reproducibility
+
     # Generate numeric columns
-    num_rows = 1000
     data = {
         'Age': np.random.randint(18, 70, size=num_rows),  # Uniform distribution
         'Income': np.random.normal(50000, 15000, size=num_rows),  # Normal distribution
         'Spending_Score': np.random.beta(2, 5, size=num_rows) * 100,  # Beta distribution
     }
-    
+
     # Add outliers
-    data['Income'][np.random.choice(num_rows, size=20, replace=False)] *= 5  # Income outliers
-    
+    data['Income'][np.random.choice(num_rows, size=num_rows // 50, replace=False)] *= 5  # Income outliers
+
     # Generate categorical columns
     data['Gender'] = np.random.choice(['Male', 'Female'], size=num_rows, p=[0.5, 0.5])
     data['Region'] = np.random.choice(['North', 'South', 'East', 'West'], size=num_rows, p=[0.3, 0.3, 0.2, 0.2])
-    
+
     # Add missing values
-    data['Income'][np.random.choice(num_rows, size=50, replace=False)] = np.nan
-    data['Spending_Score'][np.random.choice(num_rows, size=30, replace=False)] = np.nan
-    
+    income_rate, spending_rate = (0.05, 0.03) if missing_rate is None else (missing_rate, missing_rate)
+    data['Income'][np.random.choice(num_rows, size=round(income_rate * num_rows), replace=False)] = np.nan
+    data['Spending_Score'][np.random.choice(num_rows, size=round(spending_rate * num_rows), replace=False)] = np.nan
+
+    # Extra columns for wide benchmark tables
+    for i in range(3, num_numeric):
+        values = np.random.lognormal(0, 1, size=num_rows) if i % 2 else np.random.normal(0, 1, size=num_rows)
+        if missing_rate:
+            values[np.random.choice(num_rows, size=round(missing_rate * num_rows), replace=False)] = np.nan
+        data[f'num_{i}'] = values
+    for i in range(2, num_categorical):
+        n_categories = 3 + (i * 7) % 48
+        data[f'cat_{i}'] = pd.Categorical.from_codes(
+            np.random.randint(0, n_categories, size=num_rows),
+            [f'c{j}' for j in range(n_categories)]
+        )
+    for col in ['Age', 'Income', 'Spending_Score'][num_numeric:] + ['Gender', 'Region'][num_categorical:]:
+        del data[col]
+
     # Introduce duplicates
     df = pd.DataFrame(data)
-    duplicates = df.sample(n=10, replace=False, random_state=42)
+    duplicates = df.sample(n=round(duplicate_rate * num_rows), replace=False, random_state=seed)
     df = pd.concat([df, duplicates], ignore_index=True)
-    
+
     # Shuffle the rows
-    df = df.sample(frac=1, random_state=42).reset_index(drop=True)
-    
+    df = df.sample(frac=1, random_state=seed).reset_index(drop=True)
+
     return df
 
-# Generate the synthetic data
-example_data = generate_example_data()
+if __name__ == "__main__":
+    # Generate the synthetic data
+    example_data = generate_example_data()
 
-# Save to CSV for external use if needed
-example_data.to_csv("data/example_data.csv", index=False)
\ No newline at end of file
+    # Save to CSV for external use if needed
+    example_data.to_csv("data/example_data.csv", index=False)
@@ -1,7 +1,41 @@
-# read version from installed package
-from importlib.metadata import version
-__version__ = version("datpro")
-
 from datpro.datpro import detect_anomalies
 from datpro.datpro import plotify
-from datpro.datpro import summarize_data
\ No newline at end of file
+from datpro.datpro import summarize_data
+from datpro.streaming import summarize_stream
+from datpro.streaming import detect_anomalies_stream
+from datpro.streaming import estimate_cardinality
+from datpro.streaming import profile_categoricals
+from datpro.streaming import missing_patterns
+from datpro.streaming import ProfileState
+from datpro.parquet import summarize_parquet
+from datpro.parquet import detect_anomalies_parquet
+from datpro._sketches import HyperLogLog
+from datpro._sketches import SpaceSaving
+from datpro._lazy import LazyCharts
+from datpro._cache import ProfileCache
+from datpro._compact import compact_dataframe
+from datpro._correlation import top_correlations
+from datpro._correlation import CorrelationState
+from datpro._minhash import near_duplicate_clusters
+from datpro.instrumentation import StageEvent
+from datpro.instrumentation import add_hook
+from datpro.instrumentation import remove_hook
+from datpro.instrumentation import profile_stages
+
+
+# asyncio is slow to import, so the async API loads on first use
+_ASYNC_NAMES = ("AsyncProfiler", "ProfilerBusyError", "summarize_data_async", "detect_anomalies_async",
+                "plotify_async")
+
+
+def __getattr__(name):
+    # read version from installed package on first access; importlib.metadata is slow to import
+    if name == "__version__":
+        from importlib.metadata import version
+        globals()["__version__"] = version("datpro")
+        return globals()["__version__"]
+    if name in _ASYNC_NAMES:
+        from datpro import aio
+        globals()[name] = getattr(aio, name)
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
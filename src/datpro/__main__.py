@@ -0,0 +1,5 @@
+import sys
+
+from datpro.cli import main
+
+sys.exit(main())
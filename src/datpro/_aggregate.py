@@ -0,0 +1,173 @@
+import numpy as np
+import pandas as pd
+from typing import Optional
+
+from datpro._sketches import SpaceSaving
+
+HISTOGRAM_MAXBINS = 10
+SCATTER_MAXBINS = 40
+DENSITY_GRID = 256
+OTHER_LABEL = 'Other'
+
+
+def _valid(series: pd.Series) -> np.ndarray:
+    values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+    return values[~np.isnan(values)]
+
+
+def nice_edges(lo: float, hi: float, maxbins: int) -> np.ndarray:
+    """
+    Bin edges on "nice" steps (1, 2 or 5 times a power of ten) covering [lo, hi].
+
+    Mirrors the default binning Vega-Lite applies for ``bin=True``, so
+    pre-aggregated histograms look like the ones it would draw itself.
+    """
+    if not np.isfinite(lo) or not np.isfinite(hi):
+        return np.array([0.0, 1.0])
+    if lo == hi:
+        return np.array([lo - 0.5, hi + 0.5])
+    span = hi - lo
+    step = 10.0 ** np.ceil(np.log10(span / maxbins))
+    for divisor in (5, 2):
+        if span / (step / divisor) <= maxbins:
+            step /= divisor
+            break
+    start = np.floor(lo / step) * step
+    stop = np.ceil(hi / step) * step
+    if stop <= hi:
+        stop += step
+    return np.arange(round((stop - start) / step) + 1) * step + start
+
+
+def histogram_table(series: pd.Series, maxbins: int = HISTOGRAM_MAXBINS) -> pd.DataFrame:
+    """Counts per nice bin, one row per bin: ``bin_start``, ``bin_end``, ``count``."""
+    values = _valid(series)
+    if values.size == 0:
+        return pd.DataFrame({'bin_start': [], 'bin_end': [], 'count': []})
+    edges = nice_edges(values.min(), values.max(), maxbins)
+    counts, _ = np.histogram(values, bins=edges)
+    return pd.DataFrame({'bin_start': edges[:-1], 'bin_end': edges[1:], 'count': counts})
+
+
+def density_table(series: pd.Series, grid_size: int = DENSITY_GRID) -> pd.DataFrame:
+    """
+    Gaussian kernel density on a regular grid: ``value``, ``density``.
+
+    Uses Scott's bandwidth rule, like Vega's density transform, and a binned
+    approximation: values are counted on a fine grid and the counts are
+    convolved with the kernel, so the cost is linear in the number of rows.
+    """
+    values = _valid(series)
+    empty = pd.DataFrame({'value': [], 'density': []})
+    if values.size < 2:
+        return empty
+    sigma = values.std(ddof=1)
+    q1, q3 = np.quantile(values, [0.25, 0.75])
+    spread = min(sigma, (q3 - q1) / 1.34) if q3 > q1 else sigma
+    bandwidth = 1.06 * spread * values.size ** -0.2
+    if not bandwidth > 0:
+        return empty
+    counts, edges = np.histogram(values, bins=grid_size,
+                                 range=(values.min() - 3 * bandwidth, values.max() + 3 * bandwidth))
+    step = edges[1] - edges[0]
+    half = min(grid_size - 1, int(np.ceil(4 * bandwidth / step)))
+    offsets = np.arange(-half, half + 1) * step
+    kernel = np.exp(-0.5 * (offsets / bandwidth) ** 2) / (bandwidth * np.sqrt(2 * np.pi))
+    density = np.convolve(counts, kernel)[half:half + grid_size] / values.size
+    return pd.DataFrame({'value': (edges[:-1] + edges[1:]) / 2, 'density': density})
+
+
+def _other_label(values: pd.Series) -> str:
+    """``OTHER_LABEL``, starred as often as needed to differ from every kept value."""
+    label = OTHER_LABEL
+    while (values == label).any():
+        label += '*'
+    return label
+
+
+def value_counts_table(series: pd.Series, top_k: Optional[int] = None) -> pd.DataFrame:
+    """
+    Count of each distinct value, missing values included: ``value``, ``count``.
+
+    With ``top_k``, only the ``top_k`` most frequent values get a row and all
+    others are counted together in one ``OTHER_LABEL`` row.
+    """
+    if top_k is None:
+        counts = series.value_counts(dropna=False, sort=False)
+        return pd.DataFrame({'value': counts.index, 'count': counts.to_numpy()})
+    sketch = SpaceSaving(top_k).update(series)
+    top = sketch.top(top_k)[['value', 'count']]
+    other = sketch.total - int(top['count'].sum())
+    if other:
+        top.loc[len(top)] = [_other_label(top['value']), other]
+    return top
+
+
+def lump_other(series: pd.Series, top_k: int) -> Optional[pd.Series]:
+    """
+    ``series`` with every value outside its ``top_k`` most frequent replaced by ``OTHER_LABEL``.
+
+    Returns None when the series has at most ``top_k`` distinct values.
+    """
+    sketch = SpaceSaving(top_k).update(series)
+    top = sketch.top(top_k)
+    if sketch.total == int(top['count'].sum()):
+        return None
+    return series.astype(object).where(series.isin(top['value']), _other_label(top['value']))
+
+
+def crosstab_table(df: pd.DataFrame, col1: str, col2: str) -> pd.DataFrame:
+    """Count of each ``(col1, col2)`` combination: ``x``, ``color``, ``count``."""
+    counts = df.groupby([col1, col2], dropna=False, observed=True).size()
+    table = counts.reset_index(name='count')
+    table.columns = ['x', 'color', 'count']
+    return table
+
+
+def box_table(df: pd.DataFrame, value_col: str, group_col: str) -> pd.DataFrame:
+    """
+    Tukey box-plot statistics of ``value_col`` per ``group_col`` category.
+
+    Columns are ``group``, ``lower``, ``q1``, ``median``, ``q3`` and
+    ``upper``, where the whiskers reach the most extreme values within
+    1.5 x IQR of the quartiles (the Vega-Lite default).
+    """
+    data = pd.DataFrame({'group': df[group_col], 'value': pd.to_numeric(df[value_col])})
+    data = data[data['value'].notna()]
+    grouped = data.groupby('group', dropna=False, observed=True)['value']
+    quartiles = grouped.quantile([0.25, 0.5, 0.75]).unstack()
+    stats = pd.DataFrame({
+        'group': quartiles.index,
+        'q1': quartiles[0.25].to_numpy(),
+        'median': quartiles[0.5].to_numpy(),
+        'q3': quartiles[0.75].to_numpy()
+    })
+    iqr = stats['q3'] - stats['q1']
+    stats['low_fence'] = stats['q1'] - 1.5 * iqr
+    stats['high_fence'] = stats['q3'] + 1.5 * iqr
+    merged = data.merge(stats[['group', 'low_fence', 'high_fence']], on='group')
+    inside = merged[(merged['value'] >= merged['low_fence']) & (merged['value'] <= merged['high_fence'])]
+    whiskers = inside.groupby('group', dropna=False, observed=True)['value'].agg(['min', 'max'])
+    stats = stats.merge(whiskers, left_on='group', right_index=True, how='left')
+    stats = stats.rename(columns={'min': 'lower', 'max': 'upper'})
+    return stats[['group', 'lower', 'q1', 'median', 'q3', 'upper']].reset_index(drop=True)
+
+
+def binned_scatter_table(df: pd.DataFrame, col1: str, col2: str,
+                         maxbins: int = SCATTER_MAXBINS) -> pd.DataFrame:
+    """Two-dimensional histogram of non-empty cells: ``x_start``, ``x_end``, ``y_start``, ``y_end``, ``count``."""
+    x = df[col1].to_numpy(dtype=np.float64, na_value=np.nan)
+    y = df[col2].to_numpy(dtype=np.float64, na_value=np.nan)
+    keep = ~(np.isnan(x) | np.isnan(y))
+    x, y = x[keep], y[keep]
+    if x.size == 0:
+        return pd.DataFrame({'x_start': [], 'x_end': [], 'y_start': [], 'y_end': [], 'count': []})
+    x_edges = nice_edges(x.min(), x.max(), maxbins)
+    y_edges = nice_edges(y.min(), y.max(), maxbins)
+    counts, _, _ = np.histogram2d(x, y, bins=[x_edges, y_edges])
+    xi, yi = np.nonzero(counts)
+    return pd.DataFrame({
+        'x_start': x_edges[xi], 'x_end': x_edges[xi + 1],
+        'y_start': y_edges[yi], 'y_end': y_edges[yi + 1],
+        'count': counts[xi, yi].astype(np.int64)
+    })
@@ -0,0 +1,146 @@
+"""Profiling of Arrow tables (pyarrow, Polars and other Arrow producers) without converting to pandas."""
+from concurrent.futures import Executor
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from datpro import instrumentation
+from datpro._numeric import SUMMARY_LABELS, block_outliers, block_quantiles, column_groups
+from datpro._parallel import map_blocks, worker_count
+
+
+def as_arrow_table(data):
+    """
+    Return ``data`` as a ``pyarrow.Table`` if it is Arrow-compatible, otherwise None.
+
+    Accepts pyarrow Tables and RecordBatches, Polars DataFrames, and any object
+    exporting the Arrow PyCapsule stream interface (``__arrow_c_stream__``).
+    The column buffers are shared, not copied. pandas DataFrames are not
+    converted; they return None.
+    """
+    if isinstance(data, pd.DataFrame):
+        return None
+    module = type(data).__module__.partition('.')[0]
+    if module not in ('pyarrow', 'polars') and not hasattr(data, '__arrow_c_stream__'):
+        return None
+    try:
+        import pyarrow as pa
+    except ImportError as e:
+        raise ImportError("Profiling Arrow data requires pyarrow: pip install 'datpro[arrow]'") from e
+    if isinstance(data, pa.Table):
+        return data
+    if isinstance(data, pa.RecordBatch):
+        return pa.Table.from_batches([data])
+    if hasattr(data, '__arrow_c_stream__'):
+        return pa.table(data)
+    if module == 'polars':
+        return data.to_arrow()
+    return None
+
+
+def numeric_columns(schema) -> List[str]:
+    """Integer and floating-point columns of an Arrow schema, the counterpart of ``select_dtypes('number')``."""
+    import pyarrow as pa
+
+    return [
+        field.name for field in schema
+        if pa.types.is_integer(field.type) or pa.types.is_floating(field.type)
+    ]
+
+
+def table_missing_counts(table, columns: List[str]) -> Dict[str, int]:
+    """
+    Missing values per column: nulls, read from the validity bitmaps, plus NaNs in float columns.
+
+    NaN counts as missing, as it does in pandas.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    counts = {}
+    for col in columns:
+        column = table.column(col)
+        with instrumentation.stage('detect_anomalies', 'missing_values', [col], table.num_rows):
+            count = column.null_count
+            if pa.types.is_floating(column.type):
+                count += pc.sum(pc.is_nan(column)).as_py() or 0
+        counts[col] = count
+    return counts
+
+
+def table_duplicate_count(table) -> int:
+    """
+    Number of rows that repeat an earlier row, like ``DataFrame.duplicated().sum()``.
+
+    Counts distinct rows with Arrow's hash grouping. NaN is folded into null
+    first so both compare equal, as they do in pandas. Column types Arrow
+    cannot group by fall back to pandas.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    if table.num_columns == 0 or table.num_rows == 0:
+        return 0
+    keys = {}
+    for i, field in enumerate(table.schema):
+        column = table.column(i)
+        if pa.types.is_floating(field.type):
+            column = pc.if_else(pc.is_nan(column), pa.scalar(None, field.type), column)
+        # Positional names, since Arrow allows duplicate column names
+        keys[f"c{i}"] = column
+    try:
+        distinct = pa.table(keys).group_by(list(keys)).aggregate([]).num_rows
+    except (pa.ArrowNotImplementedError, pa.ArrowInvalid, pa.ArrowTypeError):
+        return int(table.to_pandas().duplicated().sum())
+    return table.num_rows - distinct
+
+
+def summarize_table(table, n_jobs: Optional[int] = None, executor: Optional[Executor] = None) -> pd.DataFrame:
+    """``summarize_data`` for an Arrow table: the numeric engine reads its columns directly."""
+    if table.num_rows == 0 or table.num_columns == 0:
+        raise ValueError("The input DataFrame is empty.")
+    numeric_cols = numeric_columns(table.schema)
+    if not numeric_cols:
+        raise ValueError("The DataFrame contains no numeric columns.")
+
+    n_groups = len(numeric_cols) if instrumentation.enabled() else worker_count(n_jobs, executor)
+    groups = column_groups(table.num_rows, numeric_cols, n_groups)
+
+    def quantiles(cols):
+        with instrumentation.stage('summarize_data', 'quantiles', cols, table.num_rows):
+            return block_quantiles(table, cols)
+
+    stats = map_blocks(quantiles, groups, n_jobs, executor)
+    return pd.concat([
+        pd.DataFrame(quantiles.T, index=group, columns=SUMMARY_LABELS)
+        for group, quantiles in zip(groups, stats)
+    ])
+
+
+def table_outliers(table, thresholds: Dict[str, float], masks: Optional[str] = None,
+                   n_jobs: Optional[int] = None, executor: Optional[Executor] = None) -> tuple:
+    """
+    Outlier counts (and masks) of the numeric columns of an Arrow table.
+
+    Returns ``(counts, masks)`` shaped like ``_outlier_counts`` in ``datpro.datpro``:
+    per column, a dict from method to count (and to encoded mask).
+    """
+    numeric_cols = numeric_columns(table.schema)
+    if table.num_rows == 0:
+        return {col: dict.fromkeys(thresholds, 0) for col in numeric_cols}, None
+    n_groups = len(numeric_cols) if instrumentation.enabled() else worker_count(n_jobs, executor)
+    groups = column_groups(table.num_rows, numeric_cols, n_groups)
+
+    def count(cols):
+        with instrumentation.stage('detect_anomalies', 'outliers', cols, table.num_rows):
+            return block_outliers(table, cols, thresholds, masks)
+
+    counts = {}
+    column_masks = {} if masks else None
+    for group, (group_counts, group_masks) in zip(groups, map_blocks(count, groups, n_jobs, executor)):
+        for i, col in enumerate(group):
+            counts[col] = {method: int(group_counts[method][i]) for method in thresholds}
+            if masks:
+                column_masks[col] = {method: group_masks[method][i] for method in thresholds}
+    return counts, column_masks
@@ -0,0 +1,242 @@
+import hashlib
+import os
+import pickle
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+_MISSING = object()
+
+
+# Values hashed per column by the sampled fingerprint
+SAMPLE_VALUES = 4096
+
+
+def column_fingerprint(series: pd.Series, full: bool = False) -> str:
+    """
+    Return a content hash of a column: its dtype, length and values.
+
+    By default only up to ``SAMPLE_VALUES`` values, evenly strided and
+    including the first and last, are hashed, so a fingerprint costs
+    microseconds whatever the column's length; columns no longer than that
+    are hashed whole. With ``full``, every value is hashed: plain NumPy
+    columns straight from their buffer, other dtypes (object, categorical,
+    nullable, timezone-aware) through pandas' value hashing first. The index
+    is ignored.
+    """
+    # SHA-256 has hardware support on current CPUs, so it outruns BLAKE2 here
+    digest = hashlib.sha256()
+    n = len(series)
+    digest.update(f"{series.dtype}|{n}|{'full' if full else 'sample'}|".encode())
+    if not full and n > SAMPLE_VALUES:
+        positions = np.unique(np.linspace(0, n - 1, SAMPLE_VALUES).astype(np.intp))
+        series = series.iloc[positions]
+    if isinstance(series.dtype, np.dtype) and series.dtype.kind in "biufcmM":
+        values = np.ascontiguousarray(series.to_numpy())
+    else:
+        values = pd.util.hash_pandas_object(series, index=False).to_numpy()
+    digest.update(values.view(np.uint8))
+    return digest.hexdigest()
+
+
+def frame_fingerprints(df: pd.DataFrame, columns: Optional[Sequence] = None,
+                       full: bool = False) -> Dict[Hashable, str]:
+    """Return ``column_fingerprint`` of ``columns`` (default: all), keyed by column label."""
+    return {col: column_fingerprint(df[col], full) for col in (df.columns if columns is None else columns)}
+
+
+def _sizeof(value, seen: Optional[set] = None) -> int:
+    """
+    Approximate memory taken by ``value``, without serializing it.
+
+    Arrays, Series and DataFrames count their buffers (with the strings of
+    object columns); containers and plain objects, such as charts, add up
+    their contents.
+    """
+    seen = set() if seen is None else seen
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, (pd.Series, pd.Index)):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        return size + sum(_sizeof(k, seen) + _sizeof(v, seen) for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return size + sum(_sizeof(item, seen) for item in value)
+    if hasattr(value, '__dict__') and not isinstance(value, type):
+        return size + _sizeof(vars(value), seen)
+    return size
+
+
+class ProfileCache:
+    """
+    Cache of profiling results keyed on the content of the columns they were computed from.
+
+    Pass the same instance as ``cache=`` to ``summarize_data``,
+    ``detect_anomalies`` or ``plotify``. Results are stored per column where
+    the computation allows it (summary statistics, missing and outlier
+    counts, charts built from pre-aggregated tables), so after a change to
+    some columns only those columns are recomputed. Keys combine column
+    names, a content fingerprint of each column (dtype, length and a hash of
+    its values) and the options that affect the result.
+
+    By default the fingerprint hashes a strided sample of at most 4,096
+    values per column, so a lookup takes microseconds per column however
+    long the table is. A change confined to rows outside the sample, such
+    as one value edited in place in a long column, then goes unnoticed; pass
+    ``full_fingerprints=True`` to hash every value, at the cost of reading
+    every column on each call.
+
+    Entries live in an in-memory LRU bounded by ``max_bytes``, measured as
+    the in-memory size of each entry's arrays and frames. If ``directory``
+    is given, entries are also written there as pickle files and read back
+    on a memory miss, so results survive across processes; the directory is
+    not size-limited.
+
+    Parameters
+    ----------
+    max_bytes : int, optional
+        Upper bound on the total size of entries kept in memory. The least
+        recently used entries are evicted first. Default is 256 MiB.
+    directory : str, optional
+        Directory for the on-disk store. Default is None (memory only).
+    full_fingerprints : bool, optional
+        Hash every value of a column rather than a sample. Default is False.
+
+    Examples
+    --------
+    >>> import pandas as pd
+    >>> from datpro import ProfileCache, summarize_data
+    >>> cache = ProfileCache(max_bytes=64 * 1024 ** 2)
+    >>> df = pd.DataFrame({'A': [1, 2, 3], 'B': [4.0, 5.0, 6.0]})
+    >>> summary = summarize_data(df, cache=cache)
+    >>> summary = summarize_data(df, cache=cache)  # served from the cache
+    >>> cache.hits
+    2
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024 ** 2, directory: Optional[str] = None,
+                 full_fingerprints: bool = False):
+        if max_bytes < 0:
+            raise ValueError("max_bytes must be non-negative.")
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.full_fingerprints = full_fingerprints
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key) -> bool:
+        return key in self._entries
+
+    def __repr__(self) -> str:
+        return (f"ProfileCache({len(self._entries)} entries, {self.nbytes} bytes, "
+                f"hits={self.hits}, misses={self.misses})")
+
+    def _path(self, key) -> str:
+        name = hashlib.sha256(repr(key).encode()).hexdigest()
+        return os.path.join(self.directory, f"{name}.pkl")
+
+    def fingerprints(self, df: pd.DataFrame, columns: Optional[Sequence] = None) -> Dict[Hashable, str]:
+        """``frame_fingerprints`` of ``columns`` of ``df``, sampled or full as configured."""
+        return frame_fingerprints(df, columns, self.full_fingerprints)
+
+    def _remember(self, key, value, size: int):
+        with self._lock:
+            if key in self._entries:
+                self.nbytes -= self._entries.pop(key)[1]
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (value, size)
+            self.nbytes += size
+            while self.nbytes > self.max_bytes:
+                _, (_, size) = self._entries.popitem(last=False)
+                self.nbytes -= size
+
+    def get(self, key, default=None):
+        """Return the cached value for ``key``, or ``default`` if there is none."""
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is not _MISSING:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+        if self.directory is not None:
+            try:
+                with open(self._path(key), "rb") as f:
+                    payload = f.read()
+                value = pickle.loads(payload)
+            except (OSError, pickle.UnpicklingError, EOFError):
+                pass
+            else:
+                self._remember(key, value, _sizeof(value))
+                with self._lock:
+                    self.hits += 1
+                return value
+        with self._lock:
+            self.misses += 1
+        return default
+
+    def set(self, key, value):
+        """Store ``value`` under ``key``, evicting least recently used entries if needed."""
+        self._remember(key, value, _sizeof(value))
+        if self.directory is not None:
+            payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            path = self._path(key)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+
+    def clear(self):
+        """Drop every entry, from memory and from the on-disk store."""
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+        if self.directory is not None:
+            for name in os.listdir(self.directory):
+                if name.endswith(".pkl"):
+                    os.remove(os.path.join(self.directory, name))
+
+    def memoize(self, key, func: Callable[[], Any]) -> Any:
+        """Return the cached value for ``key``, computing and storing ``func()`` on a miss."""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = func()
+            self.set(key, value)
+        return value
+
+    def per_column(self, namespace: str, columns: Sequence, fingerprints: Dict[Hashable, str],
+                   compute: Callable[[List], Dict], options: tuple = ()) -> Dict:
+        """
+        Look up one value per column, computing only the columns that miss.
+
+        ``compute`` receives the list of missing columns and must return a
+        mapping from each of them to its value. The result maps every column
+        in ``columns`` to its value, in order.
+        """
+        keys = {col: (namespace, options, repr(col), fingerprints[col]) for col in columns}
+        values = {col: self.get(keys[col], _MISSING) for col in columns}
+        missing = [col for col in columns if values[col] is _MISSING]
+        if missing:
+            fresh = compute(missing)
+            for col in missing:
+                values[col] = fresh[col]
+                self.set(keys[col], fresh[col])
+        return values
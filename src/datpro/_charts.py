@@ -0,0 +1,207 @@
+"""Builders for the charts produced by ``plotify``, from raw rows or pre-aggregated tables."""
+import pandas as pd
+import altair as alt
+from typing import List, Optional, Union
+
+from datpro._aggregate import (
+    binned_scatter_table, box_table, crosstab_table, density_table,
+    histogram_table, lump_other, value_counts_table
+)
+from datpro._correlation import correlation_matrix, reduced_correlation
+from datpro._numeric import is_real_numeric
+
+ChartData = Union[pd.DataFrame, alt.UrlData]
+
+
+def _field(df: pd.DataFrame, col: str, data: ChartData) -> str:
+    """
+    Encoding shorthand for ``col``.
+
+    Altair infers field types from a DataFrame, but not from a URL, so
+    charts over a shared dataset file spell the type out.
+    """
+    if isinstance(data, pd.DataFrame):
+        return col
+    return f"{col}:{'Q' if is_real_numeric(df[col].dtype) else 'N'}"
+
+
+def build_histogram(df: pd.DataFrame, col: str, aggregate: bool = False,
+                    data: Optional[ChartData] = None) -> alt.Chart:
+    """Histogram of a numeric column."""
+    if aggregate:
+        return alt.Chart(histogram_table(df[col])).mark_bar().encode(
+            x=alt.X('bin_start:Q', bin='binned', title=f"{col} (binned)"),
+            x2='bin_end:Q',
+            y=alt.Y('count:Q', title='Count')
+        ).properties(title=f"Histogram of {col}")
+    data = df if data is None else data
+    return alt.Chart(data).mark_bar().encode(
+        x=alt.X(_field(df, col, data), bin=True, title=f"{col} (binned)"),
+        y=alt.Y('count()', title='Count')
+    ).properties(title=f"Histogram of {col}")
+
+
+def build_density(df: pd.DataFrame, col: str, aggregate: bool = False,
+                  data: Optional[ChartData] = None) -> alt.Chart:
+    """Kernel density plot of a numeric column."""
+    if aggregate:
+        return alt.Chart(density_table(df[col])).mark_area(opacity=0.5).encode(
+            x=alt.X('value:Q', title=col),
+            y=alt.Y('density:Q', title='Density')
+        ).properties(title=f"Density Plot of {col}")
+    data = df if data is None else data
+    return alt.Chart(data).transform_density(
+        col, as_=[col, 'density']
+    ).mark_area(opacity=0.5).encode(
+        x=alt.X(_field(df, col, data), title=col),
+        y=alt.Y('density:Q', title='Density')
+    ).properties(title=f"Density Plot of {col}")
+
+
+def build_bar(df: pd.DataFrame, col: str, aggregate: bool = False,
+              data: Optional[ChartData] = None, top_k: Optional[int] = None) -> alt.Chart:
+    """
+    Bar chart of category counts.
+
+    With ``top_k``, a column with more distinct values shows its ``top_k``
+    most frequent ones and one "Other" bar, always from counts.
+    """
+    table = value_counts_table(df[col], top_k) if aggregate or top_k is not None else None
+    if aggregate or (table is not None and len(table) > top_k):
+        return alt.Chart(table).mark_bar().encode(
+            x=alt.X('value:N', title=col),
+            y=alt.Y('count:Q', title='Count')
+        ).properties(title=f"Bar Chart of {col}")
+    data = df if data is None else data
+    return alt.Chart(data).mark_bar().encode(
+        x=alt.X(_field(df, col, data), title=col),
+        y=alt.Y('count()', title='Count')
+    ).properties(title=f"Bar Chart of {col}")
+
+
+def build_scatter(df: pd.DataFrame, col1: str, col2: str, aggregate: bool = False,
+                  data: Optional[ChartData] = None) -> alt.Chart:
+    """Scatter plot of two numeric columns."""
+    if aggregate:
+        # A 2D histogram stands in for the point cloud
+        return alt.Chart(binned_scatter_table(df, col1, col2)).mark_rect().encode(
+            x=alt.X('x_start:Q', bin='binned', title=col1),
+            x2='x_end:Q',
+            y=alt.Y('y_start:Q', bin='binned', title=col2),
+            y2='y_end:Q',
+            color=alt.Color('count:Q', title='Count'),
+            tooltip=[alt.Tooltip('count:Q', title='Count')]
+        ).properties(title=f"Scatter Plot: {col1} vs {col2}")
+    data = df if data is None else data
+    return alt.Chart(data).mark_circle(size=60).encode(
+        x=alt.X(_field(df, col1, data), title=col1),
+        y=alt.Y(_field(df, col2, data), title=col2),
+        tooltip=[_field(df, col1, data), _field(df, col2, data)]
+    ).properties(title=f"Scatter Plot: {col1} vs {col2}")
+
+
+def build_correlation(df: pd.DataFrame, numeric_cols: List[str], max_columns: Optional[int] = None) -> alt.Chart:
+    """
+    Heatmap of pairwise correlations between numeric columns.
+
+    With more than ``max_columns`` columns, only the ``max_columns`` most
+    strongly correlated ones are drawn, ordered so that correlated columns
+    sit together.
+    """
+    if max_columns is None or len(numeric_cols) <= max_columns:
+        corr_matrix = correlation_matrix(df, numeric_cols).stack().reset_index()
+        corr_matrix.columns = ['Variable 1', 'Variable 2', 'Correlation']
+        return alt.Chart(corr_matrix).mark_rect().encode(
+            x=alt.X('Variable 1:N'),
+            y=alt.Y('Variable 2:N'),
+            color=alt.Color('Correlation:Q', scale=alt.Scale(scheme='viridis'))
+        ).properties(title='Correlation Heatmap')
+    reduced = reduced_correlation(df, max_columns, numeric_cols)
+    order = list(map(str, reduced.columns))
+    corr_matrix = reduced.stack().reset_index()
+    corr_matrix.columns = ['Variable 1', 'Variable 2', 'Correlation']
+    return alt.Chart(corr_matrix).mark_rect().encode(
+        x=alt.X('Variable 1:N', sort=order),
+        y=alt.Y('Variable 2:N', sort=order),
+        color=alt.Color('Correlation:Q', scale=alt.Scale(scheme='viridis'))
+    ).properties(title=f'Correlation Heatmap ({len(order)} of {len(numeric_cols)} columns)')
+
+
+def build_box(df: pd.DataFrame, numeric_col: str, categorical_col: str, aggregate: bool = False,
+              data: Optional[ChartData] = None) -> alt.Chart:
+    """Box plot of a numeric column per category."""
+    if aggregate:
+        # Draw the box plot from precomputed statistics; outlier points are omitted
+        base = alt.Chart(box_table(df, numeric_col, categorical_col)).encode(
+            x=alt.X('group:N', title=categorical_col)
+        )
+        whiskers = base.mark_rule().encode(
+            y=alt.Y('lower:Q', title=numeric_col),
+            y2='upper:Q'
+        )
+        boxes = base.mark_bar(size=14).encode(y='q1:Q', y2='q3:Q')
+        medians = base.mark_tick(color='white', size=14).encode(y='median:Q')
+        return alt.layer(whiskers, boxes, medians).properties(
+            title=f"Box Plot of {numeric_col} by {categorical_col}"
+        )
+    data = df if data is None else data
+    return alt.Chart(data).mark_boxplot().encode(
+        x=alt.X(_field(df, categorical_col, data), title=categorical_col),
+        y=alt.Y(_field(df, numeric_col, data), title=numeric_col)
+    ).properties(title=f"Box Plot of {numeric_col} by {categorical_col}")
+
+
+def build_stacked_bar(df: pd.DataFrame, col1: str, col2: str, aggregate: bool = False,
+                      data: Optional[ChartData] = None, top_k: Optional[int] = None) -> alt.Chart:
+    """
+    Stacked bar chart of two categorical columns.
+
+    With ``top_k``, values outside either column's ``top_k`` most frequent
+    are lumped into "Other", and the chart is drawn from counts.
+    """
+    lumped = {}
+    if top_k is not None:
+        for col in (col1, col2):
+            series = lump_other(df[col], top_k)
+            if series is not None:
+                lumped[col] = series
+    if aggregate or lumped:
+        frame = df
+        if lumped:
+            frame = df[[col1, col2]].copy()
+            for col, series in lumped.items():
+                frame[col] = series
+        return alt.Chart(crosstab_table(frame, col1, col2)).mark_bar().encode(
+            x=alt.X('x:N', title=col1),
+            y=alt.Y('count:Q', title='Count'),
+            color=alt.Color('color:N', title=col2)
+        ).properties(title=f"Stacked Bar Chart of {col1} vs {col2}")
+    data = df if data is None else data
+    return alt.Chart(data).mark_bar().encode(
+        x=alt.X(_field(df, col1, data), title=col1),
+        y=alt.Y('count()', title='Count'),
+        color=alt.Color(_field(df, col2, data), title=col2)
+    ).properties(title=f"Stacked Bar Chart of {col1} vs {col2}")
+
+
+def write_shared_dataset(df: pd.DataFrame, columns: List[str], path: str, data_format: str) -> alt.UrlData:
+    """
+    Write ``columns`` of ``df`` once to ``path`` and return Altair data referencing it.
+
+    The URL is the file name alone, so it resolves next to HTML files saved
+    in the same directory.
+    """
+    import os
+
+    data = df[columns]
+    if data_format == 'json':
+        data.to_json(path, orient='records')
+        data_format_spec = alt.JsonDataFormat(type='json')
+    elif data_format == 'csv':
+        data.to_csv(path, index=False)
+        # CSV values are strings unless numeric fields are parsed explicitly
+        parse = {col: 'number' for col in columns if is_real_numeric(df[col].dtype)}
+        data_format_spec = alt.CsvDataFormat(type='csv', parse=parse)
+    else:
+        raise ValueError("shared_data must be 'json' or 'csv'.")
+    return alt.UrlData(url=os.path.basename(path), format=data_format_spec)
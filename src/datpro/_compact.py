@@ -0,0 +1,142 @@
+"""Lossless dtype compaction of DataFrames before profiling."""
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+from datpro._numeric import is_real_numeric
+
+_INTEGER_TYPES = [np.int8, np.uint8, np.int16, np.uint16, np.int32, np.uint32]
+
+
+def _arrow_strings():
+    """The Arrow-backed string dtype, or None without pyarrow."""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return None
+    return pd.StringDtype('pyarrow')
+
+
+def _compact_integers(series: pd.Series) -> pd.Series:
+    values = series.to_numpy()
+    if values.size == 0:
+        return series
+    lo, hi = values.min(), values.max()
+    for dtype in _INTEGER_TYPES:
+        info = np.iinfo(dtype)
+        if info.min <= lo and hi <= info.max:
+            return series.astype(dtype) if np.dtype(dtype).itemsize < values.itemsize else series
+    return series
+
+
+def _compact_floats(series: pd.Series) -> pd.Series:
+    values = series.to_numpy()
+    if values.dtype != np.float64:
+        return series
+    with np.errstate(over='ignore'):
+        narrow = values.astype(np.float32)
+    if np.array_equal(narrow.astype(np.float64), values, equal_nan=True):
+        return pd.Series(narrow, index=series.index, name=series.name)
+    return series
+
+
+def _compact_objects(series: pd.Series, max_category_ratio: float, strings) -> pd.Series:
+    try:
+        distinct = series.nunique(dropna=True)
+    except TypeError:
+        # Unhashable values such as lists stay as they are
+        return series
+    if distinct <= max_category_ratio * len(series):
+        return series.astype('category')
+    if strings is not None and pd.api.types.infer_dtype(series, skipna=True) == 'string':
+        return series.astype(strings)
+    return series
+
+
+def compact_dataframe(df: pd.DataFrame, max_category_ratio: float = 0.5,
+                      arrow_strings: bool = True) -> pd.DataFrame:
+    """
+    Return a copy of ``df`` in the smallest dtypes that hold exactly the same values.
+
+    Integer columns are downcast to the narrowest integer type covering their
+    range, float64 columns become float32 when every value survives the round
+    trip, object columns with few distinct values become categoricals, and
+    other all-string object columns become Arrow-backed strings. Missing
+    values, outliers and duplicate rows are the same in the result, which
+    usually takes a fraction of the memory.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        The DataFrame to compact. It is not modified.
+    max_category_ratio : float, optional
+        Object columns with at most this many distinct values per row become
+        categoricals. Default is 0.5.
+    arrow_strings : bool, optional
+        Store the remaining string columns as ``string[pyarrow]``, if pyarrow
+        is installed. Default is True.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The compacted DataFrame. ``attrs['compaction']`` holds
+        ``bytes_before``, ``bytes_after``, ``saved_percentage`` and
+        ``converted``, a dict from each changed column to its old and new dtype.
+
+    Raises
+    ------
+    TypeError
+        If the input is not a pandas DataFrame.
+    ValueError
+        If ``max_category_ratio`` is not between 0 and 1.
+
+    Example
+    -------
+    >>> df = pd.DataFrame({'id': range(1000), 'team': ['a', 'b'] * 500})
+    >>> compact_dataframe(df).dtypes
+    id         int16
+    team    category
+    dtype: object
+    """
+    if not isinstance(df, pd.DataFrame):
+        raise TypeError("Input must be a pandas DataFrame.")
+    if not 0 <= max_category_ratio <= 1:
+        raise ValueError("max_category_ratio must be between 0 and 1.")
+    strings = _arrow_strings() if arrow_strings else None
+
+    columns = {}
+    converted: Dict[str, tuple] = {}
+    bytes_before = bytes_after = 0
+    for i in range(df.shape[1]):
+        series = df.iloc[:, i]
+        dtype = series.dtype
+        if pd.api.types.is_integer_dtype(dtype) and isinstance(dtype, np.dtype):
+            compact = _compact_integers(series)
+        elif is_real_numeric(dtype) and isinstance(dtype, np.dtype):
+            compact = _compact_floats(series)
+        elif dtype == object:
+            compact = _compact_objects(series, max_category_ratio, strings)
+        else:
+            compact = series
+        before = int(series.memory_usage(index=False, deep=True))
+        after = before if compact is series else int(compact.memory_usage(index=False, deep=True))
+        if after >= before:
+            compact = series
+            after = before
+        else:
+            converted[str(df.columns[i])] = (str(dtype), str(compact.dtype))
+        columns[i] = compact
+        bytes_before += before
+        bytes_after += after
+
+    result = pd.concat(columns, axis=1) if columns else df.copy()
+    result.columns = df.columns
+    result.index = df.index
+    result.attrs['compaction'] = {
+        "bytes_before": bytes_before,
+        "bytes_after": bytes_after,
+        "saved_percentage": round(100 * (1 - bytes_after / bytes_before), 2) if bytes_before else 0.0,
+        "converted": converted
+    }
+    return result
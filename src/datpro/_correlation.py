@@ -0,0 +1,397 @@
+"""Blocked, NaN-aware Pearson correlation for wide numeric tables."""
+from concurrent.futures import Executor
+from itertools import combinations_with_replacement
+from typing import List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from datpro._numeric import is_real_numeric
+from datpro._parallel import map_blocks
+
+# Columns per block; a pair of blocks yields one BLOCK_COLUMNS x BLOCK_COLUMNS tile of the matrix
+BLOCK_COLUMNS = 256
+
+_PAIR_LABELS = ['Variable 1', 'Variable 2', 'Correlation']
+
+# A column whose spread is below this fraction of its largest magnitude is taken as
+# constant: centering it leaves only rounding residue, whose "correlations" are noise
+_CONSTANT_TOLERANCE = 64 * np.finfo(np.float64).eps
+
+
+def _column_values(df: pd.DataFrame, col, dtype) -> np.ndarray:
+    series = df[col] if col in df.columns else pd.Series(np.nan, index=df.index)
+    if not is_real_numeric(series.dtype):
+        series = pd.to_numeric(series, errors='coerce')
+    return series.to_numpy(dtype=dtype, na_value=np.nan)
+
+
+def _moments(a_values: np.ndarray, a_mask: np.ndarray, b_values: np.ndarray, b_mask: np.ndarray) -> tuple:
+    """
+    Pairwise-complete sums between the columns of two blocks, as matrix products.
+
+    Values are zero where missing and masks are 1.0 where valid, so every
+    sum only runs over rows where both columns of a pair are present.
+    Returns ``(n, sx, sy, sxx, syy, sxy)``.
+    """
+    n = a_mask.T @ b_mask
+    sx = a_values.T @ b_mask
+    sy = a_mask.T @ b_values
+    sxx = np.square(a_values).T @ b_mask
+    syy = a_mask.T @ np.square(b_values)
+    sxy = a_values.T @ b_values
+    return n, sx, sy, sxx, syy, sxy
+
+
+def _scale(values: np.ndarray) -> np.ndarray:
+    """Largest absolute value of each column, ignoring missing values; 0 for columns without any."""
+    return np.fmax.reduce(np.abs(values), axis=0, initial=0.0).astype(np.float64)
+
+
+def _correlation_from_moments(n, sx, sy, sxx, syy, sxy, min_periods: int,
+                              x_scale: np.ndarray, y_scale: np.ndarray) -> np.ndarray:
+    """
+    Correlations from pairwise sums; NaN where either column is constant over the shared rows.
+
+    ``x_scale`` and ``y_scale`` are the largest magnitudes of the first and
+    second columns of each pair, before centering (see ``_scale``).
+    """
+    n, sx, sy, sxx, syy, sxy = (np.asarray(m, dtype=np.float64) for m in (n, sx, sy, sxx, syy, sxy))
+    # n ** 2 times the variance of each column over the rows shared with the other
+    x_spread = n * sxx - sx * sx
+    y_spread = n * syy - sy * sy
+    with np.errstate(divide='ignore', invalid='ignore'):
+        corr = (n * sxy - sx * sy) / np.sqrt(x_spread * y_spread)
+    corr[n < max(min_periods, 2)] = np.nan
+    corr[x_spread <= np.square(_CONSTANT_TOLERANCE * n * np.asarray(x_scale)[:, None])] = np.nan
+    corr[y_spread <= np.square(_CONSTANT_TOLERANCE * n * np.asarray(y_scale)[None, :])] = np.nan
+    return np.clip(corr, -1.0, 1.0)
+
+
+def _valid_means(values: np.ndarray, valid: np.ndarray) -> np.ndarray:
+    """Column means over valid entries, in float64; 0 for columns without any."""
+    with np.errstate(invalid='ignore'):
+        means = values.sum(axis=0, where=valid, dtype=np.float64) / valid.sum(axis=0)
+    return np.nan_to_num(means)
+
+
+class _Block:
+    """
+    Centered copy of a group of columns, ready for the tile products.
+
+    Centering on the column mean keeps the sums small, so float32 products
+    lose little precision. Blocks without missing values also keep their
+    column norms, and tiles between two such blocks need a single product.
+    ``scale`` holds each column's largest magnitude before centering, to
+    tell constant columns from varying ones.
+    """
+
+    def __init__(self, df: pd.DataFrame, columns: Sequence, dtype):
+        values = np.empty((len(df), len(columns)), dtype=dtype, order='F')
+        for i, col in enumerate(columns):
+            values[:, i] = _column_values(df, col, dtype)
+        valid = ~np.isnan(values)
+        self.complete = bool(valid.all())
+        self.scale = _scale(values)
+        values -= _valid_means(values, valid)
+        if self.complete:
+            self.mask = None
+            self.norms = np.sqrt(np.einsum('ij,ij->j', values, values, dtype=np.float64))
+        else:
+            values[~valid] = 0
+            self.mask = valid.astype(dtype)
+        self.columns = list(columns)
+        self.values = values
+
+    def ones(self) -> np.ndarray:
+        return self.mask if self.mask is not None else np.ones_like(self.values)
+
+
+def _tile(a: _Block, b: _Block, min_periods: int) -> np.ndarray:
+    """Correlations between the columns of two blocks."""
+    if a.complete and b.complete:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            corr = (a.values.T @ b.values).astype(np.float64) / np.outer(a.norms, b.norms)
+        if len(a.values) < max(min_periods, 2):
+            corr[:] = np.nan
+        limit = _CONSTANT_TOLERANCE * np.sqrt(len(a.values))
+        corr[a.norms <= limit * a.scale, :] = np.nan
+        corr[:, b.norms <= limit * b.scale] = np.nan
+        return np.clip(corr, -1.0, 1.0)
+    moments = _moments(a.values, a.ones(), b.values, b.ones())
+    return _correlation_from_moments(*moments, min_periods=min_periods, x_scale=a.scale, y_scale=b.scale)
+
+
+def _scan(df: pd.DataFrame, columns: Sequence, reduce, dtype, min_periods: int, block_size: int,
+          n_jobs: Optional[int], executor: Optional[Executor]) -> List:
+    """
+    Apply ``reduce(i, j, tile)`` to every tile of the upper triangle of the correlation matrix.
+
+    ``i`` and ``j`` are the positions of the tile's first row and column.
+    Only one tile per worker exists at a time; the full matrix is never built.
+    """
+    starts = list(range(0, len(columns), block_size))
+    blocks = [_Block(df, columns[start:start + block_size], dtype) for start in starts]
+    pairs = list(combinations_with_replacement(range(len(blocks)), 2))
+
+    def run(pair):
+        a, b = pair
+        return reduce(starts[a], starts[b], _tile(blocks[a], blocks[b], min_periods))
+
+    return map_blocks(run, pairs, n_jobs, executor)
+
+
+def _numeric_columns(df: pd.DataFrame, columns: Optional[Sequence]) -> List:
+    if columns is None:
+        return [col for col in df.columns if is_real_numeric(df[col].dtype)]
+    return list(columns)
+
+
+def _upper_pairs(corr: np.ndarray, i: int, j: int, k: int) -> tuple:
+    """Positions and values of the ``k`` strongest correlations of a tile above the diagonal."""
+    rows, cols = np.indices(corr.shape)
+    rows, cols = rows.ravel() + i, cols.ravel() + j
+    values = corr.ravel()
+    keep = (rows < cols) & ~np.isnan(values)
+    rows, cols, values = rows[keep], cols[keep], values[keep]
+    if len(values) > k:
+        top = np.argpartition(-np.abs(values), k - 1)[:k]
+        rows, cols, values = rows[top], cols[top], values[top]
+    return rows, cols, values
+
+
+def _pair_table(columns: Sequence, rows, cols, values, k: int) -> pd.DataFrame:
+    # Strongest first; ties in order of position so results are deterministic
+    order = np.lexsort((cols, rows, -np.abs(values)))[:k]
+    return pd.DataFrame({
+        'Variable 1': [columns[r] for r in rows[order]],
+        'Variable 2': [columns[c] for c in cols[order]],
+        'Correlation': values[order],
+    }, columns=_PAIR_LABELS)
+
+
+def correlation_matrix(df: pd.DataFrame, columns: Optional[Sequence] = None, dtype=np.float64,
+                       min_periods: int = 1, block_size: int = BLOCK_COLUMNS,
+                       n_jobs: Optional[int] = None, executor: Optional[Executor] = None) -> pd.DataFrame:
+    """Pairwise Pearson correlation matrix, computed tile by tile; ``DataFrame.corr`` semantics."""
+    columns = _numeric_columns(df, columns)
+    matrix = np.empty((len(columns), len(columns)), dtype=np.float64)
+
+    def place(i, j, tile):
+        matrix[i:i + tile.shape[0], j:j + tile.shape[1]] = tile
+        matrix[j:j + tile.shape[1], i:i + tile.shape[0]] = tile.T
+
+    _scan(df, columns, place, dtype, min_periods, block_size, n_jobs, executor)
+    return pd.DataFrame(matrix, index=columns, columns=columns)
+
+
+def top_correlations(df: pd.DataFrame, k: int = 20, columns: Optional[List] = None,
+                     dtype=np.float32, min_periods: int = 1, block_size: int = BLOCK_COLUMNS,
+                     n_jobs: Optional[int] = None, executor: Optional[Executor] = None) -> pd.DataFrame:
+    """
+    Find the most strongly correlated pairs of numeric columns without building the full matrix.
+
+    The correlation matrix is computed in tiles of ``block_size`` x
+    ``block_size`` columns, each a few matrix products over a centered copy
+    of the data, and only the ``k`` strongest pairs of each tile are kept.
+    Missing values are handled pairwise, as in ``DataFrame.corr``: each pair
+    uses the rows where both columns are present.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        The DataFrame to analyze.
+    k : int, optional
+        Number of pairs to return. Default is 20.
+    columns : list, optional
+        Columns to correlate. Default is None (all numeric columns).
+    dtype : numpy dtype, optional
+        Precision of the products. float32 halves memory and roughly doubles
+        speed, with correlations accurate to about 1e-6. Default is float32.
+    min_periods : int, optional
+        Minimum number of rows both columns must share for a pair to be
+        considered. Default is 1.
+    block_size : int, optional
+        Number of columns per block. Default is 256.
+    n_jobs : int, optional
+        Number of threads computing tiles. None (the default) runs serially;
+        -1 uses all CPUs.
+    executor : concurrent.futures.Executor, optional
+        An existing executor to run tiles on instead of a temporary thread pool.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Columns 'Variable 1', 'Variable 2' and 'Correlation', one row per
+        pair, strongest absolute correlation first.
+
+    Raises
+    ------
+    TypeError
+        If the input is not a pandas DataFrame.
+
+    Example
+    -------
+    >>> top_correlations(wide_df, k=5)
+    """
+    if not isinstance(df, pd.DataFrame):
+        raise TypeError("Input must be a pandas DataFrame.")
+    if k < 1:
+        raise ValueError("k must be a positive integer.")
+    columns = _numeric_columns(df, columns)
+    if len(columns) < 2:
+        return pd.DataFrame(columns=_PAIR_LABELS)
+    found = _scan(df, columns, lambda i, j, tile: _upper_pairs(tile, i, j, k),
+                  dtype, min_periods, block_size, n_jobs, executor)
+    rows, cols, values = (np.concatenate(parts) for parts in zip(*found))
+    return _pair_table(columns, rows, cols, values, k)
+
+
+def _seriate(strength: np.ndarray) -> List[int]:
+    """
+    Order columns so strongly correlated ones sit next to each other.
+
+    Starts from the column with the strongest total correlation and
+    repeatedly appends the unplaced column most correlated with the last one.
+    """
+    strength = np.nan_to_num(strength, nan=0.0)
+    np.fill_diagonal(strength, 0.0)
+    order = [int(np.argmax(strength.sum(axis=1)))]
+    remaining = set(range(len(strength))) - set(order)
+    while remaining:
+        candidates = sorted(remaining)
+        nearest = candidates[int(np.argmax(strength[order[-1], candidates]))]
+        order.append(nearest)
+        remaining.remove(nearest)
+    return order
+
+
+def reduced_correlation(df: pd.DataFrame, max_columns: int, columns: Optional[Sequence] = None,
+                        dtype=np.float32, min_periods: int = 1, block_size: int = BLOCK_COLUMNS,
+                        n_jobs: Optional[int] = None, executor: Optional[Executor] = None) -> pd.DataFrame:
+    """
+    Correlation matrix of the ``max_columns`` columns most correlated with any other, clustered.
+
+    Each column is scored by its strongest absolute correlation, in one
+    tiled pass; the chosen columns' small matrix is then recomputed in
+    float64 and ordered with ``_seriate``.
+    """
+    columns = _numeric_columns(df, columns)
+    if len(columns) > max_columns:
+        score = np.full(len(columns), -np.inf)
+
+        def strongest(i, j, tile):
+            strength = np.nan_to_num(np.abs(tile), nan=-np.inf)
+            if i == j:
+                np.fill_diagonal(strength, -np.inf)
+            return i, j, strength.max(axis=1), strength.max(axis=0)
+
+        for i, j, row_max, col_max in _scan(df, columns, strongest, dtype, min_periods, block_size,
+                                            n_jobs, executor):
+            score[i:i + len(row_max)] = np.maximum(score[i:i + len(row_max)], row_max)
+            score[j:j + len(col_max)] = np.maximum(score[j:j + len(col_max)], col_max)
+        # Stable sort keeps the original column order among equal scores
+        chosen = np.sort(np.argsort(-score, kind='stable')[:max_columns])
+        columns = [columns[c] for c in chosen]
+    matrix = correlation_matrix(df, columns, min_periods=min_periods, block_size=block_size,
+                                n_jobs=n_jobs, executor=executor)
+    order = _seriate(np.abs(matrix.to_numpy()))
+    return matrix.iloc[order, order]
+
+
+class CorrelationState:
+    """
+    Correlation and covariance matrices accumulated over chunks of rows.
+
+    Each ``update`` adds the chunk's pairwise-complete sums (counts, sums,
+    sums of squares and cross products, all as matrix products) to running
+    totals, so a table is correlated in one pass without holding its rows.
+    Values are shifted by the first chunk's column means to keep the sums
+    well conditioned. The totals take four ``k x k`` float64 matrices for
+    ``k`` columns; use ``top_correlations`` on in-memory data when only the
+    strongest pairs of a very wide table are needed.
+
+    Parameters
+    ----------
+    columns : list, optional
+        Columns to correlate. Default is None (the numeric columns of the
+        first chunk). Columns absent from a chunk count as missing there.
+    dtype : numpy dtype, optional
+        Precision of the per-chunk products; totals are always float64.
+        Default is float64.
+    min_periods : int, optional
+        Minimum number of shared rows for a pair to get a correlation. Default is 1.
+
+    Example
+    -------
+    >>> state = CorrelationState()
+    >>> for chunk in pd.read_csv("big.csv", chunksize=100_000):
+    ...     state.update(chunk)
+    >>> state.top_pairs(10)
+    """
+
+    def __init__(self, columns: Optional[List] = None, dtype=np.float64, min_periods: int = 1):
+        self.columns = None if columns is None else list(columns)
+        self.dtype = dtype
+        self.min_periods = min_periods
+        self.total_rows = 0
+        self._shift = None
+        self._scale = None
+        self._sums = None
+
+    def __repr__(self) -> str:
+        return f"CorrelationState({self.total_rows} rows, {len(self.columns or [])} columns)"
+
+    def update(self, chunk: pd.DataFrame) -> "CorrelationState":
+        """Add a chunk of rows and return the state, so calls can be chained."""
+        if not isinstance(chunk, pd.DataFrame):
+            raise TypeError("Each chunk must be a pandas DataFrame.")
+        if self.columns is None:
+            self.columns = _numeric_columns(chunk, None)
+        k = len(self.columns)
+        values = np.empty((len(chunk), k), dtype=np.float64, order='F')
+        for i, col in enumerate(self.columns):
+            values[:, i] = _column_values(chunk, col, np.float64)
+        valid = ~np.isnan(values)
+        if self._shift is None:
+            self._shift = _valid_means(values, valid)
+            self._scale = np.zeros(k)
+            self._sums = [np.zeros((k, k)) for _ in range(4)]
+        self._scale = np.fmax(self._scale, _scale(values))
+        values -= self._shift
+        values[~valid] = 0
+        values = values.astype(self.dtype, copy=False)
+        mask = valid.astype(self.dtype)
+        n, sx, _, sxx, _, sxy = _moments(values, mask, values, mask)
+        for total, part in zip(self._sums, (n, sx, sxx, sxy)):
+            total += part
+        self.total_rows += len(chunk)
+        return self
+
+    def _frame(self, matrix: np.ndarray) -> pd.DataFrame:
+        return pd.DataFrame(matrix, index=self.columns, columns=self.columns)
+
+    def correlation(self) -> pd.DataFrame:
+        """The pairwise Pearson correlation matrix of the rows seen so far."""
+        if self._sums is None:
+            raise ValueError("No data has been added.")
+        n, sx, sxx, sxy = self._sums
+        # By symmetry, the sums of the second column of each pair are the transposes
+        return self._frame(_correlation_from_moments(n, sx, sx.T, sxx, sxx.T, sxy, self.min_periods,
+                                                     self._scale, self._scale))
+
+    def covariance(self) -> pd.DataFrame:
+        """The pairwise sample covariance matrix (``ddof=1``) of the rows seen so far."""
+        if self._sums is None:
+            raise ValueError("No data has been added.")
+        n, sx, _, sxy = self._sums
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cov = (sxy - sx * sx.T / n) / (n - 1)
+        cov[n < max(self.min_periods, 2)] = np.nan
+        return self._frame(cov)
+
+    def top_pairs(self, k: int = 20) -> pd.DataFrame:
+        """The ``k`` most strongly correlated pairs, in the format of ``top_correlations``."""
+        corr = self.correlation().to_numpy()
+        rows, cols, values = _upper_pairs(corr, 0, 0, k)
+        return _pair_table(self.columns, rows, cols, values, k)
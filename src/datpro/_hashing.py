@@ -0,0 +1,106 @@
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+from datpro._numeric import is_real_numeric
+
+# Integers beyond this magnitude are not all representable as float64
+_EXACT_FLOAT_LIMIT = 2 ** 53
+# Re-hashing integer hashes with this key keeps them apart from float hashes of the same bits
+_INTEGER_SALT = np.uint64(0x9E3779B97F4A7C15)
+
+
+def _stable_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Cast numeric columns to float64 so a value hashes alike in every chunk."""
+    casts = {col: np.float64 for col in df.columns if is_real_numeric(df[col].dtype)}
+    return df.astype(casts) if casts else df
+
+
+def _large_integers(series: pd.Series) -> Optional[tuple]:
+    """
+    Positions and values of the integers in ``series`` that float64 cannot hold exactly.
+
+    Returns ``(mask, values)`` with the values as int64 (uint64 for unsigned
+    64-bit columns), or None if every value survives the cast to float64.
+    Integral floats beyond 2**53 count too, so that a column parsed as float
+    in one chunk and as int in another hashes alike.
+    """
+    dtype = series.dtype
+    if not is_real_numeric(dtype):
+        return None
+    if pd.api.types.is_integer_dtype(dtype):
+        # Nullable integer dtypes name their NumPy counterpart
+        unsigned = np.dtype(getattr(dtype, 'numpy_dtype', dtype)) == np.uint64
+        values = series.to_numpy(dtype=np.uint64 if unsigned else np.int64, na_value=0)
+        if len(values) == 0 or (values.max() <= _EXACT_FLOAT_LIMIT and (unsigned or values.min() >= -_EXACT_FLOAT_LIMIT)):
+            return None
+        mask = values > _EXACT_FLOAT_LIMIT
+        if not unsigned:
+            mask |= values < -_EXACT_FLOAT_LIMIT
+    else:
+        floats = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        # Two reductions rule out most columns without building temporary arrays
+        if len(floats) == 0:
+            return None
+        lo, hi = floats.min(), floats.max()
+        if np.isnan(lo):
+            # Missing values propagate through min/max; fmin/fmax skip them, more slowly
+            lo, hi = np.fmin.reduce(floats), np.fmax.reduce(floats)
+        # An all-NaN column compares False and is ruled out
+        if not max(-lo, hi) > _EXACT_FLOAT_LIMIT:
+            return None
+        with np.errstate(invalid='ignore'):
+            magnitude = np.abs(floats)
+            mask = (magnitude > _EXACT_FLOAT_LIMIT) & (magnitude < 2.0 ** 63) & (floats == np.floor(floats))
+        if not mask.any():
+            return None
+        values = np.zeros(len(floats), dtype=np.int64)
+        values[mask] = floats[mask].astype(np.int64)
+    return (mask, values) if mask.any() else None
+
+
+def _column_hash(series: pd.Series, large: Optional[tuple]) -> np.ndarray:
+    """Hashes of one column's values: numbers as float64, except the integers in ``large``."""
+    if is_real_numeric(series.dtype):
+        series = series.astype(np.float64)
+    hashed = pd.util.hash_pandas_object(series, index=False).to_numpy()
+    if large is not None:
+        mask, values = large
+        exact = pd.util.hash_array(values[mask])
+        hashed[mask] = pd.util.hash_array(exact ^ _INTEGER_SALT)
+    return hashed
+
+
+def _combine(hashes: List[np.ndarray]) -> np.ndarray:
+    """Combine column hashes into row hashes exactly as ``pandas.util.hash_pandas_object`` does."""
+    multiplier = np.uint64(1000003)
+    out = np.zeros_like(hashes[0]) + np.uint64(0x345678)
+    for i, hashed in enumerate(hashes):
+        inverse = len(hashes) - i
+        out ^= hashed
+        out *= multiplier
+        multiplier += np.uint64(82520 + inverse + inverse)
+    out += np.uint64(97531)
+    return out
+
+
+def row_hashes(df: pd.DataFrame) -> np.ndarray:
+    """
+    Return one 64-bit fingerprint per row, ignoring the index.
+
+    Integer and float columns are hashed as float64, so the same row hashes
+    identically whether a CSV chunk parsed a column as int or (because of a
+    missing value) as float. Integers beyond 2**53, which float64 would
+    round together, are hashed exactly as integers instead.
+    """
+    large = [_large_integers(df.iloc[:, i]) for i in range(df.shape[1])]
+    if all(entry is None for entry in large):
+        return pd.util.hash_pandas_object(_stable_frame(df), index=False).to_numpy()
+    with np.errstate(over='ignore'):
+        return _combine([_column_hash(df.iloc[:, i], large[i]) for i in range(df.shape[1])])
+
+
+def column_hashes(series: pd.Series) -> np.ndarray:
+    """Return one 64-bit fingerprint per value of ``series``, hashed like ``row_hashes``."""
+    return _column_hash(series, _large_integers(series))
@@ -0,0 +1,168 @@
+import os
+import pandas as pd
+from typing import Iterable, Iterator, List, Optional, Union
+
+ChunkSource = Union[pd.DataFrame, str, os.PathLike, Iterable[pd.DataFrame]]
+
+DEFAULT_CHUNKSIZE = 100_000
+
+_CSV_SUFFIXES = ('.csv', '.csv.gz', '.csv.bz2', '.csv.zip', '.csv.xz', '.txt')
+_PARQUET_SUFFIXES = ('.parquet', '.pq')
+
+
+def file_format(path) -> Optional[str]:
+    """The format of a data file from its extension: 'csv', 'parquet', or None if unsupported."""
+    lower = os.fspath(path).lower()
+    if lower.endswith(_CSV_SUFFIXES):
+        return 'csv'
+    if lower.endswith(_PARQUET_SUFFIXES):
+        return 'parquet'
+    return None
+
+
+def _import_parquet():
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Reading Parquet files requires pyarrow: pip install 'datpro[arrow]'") from e
+    return pq
+
+
+def _read_parquet_chunks(path, chunksize: int, columns=None) -> Iterator[pd.DataFrame]:
+    parquet_file = _import_parquet().ParquetFile(path, memory_map=True)
+    if columns is not None:
+        # Columns a file lacks are left out of its chunks and count as missing
+        present = set(parquet_file.schema_arrow.names)
+        columns = [col for col in columns if col in present]
+    for batch in parquet_file.iter_batches(batch_size=chunksize, columns=columns):
+        yield batch.to_pandas()
+
+
+class ParquetSource:
+    """
+    A Parquet file, a directory of Parquet files (e.g. a partitioned lake) or a list of files.
+
+    Iterating yields DataFrame chunks of the selected ``columns``, read
+    batch by batch through memory-mapped I/O, so a source can be passed
+    wherever a chunk iterable is accepted and re-read for multi-pass work.
+    Footer metadata (row counts, schema and row-group statistics) is
+    available without touching the data pages.
+
+    Parameters
+    ----------
+    path : str, os.PathLike or list of them
+        A Parquet file, a directory searched recursively for ``.parquet``/
+        ``.pq`` files (hidden and ``_``-prefixed entries skipped), or a list
+        of files.
+    columns : list, optional
+        Columns to read. Default is None (all columns).
+    chunksize : int, optional
+        Number of rows per chunk. Default is 100,000.
+    """
+
+    def __init__(self, path, columns: Optional[List] = None, chunksize: Optional[int] = None):
+        if isinstance(path, (str, os.PathLike)):
+            path = os.fspath(path)
+            self.files = _parquet_files(path) if os.path.isdir(path) else [path]
+        else:
+            self.files = [os.fspath(file) for file in path]
+        self.columns = None if columns is None else list(columns)
+        self.chunksize = chunksize or DEFAULT_CHUNKSIZE
+
+    def __iter__(self) -> Iterator[pd.DataFrame]:
+        for file in self.files:
+            yield from _read_parquet_chunks(file, self.chunksize, self.columns)
+
+    def project(self, columns: List) -> "ParquetSource":
+        """The same files, reading only ``columns``."""
+        return ParquetSource(self.files, columns, self.chunksize)
+
+    def metadata(self) -> list:
+        """Footer metadata of every file."""
+        pq = _import_parquet()
+        return [pq.read_metadata(file, memory_map=True) for file in self.files]
+
+    @property
+    def schema(self):
+        """Arrow schema of the first file, narrowed to the selected columns."""
+        if not self.files:
+            raise ValueError("No Parquet files found.")
+        schema = _import_parquet().read_schema(self.files[0], memory_map=True)
+        if self.columns is not None:
+            import pyarrow as pa
+
+            schema = pa.schema([schema.field(col) for col in self.columns if col in schema.names])
+        return schema
+
+
+def _parquet_files(directory: str) -> List[str]:
+    files = []
+    for root, dirs, names in os.walk(directory):
+        dirs[:] = sorted(d for d in dirs if not d.startswith(('.', '_')))
+        files.extend(
+            os.path.join(root, name) for name in sorted(names)
+            if not name.startswith(('.', '_')) and name.lower().endswith(_PARQUET_SUFFIXES)
+        )
+    return files
+
+
+def is_reiterable(source: ChunkSource) -> bool:
+    """Return True if ``source`` can be read more than once."""
+    if isinstance(source, (pd.DataFrame, str, os.PathLike)):
+        return True
+    try:
+        return iter(source) is not source
+    except TypeError:
+        return False
+
+
+def iter_chunks(source: ChunkSource, chunksize: Optional[int] = None,
+                columns: Optional[List] = None) -> Iterator[pd.DataFrame]:
+    """
+    Yield DataFrame chunks from a DataFrame, a CSV/Parquet path, a directory of
+    Parquet files, a ``ParquetSource`` or an iterable of DataFrames.
+
+    If ``columns`` is given, only those columns are read (or kept, for
+    in-memory chunks).
+
+    Raises
+    ------
+    TypeError
+        If the source, or any chunk it yields, is not a pandas DataFrame.
+    ValueError
+        If a path has an unsupported file extension.
+    """
+    if isinstance(source, ParquetSource):
+        yield from ParquetSource(source.files, source.columns if columns is None else columns,
+                                 chunksize or source.chunksize)
+        return
+
+    chunksize = chunksize or DEFAULT_CHUNKSIZE
+    if isinstance(source, pd.DataFrame):
+        if columns is not None:
+            source = source[columns]
+        for start in range(0, len(source), chunksize):
+            yield source.iloc[start:start + chunksize]
+        return
+
+    if isinstance(source, (str, os.PathLike)):
+        path = os.fspath(source)
+        if os.path.isdir(path):
+            yield from ParquetSource(path, columns, chunksize)
+        elif file_format(path) == 'csv':
+            with pd.read_csv(path, chunksize=chunksize, usecols=columns) as reader:
+                yield from reader
+        elif file_format(path) == 'parquet':
+            yield from _read_parquet_chunks(path, chunksize, columns)
+        else:
+            raise ValueError(f"Unsupported file type: {path}. Expected a CSV or Parquet file.")
+        return
+
+    try:
+        chunks = iter(source)
+    except TypeError:
+        raise TypeError("Input must be a pandas DataFrame, a file path or an iterable of DataFrames.") from None
+    for chunk in chunks:
+        if not isinstance(chunk, pd.DataFrame):
+            raise TypeError("Each chunk must be a pandas DataFrame.")
+        yield chunk if columns is None else chunk[[col for col in columns if col in chunk.columns]]
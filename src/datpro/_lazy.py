@@ -0,0 +1,50 @@
+from collections.abc import Mapping
+from typing import Callable, Dict, Iterator
+
+from datpro._parallel import checkpoint
+
+
+class LazyCharts(Mapping):
+    """
+    Read-only mapping of plot names to charts that are built on first access.
+
+    All names are known up front, so iteration, ``len`` and membership tests
+    are free; a chart is only constructed when its value is requested, and is
+    then cached. ``materialize()`` builds everything and returns a plain dict.
+
+    Parameters
+    ----------
+    builders : dict
+        Maps each plot name to a zero-argument callable that builds the chart.
+    """
+
+    def __init__(self, builders: Dict[str, Callable]):
+        self._builders = builders
+        self._charts = {}
+
+    def __getitem__(self, name: str):
+        if name not in self._charts:
+            self._charts[name] = self._builders[name]()
+        return self._charts[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._builders)
+
+    def __len__(self) -> int:
+        return len(self._builders)
+
+    def __repr__(self) -> str:
+        return f"LazyCharts({len(self._builders)} charts, {len(self._charts)} built)"
+
+    @property
+    def built(self) -> int:
+        """Number of charts constructed so far."""
+        return len(self._charts)
+
+    def materialize(self) -> Dict:
+        """Build every chart and return them as a dict, in plot order."""
+        charts = {}
+        for name in self._builders:
+            checkpoint()
+            charts[name] = self[name]
+        return charts
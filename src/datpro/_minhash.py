@@ -0,0 +1,287 @@
+"""Near-duplicate rows with MinHash signatures and locality-sensitive hashing."""
+from functools import reduce
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+# Characters of each row's normalized text that are compared
+MAX_TEXT_CHARS = 1024
+# Rows normalized at a time, and shingle cells hashed at a time
+_BLOCK_ROWS = 1 << 16
+_BLOCK_CELLS = 1 << 21
+# Joins a row's values; unlike the ASCII separators, Python does not count it as whitespace
+_SEPARATOR = '\x02'
+# Buckets up to this size compare all their pairs; larger ones chain their members
+_MAX_BUCKET = 32
+
+
+def lsh_bands(num_perm: int, similarity: float) -> tuple:
+    """
+    Split ``num_perm`` signature values into ``(bands, rows)`` for a similarity threshold.
+
+    Two rows with Jaccard similarity ``s`` share at least one band with
+    probability ``1 - (1 - s**rows)**bands``. The split with the fewest bands
+    that still pairs rows at ``similarity`` 99% of the time is chosen, as
+    candidates are verified afterwards but a missed pair cannot be recovered.
+    """
+    for bands in range(1, num_perm + 1):
+        if num_perm % bands == 0:
+            rows = num_perm // bands
+            if 1 - (1 - similarity ** rows) ** bands >= 0.99:
+                return bands, rows
+    return num_perm, 1
+
+
+def row_texts(df: pd.DataFrame) -> pd.Series:
+    """
+    Each row as one normalized string: values lowercased, whitespace trimmed and collapsed.
+
+    Missing values become empty strings, and values are joined with a
+    separator that does not occur in normal text.
+    """
+    fields = [df.iloc[:, i].astype(str).where(df.iloc[:, i].notna(), '') for i in range(df.shape[1])]
+    if not fields:
+        return pd.Series('', index=df.index)
+    # Normalizing the joined text takes one pass per row rather than one per value
+    text = reduce(lambda left, right: left + _SEPARATOR + right, fields).str.lower()
+    text = text.str.replace(r'\s+', ' ', regex=True)
+    return text.str.replace(' ' + _SEPARATOR, _SEPARATOR).str.replace(_SEPARATOR + ' ', _SEPARATOR).str.strip()
+
+
+def _mix(codes: np.ndarray) -> np.ndarray:
+    """Scramble uint32 codes with the MurmurHash3 finalizer, in place."""
+    codes ^= codes >> np.uint32(16)
+    codes *= np.uint32(0x85EBCA6B)
+    codes ^= codes >> np.uint32(13)
+    codes *= np.uint32(0xC2B2AE35)
+    codes ^= codes >> np.uint32(16)
+    return codes
+
+
+class MinHasher:
+    """
+    MinHash signatures of rows over their character 3-gram shingles.
+
+    Shingle codes are scrambled once, and each of ``num_perm`` hash
+    functions is then a multiply-add modulo ``2**32`` with an odd
+    multiplier, a permutation of the 32-bit values. A row's signature value
+    is the minimum over its shingles, and the fraction of equal values
+    between two signatures estimates the Jaccard similarity of their
+    shingle sets.
+    """
+
+    def __init__(self, num_perm: int = 64, seed: Optional[int] = None):
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self.multipliers = rng.integers(0, 1 << 32, size=num_perm, dtype=np.uint32) | np.uint32(1)
+        self.offsets = rng.integers(0, 1 << 32, size=num_perm, dtype=np.uint32)
+
+    def _shingles(self, texts: pd.Series) -> np.ndarray:
+        """Scrambled shingle codes, one row per text, padded with each row's first shingle."""
+        encoded = texts.str.encode('utf-8').to_numpy().astype(bytes)
+        width = max(encoded.dtype.itemsize, 3)
+        codes = np.zeros((len(encoded), width), dtype=np.uint32)
+        codes[:, :encoded.dtype.itemsize] = encoded.view(np.uint8).reshape(len(encoded), -1)
+        lengths = np.char.str_len(encoded)
+        shingles = (codes[:, :-2] << np.uint32(16)) | (codes[:, 1:-1] << np.uint32(8)) | codes[:, 2:]
+        # Positions past the end repeat a real shingle, which leaves each row's set unchanged
+        padding = np.arange(width - 2) >= np.maximum(lengths - 2, 1)[:, None]
+        return _mix(np.where(padding, shingles[:, :1], shingles))
+
+    def signatures(self, texts: pd.Series) -> np.ndarray:
+        """Signatures of ``texts``, one row of ``num_perm`` uint32 values per text."""
+        texts = texts.str.slice(0, MAX_TEXT_CHARS)
+        result = np.empty((len(texts), self.num_perm), dtype=np.uint32)
+        # Texts of similar length are hashed together, so little of each array is padding
+        lengths = texts.str.len().to_numpy()
+        order = np.argsort(lengths, kind='stable')
+        start = 0
+        while start < len(order):
+            # As many rows as fit at the width of the longest one (bytes can outnumber characters)
+            stop = min(len(order), start + max(1, _BLOCK_CELLS // max(3, lengths[order[start]])))
+            while (stop - start) * max(3, lengths[order[stop - 1]]) > _BLOCK_CELLS and stop - start > 1:
+                stop = start + max(1, _BLOCK_CELLS // max(3, lengths[order[stop - 1]]))
+            rows = order[start:stop]
+            shingles = self._shingles(texts.iloc[rows])
+            hashed = np.empty_like(shingles)
+            for p in range(self.num_perm):
+                np.multiply(shingles, self.multipliers[p], out=hashed)
+                np.add(hashed, self.offsets[p], out=hashed)
+                result[rows, p] = hashed.min(axis=1)
+            start = stop
+        return result
+
+
+def _band_keys(signatures: np.ndarray, bands: int, rows: int, mix: np.ndarray) -> np.ndarray:
+    """One 32-bit key per band: a hash of the band's ``rows`` signature values."""
+    values = signatures.reshape(len(signatures), bands, rows).astype(np.uint64)
+    with np.errstate(over='ignore'):
+        combined = (values * mix).sum(axis=2, dtype=np.uint64)
+    return (combined >> np.uint64(32)).astype(np.uint32)
+
+
+def _blocks(positions: np.ndarray):
+    """Row positions in blocks of ``_BLOCK_ROWS``."""
+    for start in range(0, len(positions), _BLOCK_ROWS):
+        yield positions[start:start + _BLOCK_ROWS]
+
+
+def _bucket_pairs(sorted_keys: np.ndarray) -> tuple:
+    """
+    Positions of the pairs to verify among runs of equal keys.
+
+    Every pair of a bucket of up to ``_MAX_BUCKET`` rows is compared, which
+    bounds the work per row; larger buckets, mostly rows that merely look
+    alike, compare each member with the next one and with the first.
+    """
+    n = len(sorted_keys)
+    starts = np.flatnonzero(np.concatenate([[True], sorted_keys[1:] != sorted_keys[:-1]]))
+    sizes = np.diff(np.append(starts, n))
+    start_of = np.repeat(starts, sizes)
+    end_of = start_of + np.repeat(sizes, sizes)
+    position = np.arange(n)
+    small = np.repeat(sizes <= _MAX_BUCKET, sizes)
+    # Small buckets: each member with every later member
+    counts = np.where(small, end_of - position - 1, 0)
+    first = np.repeat(position, counts)
+    second = first + 1 + np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    # Large buckets: each member with the next one and with the first
+    chained = np.flatnonzero(~small & (position + 1 < end_of))
+    led = np.flatnonzero(~small & (position > start_of + 1))
+    first = np.concatenate([first, chained, start_of[led]])
+    second = np.concatenate([second, chained + 1, led])
+    return first, second
+
+
+def _components(n: int, first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    """Label each of ``n`` nodes with the smallest node connected to it by the edges."""
+    labels = np.arange(n)
+    while True:
+        low = np.minimum(labels[first], labels[second])
+        before = labels.copy()
+        np.minimum.at(labels, first, low)
+        np.minimum.at(labels, second, low)
+        # Pointer jumping: follow labels to their own labels until they settle
+        while True:
+            jumped = labels[labels]
+            if np.array_equal(jumped, labels):
+                break
+            labels = jumped
+        if np.array_equal(labels, before):
+            return labels
+
+
+def near_duplicate_clusters(df: pd.DataFrame, columns: Optional[List] = None, similarity: float = 0.8,
+                            num_perm: int = 64, random_state: Optional[int] = 0) -> pd.Series:
+    """
+    Group rows that are nearly identical, such as copies differing in whitespace, case or a few characters.
+
+    Each row's values are normalized (lowercased, whitespace trimmed and
+    collapsed), joined into one string and summarized by a MinHash signature
+    of its character 3-grams. Locality-sensitive hashing buckets bands of the
+    signatures, so only rows sharing a bucket are compared and the time
+    grows linearly with the rows rather than with their pairs. Candidate
+    pairs whose estimated Jaccard similarity reaches ``similarity`` are
+    linked, and linked rows form clusters. Signatures are computed block by
+    block and only the band keys (4 bytes per band per row) are kept for
+    every row, so tens of millions of rows fit in modest memory.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        The DataFrame to analyze.
+    columns : list, optional
+        Columns to compare. If None, all columns are compared.
+    similarity : float, optional
+        Smallest estimated Jaccard similarity of the rows' 3-gram sets for
+        two rows to be near duplicates, between 0 and 1. Default is 0.8.
+    num_perm : int, optional
+        Number of MinHash functions. More give a more precise similarity
+        estimate (standard error about ``sqrt(s(1 - s) / num_perm)``) at
+        a proportional cost. Default is 64.
+    random_state : int, optional
+        Seed for the hash functions. Default is 0.
+
+    Returns
+    -------
+    pandas.Series
+        The cluster of each row, aligned with ``df.index``: the position of
+        the cluster's first row, or -1 for rows without near duplicates.
+
+    Raises
+    ------
+    TypeError
+        If the input is not a pandas DataFrame.
+    ValueError
+        If ``similarity`` is not between 0 and 1 or ``num_perm`` is not positive.
+
+    Notes
+    -----
+    Only the first ``MAX_TEXT_CHARS`` (1,024) characters of each row's text are
+    compared. Rows slightly below the threshold may be linked, and rows
+    slightly above it missed, as the similarity is estimated.
+
+    Example
+    -------
+    >>> df = pd.DataFrame({'name': ['Ann Lee', 'ann lee ', 'Bo Chan', 'Cy Diaz'],
+    ...                    'time': ['2024-01-01 10:00:01', '2024-01-01 10:00:02', '2024-02-03 08:00', '2024-03-04 09:00']})
+    >>> near_duplicate_clusters(df, similarity=0.7).tolist()
+    [0, 0, -1, -1]
+    """
+    if not isinstance(df, pd.DataFrame):
+        raise TypeError("Input must be a pandas DataFrame.")
+    if not 0 < similarity <= 1:
+        raise ValueError("similarity must be between 0 and 1.")
+    if num_perm < 1:
+        raise ValueError("num_perm must be a positive integer.")
+    if columns is not None:
+        df = df[columns]
+    n = len(df)
+    hasher = MinHasher(num_perm, random_state)
+    bands, rows = lsh_bands(num_perm, similarity)
+    mix = np.random.default_rng(random_state).integers(1, 1 << 63, size=rows, dtype=np.uint64) | np.uint64(1)
+
+    # Pass 1: band keys of every row; the signatures themselves are dropped block by block
+    keys = np.empty((n, bands), dtype=np.uint32)
+    for block in _blocks(np.arange(n)):
+        keys[block] = _band_keys(hasher.signatures(row_texts(df.iloc[block])), bands, rows, mix)
+
+    # Rows sharing a bucket in some band are candidates
+    candidate = np.zeros(n, dtype=bool)
+    for band in range(bands):
+        _, inverse, counts = np.unique(keys[:, band], return_inverse=True, return_counts=True)
+        candidate |= counts[inverse] > 1
+    candidates = np.flatnonzero(candidate)
+    clusters = np.full(n, -1, dtype=np.int64)
+    if len(candidates) == 0:
+        return pd.Series(clusters, index=df.index, name='cluster')
+
+    # Pass 2: full signatures of the candidates only, to verify each bucket pairing
+    signatures = np.empty((len(candidates), num_perm), dtype=np.uint32)
+    offset = 0
+    for block in _blocks(candidates):
+        signatures[offset:offset + len(block)] = hasher.signatures(row_texts(df.iloc[block]))
+        offset += len(block)
+    candidate_keys = keys[candidates]
+    del keys
+
+    first, second = [], []
+    for band in range(bands):
+        order = np.argsort(candidate_keys[:, band], kind='stable')
+        left, right = _bucket_pairs(candidate_keys[order, band])
+        left, right = order[left], order[right]
+        agreement = (signatures[left] == signatures[right]).mean(axis=1)
+        keep = agreement >= similarity
+        first.append(left[keep])
+        second.append(right[keep])
+    first, second = np.concatenate(first), np.concatenate(second)
+    if len(first) == 0:
+        return pd.Series(clusters, index=df.index, name='cluster')
+
+    labels = _components(len(candidates), first, second)
+    sizes = np.bincount(labels, minlength=len(candidates))
+    linked = sizes[labels] > 1
+    # Candidates are in row order, so a component's smallest label is its first row
+    clusters[candidates[linked]] = candidates[labels[linked]]
+    return pd.Series(clusters, index=df.index, name='cluster')
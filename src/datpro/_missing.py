@@ -0,0 +1,197 @@
+"""Missing-value masks packed one bit per cell, and the patterns they form across columns."""
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from datpro._sketches import SpaceSaving
+
+# Rows per block when unpacking masks, sized so a block of 1,000 columns takes about 32 MB
+_BLOCK_CELLS = 1 << 23
+# Bytes of null mask per block when counting missing values
+_MASK_BYTES = 1 << 22
+# Largest number of missing-cell pairs counted one by one in a block
+_MAX_PAIRS = 1 << 21
+_POPCOUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+
+def popcount(bits: np.ndarray) -> np.ndarray:
+    """Number of set bits in each row of a 2D uint8 array."""
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(bits).sum(axis=-1, dtype=np.int64)
+    return _POPCOUNT[bits].sum(axis=-1, dtype=np.int64)
+
+
+def missing_counts(df: pd.DataFrame, columns=None) -> pd.Series:
+    """
+    Missing values per column of ``df``, or of ``columns`` only.
+
+    Columns are counted in blocks whose null masks take about
+    ``_MASK_BYTES``, rather than through a boolean copy of the whole frame,
+    so the extra memory stays proportional to the number of rows. Packing
+    masks into bitsets first is no faster, and is slower on wide frames, so
+    bitsets are only built when co-missingness is needed (``MissingnessState``).
+    """
+    if columns is None:
+        frame, positions = df, np.arange(df.shape[1])
+    elif df.columns.is_unique:
+        frame, positions = df, df.columns.get_indexer(columns)
+    else:
+        # Repeated labels select several columns each
+        frame = df[columns]
+        positions = np.arange(frame.shape[1])
+    width = max(1, _MASK_BYTES // max(len(df), 1))
+    counts = np.empty(len(positions), dtype=np.int64)
+    for start in range(0, len(positions), width):
+        block = positions[start:start + width]
+        if np.all(np.diff(block) == 1):
+            # Neighbouring columns are counted together through a view
+            counts[start:start + len(block)] = frame.iloc[:, block[0]:block[-1] + 1].isna().sum().to_numpy()
+        else:
+            counts[start:start + len(block)] = [frame.iloc[:, i].isna().sum() for i in block]
+    return pd.Series(counts, index=frame.columns[positions])
+
+
+def null_bitsets(df: pd.DataFrame, columns) -> np.ndarray:
+    """
+    Missing-value masks of ``columns``, one row of ``ceil(len(df) / 8)`` bytes per column.
+
+    Bit ``i % 8`` of byte ``i // 8`` is set when row ``i`` is missing, so the
+    masks take one bit per cell; only one column's boolean mask exists at a time.
+    """
+    bits = np.zeros((len(columns), (len(df) + 7) // 8), dtype=np.uint8)
+    for i, col in enumerate(columns):
+        bits[i] = np.packbits(df[col].isna().to_numpy(), bitorder='little')
+    return bits
+
+
+def _pair_counts(block: np.ndarray) -> np.ndarray:
+    """
+    Rows where both columns are missing, for every pair of the block's columns.
+
+    ``block`` holds one row of 0/1 flags per column. Sparse blocks count the
+    pairs each row contributes; denser ones use a matrix product.
+    """
+    k, n = block.shape
+    per_row = block.sum(axis=0, dtype=np.int64)
+    pairs = int(per_row @ per_row)
+    if pairs > _MAX_PAIRS or pairs * 16 > k * k * n:
+        as_float = block.astype(np.float32)
+        # float32 sums are exact below 2**24, more than the rows in a block
+        return (as_float @ as_float.T).astype(np.int64)
+    rows, cols = np.nonzero(block.T)
+    repeats = per_row[rows]
+    # Pair every missing cell with each missing cell of its row
+    first = np.repeat(cols, repeats)
+    row_start = np.repeat(np.cumsum(per_row)[rows] - repeats, repeats)
+    offset = np.arange(pairs) - np.repeat(np.cumsum(repeats) - repeats, repeats)
+    second = cols[row_start + offset]
+    return np.bincount(first * k + second, minlength=k * k).reshape(k, k)
+
+
+class MissingnessState:
+    """
+    Co-missingness counts and missingness patterns accumulated over chunks.
+
+    Each chunk's null masks are packed into bitsets, so 1,000 columns of a
+    million rows take 125 MB rather than 1 GB. Missing counts are popcounts
+    of the bitsets; the co-missingness matrix counts, for every pair of
+    columns, the rows where both are missing; and a row's pattern is the set
+    of its missing columns, whose frequencies are tracked by a Space-Saving
+    sketch of ``capacity`` patterns so that memory stays bounded however
+    many distinct patterns appear.
+    """
+
+    def __init__(self, capacity: int = 1000):
+        self.columns: List = []
+        self._positions: Dict = {}
+        self.rows = 0
+        self.missing = np.zeros(0, dtype=np.int64)
+        self.co_missing = np.zeros((0, 0), dtype=np.int64)
+        self.patterns = SpaceSaving(capacity)
+
+    def _track(self, columns) -> None:
+        new = [col for col in columns if col not in self._positions]
+        if not new:
+            return
+        for col in new:
+            self._positions[col] = len(self.columns)
+            self.columns.append(col)
+        size = len(self.columns)
+        self.missing = np.concatenate([self.missing, np.zeros(len(new), dtype=np.int64)])
+        co_missing = np.zeros((size, size), dtype=np.int64)
+        co_missing[:size - len(new), :size - len(new)] = self.co_missing
+        self.co_missing = co_missing
+
+    def update(self, chunk: pd.DataFrame) -> "MissingnessState":
+        """Absorb a chunk of rows."""
+        self._track(chunk.columns)
+        n = len(chunk)
+        if n == 0:
+            return self
+        bits = null_bitsets(chunk, chunk.columns)
+        counts = popcount(bits)
+        positions = np.array([self._positions[col] for col in chunk.columns], dtype=np.intp)
+        self.missing[positions] += counts
+        # Columns with no missing values in the chunk add nothing to the pairs or patterns
+        holes = counts > 0
+        bits, positions = bits[holes], positions[holes]
+        pattern_keys, pattern_counts = [], []
+        if bits.size:
+            # A multiple of 8 rows per block, so blocks are whole bytes of the bitsets
+            block_bytes = max(1, _BLOCK_CELLS // (8 * len(positions)))
+            width = (len(self.columns) + 7) // 8
+            for start in range(0, bits.shape[1], block_bytes):
+                stop = min(start + block_bytes, bits.shape[1])
+                rows = min(n, stop * 8) - start * 8
+                block = np.unpackbits(bits[:, start:stop], axis=1, count=rows, bitorder='little')
+                self.co_missing[np.ix_(positions, positions)] += _pair_counts(block)
+                keys, key_counts = self._block_patterns(block, positions, width)
+                pattern_keys.extend(keys)
+                pattern_counts.append(key_counts)
+        else:
+            pattern_keys, pattern_counts = [b''], [np.array([n])]
+        counts = pd.Series(np.concatenate(pattern_counts), index=pattern_keys)
+        self.patterns.update_counts(counts.groupby(level=0, sort=False).sum())
+        self.rows += n
+        return self
+
+    def _block_patterns(self, block: np.ndarray, positions: np.ndarray, width: int) -> tuple:
+        """The block's distinct row patterns, keyed by their missing columns as a bitmap over all tracked columns."""
+        # Each row's flags packed into bytes, compared as one opaque value per row
+        packed = np.ascontiguousarray(np.packbits(block, axis=0, bitorder='little').T)
+        local, counts = np.unique(packed.view(np.dtype((np.void, packed.shape[1]))).ravel(), return_counts=True)
+        local = local.view(np.uint8).reshape(len(local), packed.shape[1])
+        flags = np.zeros((len(local), width * 8), dtype=bool)
+        flags[:, positions] = np.unpackbits(local, axis=1, count=len(positions), bitorder='little').astype(bool)
+        # Trailing zero bytes are dropped, so keys stay valid as columns are added
+        keys = [key.tobytes().rstrip(b'\x00') for key in np.packbits(flags, axis=1, bitorder='little')]
+        return keys, counts
+
+    def pattern_columns(self, key: bytes) -> List:
+        """The columns missing in the pattern ``key``."""
+        flags = np.unpackbits(np.frombuffer(key, dtype=np.uint8), bitorder='little').astype(bool)
+        return [self.columns[i] for i in np.flatnonzero(flags)]
+
+    def report(self, top_k: int = 10) -> Dict:
+        """
+        The ``top_k`` most frequent missingness patterns and the co-missingness matrix.
+
+        ``patterns`` lists ``{'columns', 'count', 'percentage'}`` records, the
+        complete rows being the pattern with no columns. ``co_missing`` is a
+        DataFrame over the columns with missing values, whose diagonal holds
+        their missing counts.
+        """
+        top = self.patterns.top(top_k)
+        patterns = [
+            {
+                "columns": self.pattern_columns(key),
+                "count": int(count),
+                "percentage": round(100 * count / self.rows, 2) if self.rows else 0.0
+            }
+            for key, count in zip(top['value'], top['count'])
+        ]
+        holes = np.flatnonzero(self.missing > 0)
+        labels = [self.columns[i] for i in holes]
+        co_missing = pd.DataFrame(self.co_missing[np.ix_(holes, holes)], index=labels, columns=labels)
+        return {"patterns": patterns, "co_missing": co_missing}
@@ -0,0 +1,272 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional, Sequence
+
+SUMMARY_LEVELS = (0.0, 0.25, 0.5, 0.75, 1.0)
+SUMMARY_LABELS = ['min', '25%', '50%', '75%', 'max']
+
+# Upper bound on the size of one float64 block handed to the engine.
+BLOCK_BYTES = 256 * 1024 ** 2
+
+OUTLIER_METHODS = ('iqr', 'zscore', 'mad')
+DEFAULT_OUTLIER_THRESHOLDS = {'iqr': 1.5, 'zscore': 3.0, 'mad': 3.5}
+# Scales the MAD to the standard deviation of a normal distribution
+_MAD_SCALE = 0.6745
+
+
+def is_real_numeric(dtype) -> bool:
+    """Return True for numeric dtypes the engine can cast losslessly to float64."""
+    return (
+        pd.api.types.is_numeric_dtype(dtype)
+        and not pd.api.types.is_bool_dtype(dtype)
+        and not pd.api.types.is_complex_dtype(dtype)
+        and not pd.api.types.is_timedelta64_dtype(dtype)
+    )
+
+
+def _lerp(a: np.ndarray, b: np.ndarray, t: np.ndarray) -> np.ndarray:
+    """Linear interpolation using the same arithmetic as ``numpy.quantile``."""
+    diff = b - a
+    return np.where(t >= 0.5, b - diff * (1 - t), a + diff * t)
+
+
+def _valid_counts(sorted_values: np.ndarray) -> np.ndarray:
+    """
+    Count the non-NaN entries of each column of a column-sorted 2D array.
+
+    NaNs sort last, so a vectorized binary search across all columns finds
+    the first NaN without allocating a boolean mask of the whole block.
+    """
+    n_rows, n_cols = sorted_values.shape
+    lo = np.zeros(n_cols, dtype=np.intp)
+    hi = np.full(n_cols, n_rows, dtype=np.intp)
+    cols = np.arange(n_cols)
+    while np.any(lo < hi):
+        mid = (lo + hi) // 2
+        active = lo < hi
+        probe = sorted_values[np.minimum(mid, n_rows - 1), cols]
+        is_nan = np.isnan(probe)
+        hi = np.where(active & is_nan, mid, hi)
+        lo = np.where(active & ~is_nan, mid + 1, lo)
+    return lo
+
+
+def frame_values(df, columns: Sequence) -> np.ndarray:
+    """
+    Copy ``columns`` of ``df`` into a Fortran-ordered float64 array, in row order.
+
+    ``df`` is a pandas DataFrame or a ``pyarrow.Table``. Arrow columns are
+    copied chunk by chunk from their buffers, with nulls becoming NaN.
+    """
+    values = np.empty((len(df), len(columns)), dtype=np.float64, order='F')
+    for i, col in enumerate(columns):
+        if isinstance(df, pd.DataFrame):
+            values[:, i] = df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+            continue
+        offset = 0
+        for chunk in df.column(col).chunks:
+            values[offset:offset + len(chunk), i] = chunk.to_numpy(zero_copy_only=False)
+            offset += len(chunk)
+    return values
+
+
+class NumericBlock:
+    """
+    Column-sorted float64 copy of a group of numeric columns.
+
+    Every statistic the profiling functions need from numeric data (extrema,
+    quartiles and counts of values outside a range) can be read from the
+    sorted block, so each column is copied and sorted exactly once.
+
+    Parameters
+    ----------
+    columns : sequence
+        Labels of the columns held in the block.
+    values : numpy.ndarray
+        2D float64 array with one column per label. It is sorted in place.
+    """
+
+    def __init__(self, columns: Sequence, values: np.ndarray):
+        values.sort(axis=0)
+        self.columns = list(columns)
+        self.sorted = values
+        self.counts = _valid_counts(values)
+
+    @classmethod
+    def from_frame(cls, df, columns: Sequence) -> "NumericBlock":
+        """Copy ``columns`` of ``df`` into a block with ``frame_values`` and sort it."""
+        return cls(columns, frame_values(df, columns))
+
+    def quantiles(self, levels: Sequence[float] = SUMMARY_LEVELS) -> np.ndarray:
+        """
+        Linearly interpolated quantiles of every column, ignoring NaNs.
+
+        Levels 0 and 1 return the exact extrema, as ``Series.min``/``max`` do.
+        Returns an array of shape ``(len(levels), n_columns)``; columns without
+        any valid value yield NaN.
+        """
+        levels = np.asarray(levels, dtype=np.float64)[:, None]
+        last = np.maximum(self.counts - 1, 0)
+        position = levels * last
+        below = np.floor(position).astype(np.intp)
+        above = np.minimum(below + 1, last)
+        weight = position - below
+        a = np.take_along_axis(self.sorted, below, axis=0)
+        b = np.take_along_axis(self.sorted, above, axis=0)
+        with np.errstate(invalid='ignore'):
+            result = _lerp(a, b, weight)
+        extrema = (levels == 0.0) | (levels == 1.0)
+        result = np.where(extrema, a, result)
+        result[:, self.counts == 0] = np.nan
+        return result
+
+    def mean_std(self) -> tuple:
+        """Mean and population standard deviation of every column, ignoring NaNs."""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.nansum(self.sorted, axis=0) / self.counts
+            std = np.sqrt(np.nansum(np.square(self.sorted - mean), axis=0) / self.counts)
+        return mean, std
+
+    def median_mad(self) -> tuple:
+        """Median and median absolute deviation of every column, ignoring NaNs."""
+        median = self.quantiles([0.5])[0]
+        deviations = NumericBlock(self.columns, np.abs(self.sorted - median))
+        return median, deviations.quantiles([0.5])[0]
+
+    def count_outside(self, lower: np.ndarray, upper: np.ndarray) -> np.ndarray:
+        """Count, per column, the values strictly below ``lower`` or above ``upper``."""
+        result = np.zeros(len(self.columns), dtype=np.int64)
+        for i, n in enumerate(self.counts):
+            if n == 0 or np.isnan(lower[i]) or np.isnan(upper[i]):
+                continue
+            column = self.sorted[:n, i]
+            below = np.searchsorted(column, lower[i], side='left')
+            above = n - np.searchsorted(column, upper[i], side='right')
+            result[i] = below + above
+        return result
+
+
+def column_groups(n_rows: int, columns: Sequence, n_groups: int = 1,
+                  max_bytes: int = BLOCK_BYTES) -> List[List]:
+    """
+    Partition ``columns`` into consecutive groups for block-wise processing.
+
+    Groups are small enough that a float64 block of ``n_rows`` rows stays
+    under ``max_bytes``, and there are at least ``n_groups`` of them (when
+    there are enough columns) so each worker gets a share.
+    """
+    columns = list(columns)
+    per_group = max(1, max_bytes // max(1, 8 * n_rows))
+    per_group = min(per_group, -(-len(columns) // max(1, n_groups)) or 1)
+    return [columns[start:start + per_group] for start in range(0, len(columns), per_group)]
+
+
+def block_quantiles(df, columns: Sequence,
+                    levels: Sequence[float] = SUMMARY_LEVELS) -> np.ndarray:
+    """Quantiles of ``columns`` of ``df``, shaped ``(len(levels), len(columns))``."""
+    return NumericBlock.from_frame(df, columns).quantiles(levels)
+
+
+def resolve_outlier_methods(method, threshold=None, masks: Optional[str] = None) -> Dict[str, float]:
+    """
+    Validate outlier options and return the threshold of each requested method, in order.
+
+    ``method`` is a method name or a list of them. ``threshold`` is a number
+    (for a single method) or a dict from method to threshold; methods left
+    out use ``DEFAULT_OUTLIER_THRESHOLDS``.
+    """
+    methods = [method] if isinstance(method, str) else list(method)
+    unknown = [m for m in methods if m not in OUTLIER_METHODS]
+    if unknown or not methods:
+        raise ValueError(f"outlier_method must be one or more of {', '.join(OUTLIER_METHODS)}.")
+    if masks not in (None, 'bitset', 'indices'):
+        raise ValueError("outlier_masks must be 'bitset' or 'indices'.")
+    if threshold is None:
+        threshold = {}
+    elif not isinstance(threshold, dict):
+        if len(methods) > 1:
+            raise ValueError("Give outlier_threshold as a dict when using several methods.")
+        threshold = {methods[0]: threshold}
+    return {m: float(threshold.get(m, DEFAULT_OUTLIER_THRESHOLDS[m])) for m in methods}
+
+
+def outlier_fences(block: NumericBlock, thresholds: Dict[str, float]) -> Dict[str, tuple]:
+    """
+    Lower and upper fences of every column for each method; values strictly outside are outliers.
+
+    - ``iqr``: ``Q1 - t * IQR`` and ``Q3 + t * IQR``.
+    - ``zscore``: ``|x - mean| / std > t``, with the population standard deviation.
+    - ``mad``: modified z-score ``0.6745 * |x - median| / MAD > t`` (Iglewicz and Hoaglin).
+    """
+    fences = {}
+    for method, t in thresholds.items():
+        if method == 'iqr':
+            Q1, Q3 = block.quantiles([0.25, 0.75])
+            IQR = Q3 - Q1
+            fences[method] = (Q1 - t * IQR, Q3 + t * IQR)
+        elif method == 'zscore':
+            mean, std = block.mean_std()
+            fences[method] = (mean - t * std, mean + t * std)
+        else:
+            median, mad = block.median_mad()
+            fences[method] = (median - t * mad / _MAD_SCALE, median + t * mad / _MAD_SCALE)
+    return fences
+
+
+def encode_mask(mask: np.ndarray, kind: str) -> np.ndarray:
+    """
+    Compact form of a boolean row mask.
+
+    ``'bitset'`` packs it into ``ceil(n / 8)`` bytes, least significant bit
+    first; ``np.unpackbits(bits, count=n, bitorder='little').astype(bool)``
+    restores it. ``'indices'`` gives the positions of the True rows.
+    """
+    if kind == 'bitset':
+        return np.packbits(mask, bitorder='little')
+    return np.flatnonzero(mask)
+
+
+def block_outliers(df, columns: Sequence, thresholds: Dict[str, float], masks: Optional[str] = None) -> tuple:
+    """
+    Outlier counts of ``columns`` for every method, from a single sorted block.
+
+    Returns ``(counts, column_masks)``: ``counts`` maps each method to an
+    array of per-column counts, and ``column_masks`` maps each method to a
+    list of encoded per-column masks (None unless ``masks`` is given).
+    """
+    values = frame_values(df, columns)
+    block = NumericBlock(columns, values.copy() if masks else values)
+    fences = outlier_fences(block, thresholds)
+    counts = {method: block.count_outside(lower, upper) for method, (lower, upper) in fences.items()}
+    if not masks:
+        return counts, None
+    column_masks = {}
+    for method, (lower, upper) in fences.items():
+        outside = (values < lower) | (values > upper)
+        column_masks[method] = [encode_mask(outside[:, i], masks) for i in range(len(columns))]
+    return counts, column_masks
+
+
+def series_outlier_mask(series: pd.Series, method: str, threshold: float) -> pd.Series:
+    """``outlier_fences`` for a column the engine cannot cast to float64, such as timedelta."""
+    if method == 'iqr':
+        Q1, Q3 = series.quantile(0.25), series.quantile(0.75)
+        IQR = Q3 - Q1
+        lower, upper = Q1 - threshold * IQR, Q3 + threshold * IQR
+    elif method == 'zscore':
+        mean, std = series.mean(), series.std(ddof=0)
+        lower, upper = mean - threshold * std, mean + threshold * std
+    else:
+        median = series.median()
+        mad = (series - median).abs().median()
+        lower, upper = median - threshold * mad / _MAD_SCALE, median + threshold * mad / _MAD_SCALE
+    return (series < lower) | (series > upper)
+
+
+def split_columns(df: pd.DataFrame, columns: Sequence) -> tuple:
+    """Split ``columns`` into those the engine handles and those needing pandas."""
+    real: List = []
+    other: List = []
+    for col in columns:
+        (real if is_real_numeric(df[col].dtype) else other).append(col)
+    return real, other
@@ -0,0 +1,83 @@
+import os
+import threading
+from concurrent.futures import CancelledError, Executor, ThreadPoolExecutor
+from contextvars import ContextVar
+from typing import Callable, List, Optional, Sequence, TypeVar
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+# Set by the async API around a call; work stops at the next checkpoint once the event is set
+cancel_event: ContextVar[Optional[threading.Event]] = ContextVar('datpro_cancel_event', default=None)
+
+
+def checkpoint(event: Optional[threading.Event] = None) -> None:
+    """Raise ``CancelledError`` if the current call (or ``event``) has been cancelled."""
+    event = event or cancel_event.get()
+    if event is not None and event.is_set():
+        raise CancelledError()
+
+
+def resolve_n_jobs(n_jobs: Optional[int]) -> int:
+    """
+    Translate an ``n_jobs`` argument into a worker count.
+
+    None means 1 (serial). Negative values count back from the number of
+    CPUs, scikit-learn style: -1 uses every CPU, -2 all but one.
+    """
+    if n_jobs is None:
+        return 1
+    if n_jobs == 0:
+        raise ValueError("n_jobs must be a non-zero integer or None.")
+    cpus = os.cpu_count() or 1
+    return max(1, n_jobs if n_jobs > 0 else cpus + 1 + n_jobs)
+
+
+def check_executor(executor: Optional[Executor]) -> None:
+    """
+    Raise ``TypeError`` unless ``executor`` is None or a thread pool.
+
+    Blocks are closures over the caller's DataFrame, which process pools
+    would have to pickle, so only threads can run them.
+    """
+    if executor is not None and not isinstance(executor, ThreadPoolExecutor):
+        raise TypeError(
+            f"executor must be a concurrent.futures.ThreadPoolExecutor, not {type(executor).__name__}; "
+            "column blocks share the DataFrame in memory and cannot be sent to other processes."
+        )
+
+
+def worker_count(n_jobs: Optional[int], executor: Optional[Executor]) -> int:
+    """Number of blocks work should be split into for the given options."""
+    if executor is not None and n_jobs is None:
+        return os.cpu_count() or 1
+    return resolve_n_jobs(n_jobs)
+
+
+def map_blocks(func: Callable[[T], R], blocks: Sequence[T], n_jobs: Optional[int] = None,
+               executor: Optional[Executor] = None) -> List[R]:
+    """
+    Apply ``func`` to every block, concurrently if requested, keeping block order.
+
+    Blocks run on ``executor`` if one is given, otherwise on a temporary
+    thread pool of ``n_jobs`` workers. NumPy sorting and reductions release the
+    GIL, so threads run the numeric kernels in parallel without copying or
+    pickling column data. Results always come back in input order, so the
+    output is identical to the serial path. A cancelled call stops before
+    its next block starts.
+    """
+    event = cancel_event.get()
+    if event is not None:
+        # Pool threads do not see the caller's context, so the event is captured here
+        def run(block, func=func):
+            checkpoint(event)
+            return func(block)
+
+        func = run
+    if executor is not None:
+        return list(executor.map(func, blocks))
+    workers = min(resolve_n_jobs(n_jobs), len(blocks))
+    if workers <= 1:
+        return [func(block) for block in blocks]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(func, blocks))
@@ -0,0 +1,100 @@
+import numpy as np
+from typing import Dict, Mapping, Optional, Sequence, Union
+
+
+def missing_report(missing_counts: Mapping, total_rows: int) -> Union[Dict, str]:
+    """Format per-column missing counts as the ``missing_values`` report entry."""
+    missing_info = {
+        col: {
+            "missing_count": int(count),
+            "missing_percentage": round((count / total_rows) * 100, 2)
+        }
+        for col, count in missing_counts.items() if count > 0
+    }
+    return missing_info if missing_info else "No missing values detected."
+
+
+def outlier_report(outlier_counts: Mapping, total_rows: int) -> Union[Dict, str]:
+    """Format per-column outlier counts as the ``outliers`` report entry."""
+    outlier_info = {
+        col: {
+            "outlier_count": int(count),
+            "outlier_percentage": round((count / total_rows) * 100, 2)
+        }
+        for col, count in outlier_counts.items() if count > 0
+    }
+    return outlier_info if outlier_info else "No outliers detected."
+
+
+def outlier_entries(counts: Mapping, masks: Optional[Mapping], methods: Sequence[str], by_method: bool,
+                    total_rows: int) -> Dict:
+    """
+    Format per-column outlier counts of one or more methods as the ``outliers`` entry.
+
+    ``counts`` (and ``masks``) map each column to a dict keyed by method.
+    With ``by_method`` the entry is keyed by method first; otherwise it is
+    the single method's ``outlier_report``. Masks, when given, are reported
+    under ``outlier_masks`` for the columns that have outliers, in the same
+    layout.
+    """
+    entries = {
+        method: outlier_report({col: by_col[method] for col, by_col in counts.items()}, total_rows)
+        for method in methods
+    }
+    report = {'outliers': entries if by_method else entries[methods[0]]}
+    if masks is not None:
+        mask_entries = {
+            method: {col: masks[col][method] for col in counts if counts[col][method] > 0}
+            for method in methods
+        }
+        report['outlier_masks'] = mask_entries if by_method else mask_entries[methods[0]]
+    return report
+
+
+def duplicate_report(duplicate_count, total_rows: int) -> Union[Dict, str]:
+    """Format a duplicate row count as the ``duplicates`` report entry."""
+    return {
+        "duplicate_count": duplicate_count,
+        "duplicate_percentage": round((duplicate_count / total_rows) * 100, 2)
+    } if duplicate_count > 0 else "No duplicate rows detected."
+
+
+def approximate_duplicate_report(total_rows: int, sketch) -> Union[Dict, str]:
+    """
+    Format a HyperLogLog distinct-row estimate as the ``duplicates`` report entry.
+
+    ``error_bound`` is two standard errors of the distinct estimate (about
+    95% confidence), expressed in rows.
+    """
+    distinct = min(sketch.estimate(), total_rows)
+    duplicate_count = int(round(total_rows - distinct))
+    return {
+        "duplicate_count": duplicate_count,
+        "duplicate_percentage": round((duplicate_count / total_rows) * 100, 2),
+        "error_bound": int(np.ceil(2 * sketch.relative_error * distinct)),
+        "approximate": True
+    } if duplicate_count > 0 else "No duplicate rows detected."
+
+
+def near_duplicate_report(clusters, total_rows: int, top: int = 10) -> Union[Dict, str]:
+    """
+    Format the near-duplicate cluster of each row as the ``near_duplicates`` report entry.
+
+    ``clusters`` is a Series aligned with the rows, holding each row's
+    cluster or -1. The count is the rows beyond the first of each cluster;
+    ``clusters`` lists the index labels and size of the ``top`` largest.
+    """
+    sizes = clusters[clusters >= 0].value_counts()
+    if sizes.empty:
+        return "No near-duplicate rows detected."
+    near_duplicate_count = int(sizes.sum() - len(sizes))
+    members = clusters.index.groupby(clusters.to_numpy())
+    return {
+        "near_duplicate_count": near_duplicate_count,
+        "near_duplicate_percentage": round((near_duplicate_count / total_rows) * 100, 2),
+        "cluster_count": len(sizes),
+        "clusters": [
+            {"rows": list(members[cluster]), "count": int(count)}
+            for cluster, count in sizes.head(top).items()
+        ]
+    }
@@ -0,0 +1,287 @@
+"""Row samples and confidence intervals for the quick-profile (``sample=``/``fraction=``) mode."""
+import math
+from statistics import NormalDist
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from datpro._hashing import row_hashes
+from datpro._missing import missing_counts
+from datpro._numeric import SUMMARY_LABELS, SUMMARY_LEVELS, NumericBlock, block_outliers, is_real_numeric
+
+ESTIMATE_LABELS = ['estimate', 'lower', 'upper']
+
+
+def check_sampling(sample: Optional[int], fraction: Optional[float], confidence: float) -> None:
+    """Validate the sampling options shared by the profiling functions."""
+    if sample is not None and fraction is not None:
+        raise ValueError("Give either sample or fraction, not both.")
+    if sample is not None and (isinstance(sample, bool) or int(sample) != sample or sample < 1):
+        raise ValueError("sample must be a positive integer.")
+    if fraction is not None and not 0 < fraction <= 1:
+        raise ValueError("fraction must be between 0 and 1.")
+    if not 0 < confidence < 1:
+        raise ValueError("confidence must be between 0 and 1.")
+
+
+def _allocate(sizes: np.ndarray, n: int) -> np.ndarray:
+    """Split ``n`` rows across strata in proportion to ``sizes`` (largest remainder), at least one each."""
+    n = min(n, int(sizes.sum()))
+    share = sizes * n / sizes.sum()
+    alloc = np.minimum(np.maximum(np.floor(share).astype(np.int64), 1), sizes)
+    while alloc.sum() < n:
+        room = np.where(alloc < sizes, share - alloc, -np.inf)
+        alloc[np.argmax(room)] += 1
+    while alloc.sum() > n:
+        excess = np.where(alloc > 1, alloc - share, -np.inf)
+        alloc[np.argmax(excess)] -= 1
+    return alloc
+
+
+def sample_frame(df, sample: Optional[int], fraction: Optional[float], stratify=None,
+                 random_state: Optional[int] = None) -> pd.DataFrame:
+    """
+    Simple random (or proportionally stratified) sample of the rows of an in-memory table.
+
+    ``df`` is a pandas DataFrame or a ``pyarrow.Table``; only the sampled
+    rows are copied (and, for Arrow, converted to pandas). Stratifying reads
+    the ``stratify`` column in full.
+    """
+    rng = np.random.default_rng(random_state)
+    total = len(df)
+    n = min(total, sample if sample is not None else math.ceil(fraction * total))
+    if stratify is None:
+        rows = np.sort(rng.choice(total, n, replace=False))
+    else:
+        labels = df[stratify] if isinstance(df, pd.DataFrame) else df.column(stratify).to_pandas()
+        codes, _ = pd.factorize(labels, use_na_sentinel=False)
+        sizes = np.bincount(codes)
+        order = np.argsort(codes, kind='stable')
+        starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+        rows = np.sort(np.concatenate([
+            order[start + rng.choice(size, take, replace=False)]
+            for start, size, take in zip(starts, sizes, _allocate(sizes, n))
+        ]))
+    if isinstance(df, pd.DataFrame):
+        return df.take(rows)
+    return df.take(rows).to_pandas()
+
+
+def sample_chunks(chunks: Iterable[pd.DataFrame], sample: Optional[int], fraction: Optional[float],
+                  stratify=None, random_state: Optional[int] = None) -> Tuple[pd.DataFrame, int]:
+    """
+    Sample rows from chunks in one pass, returning the sample and the number of rows read.
+
+    With ``fraction`` each row is kept independently with that probability.
+    With ``sample`` every row draws a random key and the rows with the
+    ``sample`` smallest keys are kept (a reservoir sample), per stratum when
+    stratifying, so memory is bounded by the sample size times the number of
+    strata. A stratified reservoir is cut down to proportional allocations
+    once the stratum sizes are known.
+    """
+    rng = np.random.default_rng(random_state)
+    total = 0
+    kept = []
+    reservoir = None
+    keys = np.empty(0)
+    stratum_sizes = pd.Series(dtype=np.int64)
+    for chunk in chunks:
+        total += len(chunk)
+        if fraction is not None:
+            kept.append(chunk[rng.random(len(chunk)) < fraction])
+            continue
+        chunk_keys = rng.random(len(chunk))
+        if stratify is None:
+            if len(keys) >= sample:
+                # Rows keyed above the reservoir's largest key can never enter it
+                entering = chunk_keys < keys.max()
+                chunk, chunk_keys = chunk[entering], chunk_keys[entering]
+        else:
+            stratum_sizes = stratum_sizes.add(chunk[stratify].value_counts(dropna=False), fill_value=0)
+        reservoir = chunk if reservoir is None else pd.concat([reservoir, chunk])
+        keys = np.concatenate([keys, chunk_keys])
+        keep = _smallest_keys(keys, None if stratify is None else reservoir[stratify], None, sample)
+        reservoir, keys = reservoir.iloc[keep], keys[keep]
+
+    if fraction is not None:
+        frames = [frame for frame in kept if len(frame)]
+        return (pd.concat(frames) if frames else pd.DataFrame()), total
+    if reservoir is None:
+        return pd.DataFrame(), total
+    if stratify is not None:
+        allocation = pd.Series(_allocate(stratum_sizes.to_numpy(np.int64), sample), index=stratum_sizes.index)
+        reservoir = reservoir.iloc[_smallest_keys(keys, reservoir[stratify], allocation, sample)]
+    return reservoir, total
+
+
+def _smallest_keys(keys: np.ndarray, strata: Optional[pd.Series], allocation: Optional[pd.Series],
+                   size: int) -> np.ndarray:
+    """
+    Positions of the ``size`` smallest keys, overall or within each stratum.
+
+    ``allocation``, indexed by stratum, overrides ``size`` for the strata it lists.
+    """
+    if strata is None:
+        if len(keys) <= size:
+            return np.arange(len(keys))
+        return np.sort(np.argpartition(keys, size - 1)[:size])
+    codes, uniques = pd.factorize(strata, use_na_sentinel=False)
+    if allocation is None:
+        limits = np.full(len(uniques), size, dtype=np.int64)
+    else:
+        limits = allocation.reindex(uniques, fill_value=size).to_numpy(np.int64)
+    order = np.lexsort((keys, codes))
+    rank = pd.Series(codes[order]).groupby(codes[order]).cumcount().to_numpy()
+    return np.sort(order[rank < limits[codes[order]]])
+
+
+def _z(confidence: float) -> float:
+    return NormalDist().inv_cdf(0.5 + confidence / 2)
+
+
+def _finite_population(sample_rows: int, population_rows: int) -> float:
+    """Finite population correction of the variance; 0 when the sample is the whole table."""
+    if population_rows <= 1:
+        return 0.0
+    return max(0.0, (population_rows - sample_rows) / (population_rows - 1))
+
+
+def proportion_interval(count: int, sample_rows: int, population_rows: int, confidence: float) -> Tuple[float, float]:
+    """Wilson score interval of a proportion, with the finite population correction."""
+    if sample_rows == 0:
+        return 0.0, 1.0
+    z = _z(confidence) * math.sqrt(_finite_population(sample_rows, population_rows))
+    p = count / sample_rows
+    denominator = 1 + z * z / sample_rows
+    center = (p + z * z / (2 * sample_rows)) / denominator
+    half = z * math.sqrt(p * (1 - p) / sample_rows + z * z / (4 * sample_rows ** 2)) / denominator
+    return max(0.0, center - half), min(1.0, center + half)
+
+
+def sampled_summary(sample: pd.DataFrame, population_rows: int, confidence: float) -> pd.DataFrame:
+    """
+    Estimated min, quartiles and max of the numeric columns of a sample, with confidence intervals.
+
+    Quartile intervals are distribution-free: they span the order statistics
+    whose ranks lie ``z`` binomial standard deviations either side of the
+    quartile's rank. The sample minimum can only overestimate the true
+    minimum (and the maximum underestimate), so their intervals are open on
+    the outer side. Columns are laid out as ``(statistic, estimate/lower/upper)``.
+    """
+    columns = [col for col in sample.columns if is_real_numeric(sample[col].dtype)]
+    if not columns:
+        raise ValueError("The DataFrame contains no numeric columns.")
+    block = NumericBlock.from_frame(sample, columns)
+    estimate = block.quantiles()
+    lower = np.empty_like(estimate)
+    upper = np.empty_like(estimate)
+    exact = len(sample) >= population_rows
+    spread = _z(confidence) * math.sqrt(_finite_population(len(sample), population_rows))
+    for j, count in enumerate(block.counts):
+        for i, level in enumerate(SUMMARY_LEVELS):
+            if count == 0:
+                lower[i, j] = upper[i, j] = np.nan
+            elif exact:
+                lower[i, j] = upper[i, j] = estimate[i, j]
+            elif level in (0.0, 1.0):
+                lower[i, j] = -np.inf if level == 0.0 else estimate[i, j]
+                upper[i, j] = estimate[i, j] if level == 0.0 else np.inf
+            else:
+                half = spread * math.sqrt(count * level * (1 - level))
+                lower[i, j] = block.sorted[max(0, math.floor(count * level - half)), j]
+                upper[i, j] = block.sorted[min(count - 1, math.ceil(count * level + half)), j]
+    stats = np.stack([estimate, lower, upper], axis=-1)
+    summary = pd.DataFrame(
+        stats.transpose(1, 0, 2).reshape(len(columns), -1), index=columns,
+        columns=pd.MultiIndex.from_product([SUMMARY_LABELS, ESTIMATE_LABELS])
+    )
+    summary.attrs.update(approximate=not exact, sample_rows=len(sample),
+                         population_rows=population_rows, confidence=confidence)
+    return summary
+
+
+def _rate_entry(name: str, count: int, sample_rows: int, population_rows: int, confidence: float) -> Dict:
+    count = int(count)
+    lower, upper = proportion_interval(count, sample_rows, population_rows, confidence)
+    rate = count / sample_rows
+    return {
+        f"{name}_count": int(round(rate * population_rows)),
+        f"{name}_percentage": round(rate * 100, 2),
+        "confidence_interval": (round(lower * 100, 2), round(upper * 100, 2)),
+        "approximate": sample_rows < population_rows
+    }
+
+
+def _duplicate_entry(sample: pd.DataFrame, population_rows: int, confidence: float) -> Union[Dict, str]:
+    """
+    Estimated duplicate rows of the table from the identical pairs in a sample.
+
+    A pair of identical rows lands in a uniform sample of ``m`` of ``N`` rows
+    with probability ``m(m-1) / (N(N-1))``, so the sample's pair count is
+    scaled up by its inverse. This counts each duplicated row once when
+    copies come in pairs and over-counts rows repeated many times. The
+    interval treats the pair count as Poisson; a sample without pairs
+    estimates no duplicates, with the upper limit of a Poisson count of zero.
+    """
+    m = len(sample)
+    if m >= population_rows:
+        count = int(sample.duplicated().sum())
+        return {
+            "duplicate_count": count,
+            "duplicate_percentage": round(count / population_rows * 100, 2),
+            "confidence_interval": (round(count / population_rows * 100, 2),) * 2,
+            "approximate": False
+        } if count else "No duplicate rows detected."
+    sizes = pd.Series(row_hashes(sample)).value_counts().to_numpy()
+    pairs = int((sizes * (sizes - 1) // 2).sum())
+    scale = population_rows * (population_rows - 1) / max(1, m * (m - 1))
+    z = _z(confidence)
+    if pairs == 0:
+        # Exact Poisson upper limit for no events, about 3 at 95% (the rule of three)
+        bounds = (0.0, -math.log(1 - confidence))
+    else:
+        bounds = (max(0.0, math.sqrt(pairs) - z / 2) ** 2, (math.sqrt(pairs + 1) + z / 2) ** 2)
+
+    def to_percentage(pair_count):
+        return round(min(pair_count * scale, population_rows - 1) / population_rows * 100, 2)
+
+    return {
+        "duplicate_count": int(round(min(pairs * scale, population_rows - 1))),
+        "duplicate_percentage": to_percentage(pairs),
+        "confidence_interval": tuple(to_percentage(b) for b in bounds),
+        "approximate": True
+    }
+
+
+def sampled_anomalies(sample: pd.DataFrame, population_rows: int, anomaly_type: Optional[str],
+                      thresholds: Dict[str, float], by_method: bool, confidence: float,
+                      subset: Optional[List] = None) -> Dict:
+    """
+    Estimated missing-value and outlier percentages and duplicate rate from a sample.
+
+    Entries take the shape of ``detect_anomalies``, with counts scaled to the
+    whole table, a ``confidence_interval`` in percent and ``approximate``.
+    Outlier fences are computed from the sample, and duplicates compare the
+    ``subset`` columns when given.
+    """
+    m = len(sample)
+    report = {}
+    if anomaly_type is None or anomaly_type == 'missing_values':
+        counts = missing_counts(sample)
+        info = {col: _rate_entry('missing', count, m, population_rows, confidence)
+                for col, count in counts.items() if count > 0}
+        report['missing_values'] = info if info else "No missing values detected in the sample."
+    if anomaly_type is None or anomaly_type == 'outliers':
+        columns = [col for col in sample.columns if is_real_numeric(sample[col].dtype)]
+        counts = block_outliers(sample, columns, thresholds)[0] if columns else dict.fromkeys(thresholds, [])
+        entries = {}
+        for method in thresholds:
+            info = {col: _rate_entry('outlier', count, m, population_rows, confidence)
+                    for col, count in zip(columns, counts[method]) if count > 0}
+            entries[method] = info if info else "No outliers detected in the sample."
+        report['outliers'] = entries if by_method else entries[next(iter(thresholds))]
+    if anomaly_type is None or anomaly_type == 'duplicates':
+        keys = sample if subset is None else sample[subset]
+        report['duplicates'] = _duplicate_entry(keys, population_rows, confidence)
+    return report
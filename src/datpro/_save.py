@@ -0,0 +1,115 @@
+import hashlib
+import json
+import os
+from concurrent.futures import Executor
+from typing import Dict, List, Mapping, Optional
+
+import pandas as pd
+
+from datpro import instrumentation
+from datpro._parallel import map_blocks
+
+MANIFEST_SUFFIX = "_manifest.json"
+# Attributes holding the sub-charts of layered and concatenated charts
+_PART_ATTRIBUTES = ('layer', 'hconcat', 'vconcat', 'concat')
+
+
+def _probe(frame: pd.DataFrame) -> pd.DataFrame:
+    """The first valid value of each column, from which Altair infers the same encoding types as from ``frame``."""
+    return pd.DataFrame({col: frame[col].dropna().iloc[:1].reset_index(drop=True) for col in frame.columns})
+
+
+def _strip_data(chart, frames: List[pd.DataFrame]):
+    """
+    A shallow copy of ``chart`` whose inline DataFrames are replaced by one-row probes.
+
+    The replaced frames are appended to ``frames``. The chart itself is not
+    modified, as cached charts may be shared between calls.
+    """
+    chart = chart.copy(deep=False)
+    data = getattr(chart, 'data', None)
+    if isinstance(data, pd.DataFrame):
+        frames.append(data)
+        chart.data = _probe(data)
+    for attribute in _PART_ATTRIBUTES:
+        parts = getattr(chart, attribute, None)
+        if isinstance(parts, list):
+            setattr(chart, attribute, [_strip_data(part, frames) for part in parts])
+    return chart
+
+
+def chart_key(chart) -> str:
+    """
+    SHA-256 key of everything a chart's HTML depends on, without rendering it.
+
+    The key covers the chart's spec with its inline data left out, a hash of
+    each inline DataFrame's values, columns and dtypes, and the Altair
+    version, which determines the HTML template.
+    """
+    import altair as alt
+
+    frames: List[pd.DataFrame] = []
+    spec = _strip_data(chart, frames).to_dict(validate=False)
+    digest = hashlib.sha256()
+    digest.update(alt.__version__.encode("utf-8"))
+    digest.update(json.dumps(spec, sort_keys=True, default=str).encode("utf-8"))
+    for frame in frames:
+        digest.update(repr((list(frame.columns), list(frame.dtypes))).encode("utf-8"))
+        digest.update(pd.util.hash_pandas_object(frame, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def _read_manifest(path: str) -> dict:
+    try:
+        with open(path) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def save_charts(charts: Mapping, save_path: str, file_prefix: str, n_jobs: Optional[int] = None,
+                executor: Optional[Executor] = None, columns: Optional[Dict[str, List]] = None) -> List[str]:
+    """
+    Save every chart to ``{save_path}/{file_prefix}_{name}.html``, skipping unchanged files.
+
+    Each chart gets a ``chart_key``, a hash of its spec and inline data
+    computed without rendering. The keys are kept in
+    ``{save_path}/{file_prefix}_manifest.json``; a chart whose key matches
+    the manifest and whose file still exists is neither rendered nor
+    rewritten, since the HTML is a function of the same spec and data.
+    Charts are built (for a lazy mapping), rendered and written on the
+    worker pool given by ``n_jobs``/``executor``.
+
+    ``columns`` optionally names the columns behind each chart, for the
+    ``save`` instrumentation events. Returns the names of the charts that
+    were written.
+    """
+    manifest_path = os.path.join(save_path, f"{file_prefix}{MANIFEST_SUFFIX}")
+    previous = _read_manifest(manifest_path)
+
+    def save_one(name: str):
+        chart = charts[name]
+        with instrumentation.stage('plotify', 'save', (columns or {}).get(name, ())):
+            key = chart_key(chart)
+            path = os.path.join(save_path, f"{file_prefix}_{name}.html")
+            if previous.get(name) == key and os.path.exists(path):
+                return key, False
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(chart.to_html())
+            return key, True
+
+    names = list(charts)
+    results = map_blocks(save_one, names, n_jobs, executor)
+
+    # Entries for charts not saved this run are kept, so a partial run (e.g.
+    # fewer plot types) does not force a rewrite of the others next time
+    manifest = dict(previous)
+    manifest.update((name, key) for name, (key, _) in zip(names, results))
+    if manifest != previous:
+        # Write to a temporary file first so an interrupted run never leaves a truncated manifest
+        tmp_path = f"{manifest_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, manifest_path)
+    return [name for name, (_, written) in zip(names, results) if written]
@@ -0,0 +1,331 @@
+import numpy as np
+import pandas as pd
+from typing import Optional, Sequence
+
+from datpro._numeric import _lerp
+
+
+class KLLSketch:
+    """
+    Mergeable approximate-quantile sketch (Karnin, Lang and Liberty, 2016).
+
+    Values are kept in a hierarchy of compactors: an item at level ``h``
+    stands for ``2**h`` input values. When a level outgrows its capacity it is
+    sorted and every other item (random offset) is promoted to the next level.
+    Capacities shrink geometrically towards the bottom, so memory is
+    ``O(k)`` regardless of how many values are absorbed. Exact minimum and
+    maximum are tracked separately, and while nothing has been compacted the
+    sketch answers quantile queries exactly.
+
+    Parameters
+    ----------
+    error : float, optional
+        Target normalized rank error, e.g. 0.01 for +/- 1% of the rank.
+        Default is 0.01.
+    seed : int, optional
+        Seed for the compaction coin flips, for reproducible sketches.
+    """
+
+    _DECAY = 2 / 3
+
+    def __init__(self, error: float = 0.01, seed: Optional[int] = None):
+        if not 0 < error < 1:
+            raise ValueError("error must be between 0 and 1.")
+        self.error = error
+        # Empirical KLL error fit from Apache DataSketches: eps = 2.446 / k ** 0.9433
+        self.k = max(8, int(np.ceil((2.446 / error) ** (1 / 0.9433))))
+        self.count = 0
+        self.min = np.nan
+        self.max = np.nan
+        self.levels = [np.empty(0, dtype=np.float64)]
+        self._rng = np.random.default_rng(seed)
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - 1 - level
+        return max(2, int(np.ceil(self.k * self._DECAY ** depth)))
+
+    @property
+    def is_exact(self) -> bool:
+        """True while every absorbed value is still held individually."""
+        return len(self.levels) == 1
+
+    def update(self, values: np.ndarray) -> "KLLSketch":
+        """Absorb an array of values; NaNs are ignored."""
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return self
+        self.count += values.size
+        self.min = np.fmin(self.min, values.min())
+        self.max = np.fmax(self.max, values.max())
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+        return self
+
+    def merge(self, other: "KLLSketch") -> "KLLSketch":
+        """Fold another sketch into this one in place."""
+        if other.count == 0:
+            return self
+        self.count += other.count
+        self.min = np.fmin(self.min, other.min)
+        self.max = np.fmax(self.max, other.max)
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0, dtype=np.float64))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self._compress()
+        return self
+
+    def _compress(self) -> None:
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if items.size > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0, dtype=np.float64))
+                items = np.sort(items)
+                # An odd item out stays behind so total weight is preserved
+                keep = items[:items.size % 2]
+                paired = items[items.size % 2:]
+                promoted = paired[self._rng.integers(2)::2]
+                self.levels[level] = keep
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            level += 1
+
+    def _weighted_items(self):
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([
+            np.full(level_items.size, 2 ** level, dtype=np.int64)
+            for level, level_items in enumerate(self.levels)
+        ])
+        order = np.argsort(items, kind='stable')
+        return items[order], weights[order]
+
+    def quantiles(self, levels: Sequence[float]) -> np.ndarray:
+        """
+        Estimate quantiles at the given levels.
+
+        Levels 0 and 1 always return the exact minimum and maximum. Exact
+        sketches interpolate linearly like ``pandas.Series.quantile``.
+        """
+        levels = np.asarray(levels, dtype=np.float64)
+        if self.count == 0:
+            return np.full(levels.shape, np.nan)
+        if self.is_exact:
+            values = np.sort(self.levels[0])
+            position = levels * (values.size - 1)
+            below = np.floor(position).astype(np.intp)
+            above = np.minimum(below + 1, values.size - 1)
+            with np.errstate(invalid='ignore'):
+                result = _lerp(values[below], values[above], position - below)
+        else:
+            items, weights = self._weighted_items()
+            cumulative = np.cumsum(weights)
+            target = levels * (self.count - 1)
+            index = np.searchsorted(cumulative, target, side='right')
+            result = items[np.minimum(index, items.size - 1)]
+        result = np.where(levels == 0.0, self.min, result)
+        return np.where(levels == 1.0, self.max, result)
+
+    def rank(self, values: Sequence[float], inclusive: bool = False) -> np.ndarray:
+        """Estimate how many absorbed values are below (or at most) each value."""
+        values = np.asarray(values, dtype=np.float64)
+        items, weights = self._weighted_items()
+        cumulative = np.concatenate([[0], np.cumsum(weights)])
+        side = 'right' if inclusive else 'left'
+        return cumulative[np.searchsorted(items, values, side=side)]
+
+
+class RowHashSet:
+    """
+    Exact set of 64-bit row fingerprints.
+
+    Fingerprints are stored as a few sorted, disjoint uint64 runs whose sizes
+    roughly double, like a binary counter, so inserting ``n`` hashes costs
+    ``O(n log n)`` overall and memory stays at 8 bytes per distinct row.
+    """
+
+    def __init__(self):
+        self.runs = []
+
+    def __len__(self) -> int:
+        return sum(run.size for run in self.runs)
+
+    def add(self, hashes: np.ndarray) -> int:
+        """Insert fingerprints and return how many were already present or repeated."""
+        hashes = np.sort(np.asarray(hashes, dtype=np.uint64))
+        if hashes.size == 0:
+            return 0
+        unique = hashes[np.concatenate([[True], hashes[1:] != hashes[:-1]])]
+        fresh = np.ones(unique.size, dtype=bool)
+        for run in self.runs:
+            position = np.minimum(np.searchsorted(run, unique), run.size - 1)
+            fresh &= run[position] != unique
+        self._push(unique[fresh])
+        return int(hashes.size - fresh.sum())
+
+    def merge(self, other: "RowHashSet") -> int:
+        """Fold another set into this one and return how many fingerprints they shared."""
+        shared = 0
+        for run in other.runs:
+            shared += self.add(run)
+        return shared
+
+    def _push(self, run: np.ndarray) -> None:
+        if run.size == 0:
+            return
+        while self.runs and self.runs[-1].size <= run.size:
+            run = np.sort(np.concatenate([self.runs.pop(), run]))
+        self.runs.append(run)
+
+
+def _bit_length(values: np.ndarray) -> np.ndarray:
+    """Vectorized ``int.bit_length`` for uint64 arrays."""
+    length = np.zeros(values.shape, dtype=np.uint8)
+    for shift in (32, 16, 8, 4, 2, 1):
+        high = values >> np.uint64(shift)
+        has_high = high != 0
+        length += has_high.view(np.uint8) * np.uint8(shift)
+        values = np.where(has_high, high, values)
+    return length + (values != 0).view(np.uint8)
+
+
+class HyperLogLog:
+    """
+    Fixed-size distinct-count sketch (Flajolet et al., 2007).
+
+    Each 64-bit hash selects one of ``2**precision`` one-byte registers with
+    its top bits and records the position of the first set bit in the rest.
+    Memory is ``2**precision`` bytes (16 KiB by default) whatever the input
+    size, and two sketches with the same precision merge by taking the
+    register-wise maximum.
+
+    Parameters
+    ----------
+    precision : int, optional
+        Number of index bits, between 4 and 18. The relative standard error
+        of the estimate is ``1.04 / sqrt(2**precision)``, about 0.8% for the
+        default of 14.
+    """
+
+    def __init__(self, precision: int = 14):
+        if not 4 <= precision <= 18:
+            raise ValueError("precision must be between 4 and 18.")
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    @property
+    def relative_error(self) -> float:
+        """Relative standard error of ``estimate()``."""
+        return 1.04 / np.sqrt(self.registers.size)
+
+    def update(self, hashes: np.ndarray) -> "HyperLogLog":
+        """Absorb an array of uint64 hashes."""
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        if hashes.size == 0:
+            return self
+        index = (hashes >> np.uint64(64 - self.precision)).astype(np.intp)
+        remainder = hashes << np.uint64(self.precision)
+        rank = np.minimum(65 - _bit_length(remainder).astype(np.int64), 65 - self.precision)
+        np.maximum.at(self.registers, index, rank.astype(np.uint8))
+        return self
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        """Fold another sketch of the same precision into this one in place."""
+        if other.precision != self.precision:
+            raise ValueError("Only sketches with the same precision can be merged.")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def estimate(self) -> float:
+        """Estimated number of distinct hashes absorbed so far."""
+        m = self.registers.size
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * m and zeros:
+            # Linear counting is more accurate while many registers are empty
+            return float(m * np.log(m / zeros))
+        return float(raw)
+
+
+class SpaceSaving:
+    """
+    Top-k heavy hitters of a stream of values (Metwally et al., 2005).
+
+    At most ``capacity`` values are monitored, each with an estimated count
+    and the most it can overstate the true count. Any value frequent enough
+    to exceed ``total / capacity`` occurrences is always among them. Chunks
+    are absorbed as exact value counts, and two sketches merge by adding
+    counts, charging values one side does not monitor with that side's
+    smallest count (Agarwal et al., 2012), so partitions can be profiled
+    separately.
+
+    Parameters
+    ----------
+    capacity : int, optional
+        Number of monitored values. Memory is proportional to it. Default is 1,000.
+    """
+
+    def __init__(self, capacity: int = 1000):
+        if capacity < 1:
+            raise ValueError("capacity must be a positive integer.")
+        self.capacity = capacity
+        self.counts = pd.Series(dtype=np.int64)
+        self.errors = pd.Series(dtype=np.int64)
+        self.total = 0
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    @property
+    def _floor(self) -> int:
+        """Largest count a value not monitored can have: the smallest monitored count once full."""
+        return int(self.counts.min()) if len(self.counts) >= self.capacity else 0
+
+    def update(self, values: pd.Series) -> "SpaceSaving":
+        """Absorb a chunk of values; missing values are counted as one value."""
+        return self.update_counts(pd.Series(values).value_counts(dropna=False, sort=False))
+
+    def update_counts(self, counts: pd.Series) -> "SpaceSaving":
+        """Absorb exact counts of values, given as a Series indexed by value."""
+        counts = counts.astype(np.int64)
+        # Unobserved categories count zero; an object index lets chunks of any dtype align
+        counts = counts[counts > 0]
+        counts.index = pd.Index(counts.index.to_numpy(dtype=object), dtype=object)
+        chunk = SpaceSaving(max(self.capacity, len(counts)))
+        chunk.counts, chunk.errors, chunk.total = counts, pd.Series(0, index=counts.index), int(counts.sum())
+        return self.merge(chunk)
+
+    def merge(self, other: "SpaceSaving") -> "SpaceSaving":
+        """Fold another sketch into this one in place, keeping this sketch's capacity."""
+        if len(other.counts) == 0:
+            return self
+        if len(self.counts) == 0:
+            counts, errors = other.counts, other.errors
+        else:
+            values = self.counts.index.union(other.counts.index, sort=False)
+            own_floor, other_floor = self._floor, other._floor
+            counts = (self.counts.reindex(values, fill_value=own_floor)
+                      + other.counts.reindex(values, fill_value=other_floor))
+            errors = (self.errors.reindex(values, fill_value=own_floor)
+                      + other.errors.reindex(values, fill_value=other_floor))
+        if len(counts) > self.capacity:
+            counts = counts.nlargest(self.capacity, keep='first')
+            errors = errors.reindex(counts.index)
+        self.counts, self.errors = counts, errors
+        self.total += other.total
+        return self
+
+    def top(self, k: int) -> pd.DataFrame:
+        """
+        The ``k`` most frequent values: ``value``, ``count`` and ``error``.
+
+        Each true count lies between ``count - error`` and ``count``; the
+        counts are exact while fewer than ``capacity`` distinct values have
+        been seen.
+        """
+        counts = self.counts.nlargest(k, keep='first') if k < len(self.counts) else (
+            self.counts.sort_values(ascending=False, kind='stable'))
+        return pd.DataFrame({'value': counts.index, 'count': counts.to_numpy(),
+                             'error': self.errors.reindex(counts.index).to_numpy()})
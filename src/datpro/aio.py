@@ -0,0 +1,183 @@
+"""
+Asyncio counterparts of ``summarize_data``, ``detect_anomalies`` and ``plotify``.
+
+The profiling work runs on an executor, so the event loop stays free. An
+``AsyncProfiler`` caps how many calls run at once: further calls wait for a
+slot (backpressure) or, past ``max_pending`` waiters, are rejected with
+``ProfilerBusyError`` so a service can shed load. Cancelling the awaiting
+task stops the work at its next column block or chart; the slot is held
+until the worker has actually stopped, so cancelled calls never push the
+number of running calls over the limit.
+"""
+import asyncio
+import contextvars
+import os
+import threading
+import weakref
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+from typing import Callable, Dict, Optional
+
+import pandas as pd
+
+from datpro._parallel import cancel_event
+
+
+class ProfilerBusyError(RuntimeError):
+    """Raised when a call would exceed an ``AsyncProfiler``'s ``max_pending`` waiting calls."""
+
+
+class AsyncProfiler:
+    """
+    Runs datpro's profiling functions off the event loop under a concurrency limit.
+
+    Parameters
+    ----------
+    max_concurrency : int, optional
+        Largest number of calls running at once in each event loop. Default
+        is None (the number of CPUs).
+    executor : concurrent.futures.Executor, optional
+        Where the work runs. Default is None (the loop's default thread
+        pool). With a ``ProcessPoolExecutor`` the input is pickled to the
+        worker, and cancellation only prevents calls that have not started.
+    max_pending : int, optional
+        Largest number of calls waiting for a slot; further calls raise
+        ``ProfilerBusyError`` immediately. Default is None (no limit).
+
+    Example
+    -------
+    >>> profiler = AsyncProfiler(max_concurrency=2, max_pending=16)
+    >>> async def handler(df):
+    ...     return await profiler.detect_anomalies(df, anomaly_type='missing_values')
+    """
+
+    def __init__(self, max_concurrency: Optional[int] = None, executor: Optional[Executor] = None,
+                 max_pending: Optional[int] = None):
+        max_concurrency = max_concurrency or os.cpu_count() or 1
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be a positive integer.")
+        self.max_concurrency = max_concurrency
+        self.executor = executor
+        self.max_pending = max_pending
+        # asyncio primitives belong to one loop, so each loop gets its own slots
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self.pending = 0
+        self.running = 0
+
+    def __repr__(self) -> str:
+        return (f"AsyncProfiler(max_concurrency={self.max_concurrency}, "
+                f"{self.running} running, {self.pending} pending)")
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if loop not in self._semaphores:
+            self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphores[loop]
+
+    async def run(self, func: Callable, *args, **kwargs):
+        """Run ``func(*args, **kwargs)`` on the executor once a slot is free, and return its result."""
+        semaphore = self._semaphore()
+        if semaphore.locked() and self.max_pending is not None and self.pending >= self.max_pending:
+            raise ProfilerBusyError(f"{self.pending} profiling calls are already waiting.")
+        self.pending += 1
+        try:
+            await semaphore.acquire()
+        finally:
+            self.pending -= 1
+        self.running += 1
+        try:
+            return await self._execute(partial(func, *args, **kwargs))
+        finally:
+            self.running -= 1
+            semaphore.release()
+
+    async def _execute(self, call: Callable):
+        loop = asyncio.get_running_loop()
+        if isinstance(self.executor, ProcessPoolExecutor):
+            return await loop.run_in_executor(self.executor, call)
+        event = threading.Event()
+        context = contextvars.copy_context()
+        context.run(cancel_event.set, event)
+        future = loop.run_in_executor(self.executor, context.run, call)
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            event.set()
+            # Keep the slot until the worker reaches a checkpoint and stops
+            await asyncio.wait([future])
+            raise
+
+    async def summarize_data(self, df: pd.DataFrame, **kwargs) -> pd.DataFrame:
+        """``summarize_data`` without blocking the event loop; keyword arguments are passed through."""
+        from datpro.datpro import summarize_data
+
+        return await self.run(summarize_data, df, **kwargs)
+
+    async def detect_anomalies(self, df: pd.DataFrame, **kwargs) -> Dict:
+        """``detect_anomalies`` without blocking the event loop; keyword arguments are passed through."""
+        from datpro.datpro import detect_anomalies
+
+        return await self.run(detect_anomalies, df, **kwargs)
+
+    async def plotify(self, df: pd.DataFrame, **kwargs) -> Dict:
+        """
+        ``plotify`` without blocking the event loop; keyword arguments are passed through.
+
+        Charts are always built (and saved, with ``save=True``) on the
+        executor, so ``lazy`` is ignored.
+        """
+        from datpro.datpro import plotify
+
+        kwargs['lazy'] = False
+        return await self.run(plotify, df, **kwargs)
+
+
+_default = AsyncProfiler()
+
+
+def configure(max_concurrency: Optional[int] = None, executor: Optional[Executor] = None,
+              max_pending: Optional[int] = None) -> AsyncProfiler:
+    """
+    Replace the profiler used by ``summarize_data_async``, ``detect_anomalies_async`` and ``plotify_async``.
+
+    Takes the parameters of ``AsyncProfiler`` and returns the new profiler.
+    Calls already running keep their slots in the previous one.
+    """
+    global _default
+    _default = AsyncProfiler(max_concurrency, executor, max_pending)
+    return _default
+
+
+async def summarize_data_async(df: pd.DataFrame, **kwargs) -> pd.DataFrame:
+    """
+    Asynchronous ``summarize_data``, run by the shared profiler (see ``configure``).
+
+    Example
+    -------
+    >>> summary = await summarize_data_async(df, n_jobs=2)
+    """
+    return await _default.summarize_data(df, **kwargs)
+
+
+async def detect_anomalies_async(df: pd.DataFrame, **kwargs) -> Dict:
+    """
+    Asynchronous ``detect_anomalies``, run by the shared profiler (see ``configure``).
+
+    Example
+    -------
+    >>> report = await detect_anomalies_async(df, anomaly_type='outliers')
+    """
+    return await _default.detect_anomalies(df, **kwargs)
+
+
+async def plotify_async(df: pd.DataFrame, **kwargs) -> Dict:
+    """
+    Asynchronous ``plotify``, run by the shared profiler (see ``configure``).
+
+    Example
+    -------
+    >>> charts = await plotify_async(df, plot_types=['histogram'], save=True)
+    """
+    return await _default.plotify(df, **kwargs)
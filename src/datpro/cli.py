@@ -0,0 +1,240 @@
+"""
+``datpro`` command: profile many CSV/Parquet files in parallel worker processes.
+
+Each worker process imports datpro once and then profiles file after file,
+so a nightly batch pays the interpreter and import startup once per worker
+rather than once per file. Every file gets a JSON report with its summary
+table and anomaly report (and the paths of saved charts with ``--plots``);
+``index.json`` lists every file with its status. Failures, including a
+worker running out of its ``--max-memory`` budget, are recorded per file
+and make the command exit with status 1.
+
+Examples
+--------
+::
+
+    $ datpro "lake/2024-*/*.parquet" data/*.csv --output reports --workers 8 --max-memory 4096
+    $ datpro big.csv --stream --anomaly-type duplicates --output - | jq .anomalies
+"""
+import argparse
+import glob
+import json
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from datpro._io import file_format
+
+PLOT_TYPES = ['histogram', 'density', 'bar', 'scatter', 'correlation', 'box', 'stacked_bar']
+
+
+def _jsonable(value):
+    """Convert numpy scalars, tuples and non-finite floats into plain JSON values."""
+    if isinstance(value, dict):
+        return {str(key): _jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(item) for item in value]
+    if isinstance(value, np.ndarray):
+        return _jsonable(value.tolist())
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    if isinstance(value, (pd.Timedelta, pd.Timestamp)):
+        return str(value)
+    return value
+
+
+def expand_paths(patterns: List[str]) -> List[str]:
+    """Expand glob patterns (``**`` matches any depth) into a sorted, de-duplicated list of files."""
+    files = {}
+    for pattern in patterns:
+        matches = glob.glob(pattern, recursive=True) if glob.has_magic(pattern) else [pattern]
+        for path in sorted(matches):
+            if os.path.isfile(path):
+                files.setdefault(os.path.abspath(path), path)
+    return list(files.values())
+
+
+def _report_names(paths: List[str]) -> Dict[str, str]:
+    """A distinct report file name per input: its base name, numbered when base names repeat."""
+    names = {}
+    used = set()
+    for path in paths:
+        base = name = os.path.basename(path)
+        n = 1
+        while name in used:
+            name = f"{base}-{n}"
+            n += 1
+        used.add(name)
+        names[path] = f"{name}.json"
+    return names
+
+
+def _limit_memory(max_memory_mb: Optional[int]) -> None:
+    """Worker initializer: cap the address space so oversized files fail with MemoryError."""
+    if not max_memory_mb:
+        return
+    try:
+        import resource
+    except ImportError:  # Windows has no rlimits
+        return
+    limit = int(max_memory_mb) * 1024 ** 2
+    resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def _read(path: str) -> pd.DataFrame:
+    if file_format(path) == 'csv':
+        return pd.read_csv(path)
+    if file_format(path) == 'parquet':
+        return pd.read_parquet(path)
+    raise ValueError(f"Unsupported file type: {path}. Expected a CSV or Parquet file.")
+
+
+def profile_file(path: str, options: Dict) -> Dict:
+    """
+    Profile one file and return its JSON-ready record.
+
+    ``options`` holds the parsed command-line options. Errors are caught and
+    recorded, so one bad file does not stop the batch.
+    """
+    from datpro.datpro import detect_anomalies, plotify, summarize_data
+    from datpro.streaming import detect_anomalies_stream, summarize_stream
+
+    start = time.perf_counter()
+    record = {"path": path, "status": "ok", "rows": None, "summary": None, "anomalies": None}
+    sampling = {"sample": options["sample"], "random_state": options["seed"]} if options["sample"] else {}
+    try:
+        if options["stream"]:
+            try:
+                summary = summarize_stream(path, options["chunksize"], **sampling)
+            except ValueError as e:
+                summary, record["summary_note"] = None, str(e)
+            record["anomalies"] = detect_anomalies_stream(path, options["anomaly_type"], options["chunksize"],
+                                                          **sampling)
+        else:
+            df = _read(path)
+            record["rows"], record["columns"] = len(df), [str(col) for col in df.columns]
+            try:
+                summary = summarize_data(df, n_jobs=options["n_jobs"], **sampling)
+            except ValueError as e:
+                summary, record["summary_note"] = None, str(e)
+            record["anomalies"] = detect_anomalies(df, options["anomaly_type"], n_jobs=options["n_jobs"],
+                                                   **sampling)
+            if options["plots"]:
+                plot_dir = os.path.join(options["output"], os.path.splitext(options["report_name"])[0] + "_plots")
+                charts = plotify(df, plot_types=options["plots"], save=True, save_path=plot_dir,
+                                 file_prefix="plot", aggregate=True, lazy=True)
+                record["plots"] = [os.path.join(plot_dir, f"plot_{name}.html") for name in charts]
+        if summary is not None:
+            if isinstance(summary.columns, pd.MultiIndex):
+                # Quick-profile summaries nest estimate/lower/upper under each statistic
+                record["summary"] = {
+                    str(col): {stat: summary.loc[col, stat].to_dict() for stat in summary.columns.levels[0]}
+                    for col in summary.index
+                }
+                record["approximate"] = summary.attrs.get("approximate", True)
+            else:
+                record["summary"] = summary.to_dict(orient="index")
+    except MemoryError:
+        record["status"] = "error"
+        record["error"] = "MemoryError: the file does not fit in the worker's memory limit; try --stream."
+    except Exception as e:  # noqa: BLE001 - every failure is reported per file
+        record["status"] = "error"
+        record["error"] = f"{type(e).__name__}: {e}"
+    record["seconds"] = round(time.perf_counter() - start, 4)
+    return _jsonable(record)
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="datpro",
+        description="Profile CSV and Parquet files in parallel and write JSON reports."
+    )
+    parser.add_argument("paths", nargs="+", help="Files or glob patterns (quote them; '**' matches any depth).")
+    parser.add_argument("-o", "--output", default="datpro_reports",
+                        help="Directory for the reports, or '-' to print one JSON record per line "
+                             "(default: datpro_reports).")
+    parser.add_argument("-w", "--workers", type=int, default=None,
+                        help="Worker processes (default: number of CPUs, at most one per file).")
+    parser.add_argument("--max-memory", type=int, default=None, metavar="MB",
+                        help="Address-space limit per worker in MiB; files that exceed it are reported "
+                             "as errors (Unix only).")
+    parser.add_argument("--anomaly-type", choices=['missing_values', 'outliers', 'duplicates'], default=None,
+                        help="Only check this anomaly type (default: all).")
+    parser.add_argument("--plots", nargs="*", choices=PLOT_TYPES, default=None, metavar="TYPE",
+                        help="Also save aggregated HTML charts of these types (all types if none given).")
+    parser.add_argument("--stream", action="store_true",
+                        help="Read each file in chunks with the streaming functions, in bounded memory.")
+    parser.add_argument("--chunksize", type=int, default=None, help="Rows per chunk with --stream.")
+    parser.add_argument("--sample", type=int, default=None, metavar="ROWS",
+                        help="Quick-profile mode: estimate from a random sample of this many rows.")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for --sample.")
+    parser.add_argument("--n-jobs", type=int, default=None,
+                        help="Threads per worker for column blocks (default: serial).")
+    parser.add_argument("-q", "--quiet", action="store_true", help="Do not print progress to stderr.")
+    args = parser.parse_args(argv)
+    if args.plots is not None and args.stream:
+        parser.error("--plots needs the whole file in memory and cannot be combined with --stream.")
+    if args.plots is not None and args.output == "-":
+        parser.error("--plots needs an output directory.")
+    if args.plots == []:
+        args.plots = PLOT_TYPES
+    return args
+
+
+def main(argv=None) -> int:
+    """Entry point of the ``datpro`` console script; returns the exit status."""
+    args = parse_args(argv)
+    paths = expand_paths(args.paths)
+    if not paths:
+        print("datpro: no files match the given paths.", file=sys.stderr)
+        return 1
+    to_stdout = args.output == "-"
+    if not to_stdout:
+        os.makedirs(args.output, exist_ok=True)
+    names = _report_names(paths)
+    options = {key: getattr(args, key) for key in
+               ("output", "anomaly_type", "plots", "stream", "chunksize", "sample", "seed", "n_jobs")}
+
+    workers = min(args.workers or os.cpu_count() or 1, len(paths))
+    index = []
+    failed = 0
+    with ProcessPoolExecutor(max_workers=workers, initializer=_limit_memory,
+                             initargs=(args.max_memory,)) as pool:
+        futures = {pool.submit(profile_file, path, {**options, "report_name": names[path]}): path
+                   for path in paths}
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                record = future.result()
+            except Exception as e:  # noqa: BLE001 - a worker killed by the OS ends up here
+                record = {"path": path, "status": "error", "error": f"{type(e).__name__}: {e}"}
+            failed += record["status"] != "ok"
+            if to_stdout:
+                print(json.dumps(record), flush=True)
+            else:
+                report = os.path.join(args.output, names[path])
+                with open(report, "w") as f:
+                    json.dump(record, f, indent=2)
+                index.append({"path": path, "status": record["status"], "report": names[path],
+                              "seconds": record.get("seconds"), "error": record.get("error")})
+            if not args.quiet:
+                status = record["status"] if record["status"] == "ok" else f"error ({record['error']})"
+                print(f"datpro: {path}: {status}", file=sys.stderr)
+
+    if not to_stdout:
+        index.sort(key=lambda entry: entry["path"])
+        with open(os.path.join(args.output, "index.json"), "w") as f:
+            json.dump({"files": index, "failed": failed}, f, indent=2)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,36 @@
 import pandas as pd
 import numpy as np
-import altair as alt
+from concurrent.futures import Executor
+from functools import partial
 from itertools import combinations
-from typing import Dict, Union, Optional, List
+from typing import TYPE_CHECKING, Dict, Union, Optional, List
 
-def summarize_data(df: pd.DataFrame) -> pd.DataFrame:
+from datpro import instrumentation
+from datpro._arrow import (
+    as_arrow_table, summarize_table, table_duplicate_count, table_missing_counts, table_outliers
+)
+from datpro._cache import ProfileCache
+from datpro._compact import compact_dataframe
+from datpro._lazy import LazyCharts
+from datpro._missing import missing_counts
+from datpro._numeric import (
+    SUMMARY_LABELS, block_outliers, block_quantiles, column_groups, encode_mask, resolve_outlier_methods,
+    series_outlier_mask, split_columns
+)
+from datpro._parallel import check_executor, checkpoint, map_blocks, worker_count
+from datpro._hashing import row_hashes
+from datpro._minhash import near_duplicate_clusters
+from datpro._report import (
+    approximate_duplicate_report, duplicate_report, missing_report, near_duplicate_report, outlier_entries
+)
+from datpro._sampling import check_sampling, sample_frame, sampled_anomalies, sampled_summary
+from datpro._save import save_charts
+from datpro._sketches import HyperLogLog
+
+if TYPE_CHECKING:
+    import altair as alt
+
+def summarize_data(df: pd.DataFrame, n_jobs: Optional[int] = None, executor: Optional[Executor] = None, cache: Optional[ProfileCache] = None, sample: Optional[int] = None, fraction: Optional[float] = None, stratify: Optional[str] = None, confidence: float = 0.95, random_state: Optional[int] = None) -> pd.DataFrame:
     """
     Summarizes numeric columns in a given DataFrame by calculating key statistical metrics.
 
@@ -14,14 +40,47 @@ def summarize_data(df: pd.DataFrame) -> pd.DataFrame:
 
     Parameters
     ----------
-    df : pandas.DataFrame
-        The input DataFrame containing data to be summarized.
+    df : pandas.DataFrame or Arrow-compatible table
+        The input DataFrame containing data to be summarized. A
+        ``pyarrow.Table``/``RecordBatch``, a Polars DataFrame or any object
+        exporting ``__arrow_c_stream__`` is profiled straight from its Arrow
+        buffers, without conversion to pandas; its integer and floating-point
+        columns are summarized.
+    n_jobs : int, optional
+        Number of threads used to summarize blocks of columns concurrently.
+        -1 uses every CPU. Default is None (serial).
+    executor : concurrent.futures.ThreadPoolExecutor, optional
+        A thread pool to run the column blocks on instead of creating one.
+        Other executors, such as process pools, raise ``TypeError``.
+    cache : ProfileCache, optional
+        Reuse per-column statistics from earlier calls on columns with the
+        same content, and store the ones computed now. Applies to pandas
+        input only. Default is None.
+    sample : int, optional
+        Quick-profile mode: estimate the statistics from a random sample of
+        this many rows, so the time taken depends on the sample size rather
+        than on the table. Default is None (use every row).
+    fraction : float, optional
+        Like ``sample``, with the sample size given as a fraction of the rows.
+    stratify : str, optional
+        Column whose groups are sampled in proportion to their size (at least
+        one row each), so small groups are represented. Default is None.
+    confidence : float, optional
+        Confidence level of the intervals reported in quick-profile mode.
+        Default is 0.95.
+    random_state : int, optional
+        Seed for the sample, for reproducible results.
 
     Returns
     -------
     pandas.DataFrame
         A DataFrame where each row corresponds to a numeric column in the input DataFrame,
         and the columns represent the calculated statistics: min, 25%, 50% (median), 75%, and max.
+        In quick-profile mode each statistic has 'estimate', 'lower' and
+        'upper' sub-columns, the quartile intervals being distribution-free
+        and those of min and max open on the outer side, and ``attrs``
+        records ``approximate``, ``sample_rows``, ``population_rows`` and
+        ``confidence``. Only integer and floating-point columns are estimated.
 
     Example
     -------
@@ -40,46 +99,264 @@ def summarize_data(df: pd.DataFrame) -> pd.DataFrame:
     C    1.0   1.0   1.0   50.5  100.0
     """
 
+    check_executor(executor)
+    if sample is not None or fraction is not None:
+        rows, total_rows = _draw_sample(df, sample, fraction, stratify, confidence, random_state)
+        return sampled_summary(rows, total_rows, confidence)
+
 	# Check if input is a DataFrame
     if not isinstance(df, pd.DataFrame):
-        raise TypeError("Input must be a pandas DataFrame.")
+        table = as_arrow_table(df)
+        if table is None:
+            raise TypeError("Input must be a pandas DataFrame or an Arrow-compatible table.")
+        return summarize_table(table, n_jobs, executor)
 
     # Check if DataFrame is empty
     if df.empty:
         raise ValueError("The input DataFrame is empty.")
 
-    # Select numeric columns
-    numeric_cols = df.select_dtypes(include=['number'])
+    # Select numeric columns (on an empty slice, so no data is copied)
+    numeric_cols = df.iloc[:0].select_dtypes(include=['number']).columns
 
     # Check if there are numeric columns
     if numeric_cols.empty:
         raise ValueError("The DataFrame contains no numeric columns.")
 
-    # Calculate summary statistics
-    summary = numeric_cols.describe(percentiles=[0.25, 0.5, 0.75]).T
+    if cache is not None and df.columns.is_unique:
+        # Only columns whose content changed since they were cached are summarized
+        def summary_rows(cols):
+            summary = summarize_data(df[cols], n_jobs, executor)
+            return {col: summary.loc[[col]] for col in cols}
+
+        fingerprints = cache.fingerprints(df, numeric_cols)
+        rows = cache.per_column('summarize_data', list(numeric_cols), fingerprints, summary_rows)
+        return pd.concat(list(rows.values()))
+
+    if not df.columns.is_unique:
+        # Blocks are keyed by label, so repeated labels keep pandas' own statistics
+        return df.select_dtypes(include=['number']).describe(percentiles=[0.25, 0.5, 0.75]).T[SUMMARY_LABELS]
+
+    # Calculate summary statistics in one sorted pass per block of columns
+    real_cols, other_cols = split_columns(df, numeric_cols)
+    # With hooks registered, each column is its own block so events can name the slow one
+    n_groups = len(real_cols) if instrumentation.enabled() else worker_count(n_jobs, executor)
+    groups = column_groups(len(df), real_cols, n_groups)
 
-    # Select relevant statistics
-    summary = summary[['min', '25%', '50%', '75%', 'max']]
+    def quantiles(cols):
+        with instrumentation.stage('summarize_data', 'quantiles', cols, len(df)):
+            return block_quantiles(df, cols)
+
+    stats = map_blocks(quantiles, groups, n_jobs, executor)
+    parts = [
+        pd.DataFrame(quantiles.T, index=group, columns=SUMMARY_LABELS)
+        for group, quantiles in zip(groups, stats)
+    ]
+
+    # Timedelta and complex columns keep pandas' own statistics
+    if other_cols:
+        with instrumentation.stage('summarize_data', 'describe', other_cols, len(df)):
+            parts.append(df[other_cols].describe(percentiles=[0.25, 0.5, 0.75]).T[SUMMARY_LABELS])
+
+    summary = pd.concat(parts) if len(parts) > 1 else parts[0]
+    summary = summary.reindex(numeric_cols)
 
     return summary
 
-def detect_anomalies(df: pd.DataFrame, anomaly_type: Optional[str] = None) -> Dict[str, Union[Dict[str, Dict[str, Union[int, float]]], str]]:
+def _draw_sample(df, sample: Optional[int], fraction: Optional[float], stratify: Optional[str],
+                 confidence: float, random_state: Optional[int]) -> tuple:
+    """Validate the quick-profile options and sample the rows of a DataFrame or Arrow table."""
+    check_sampling(sample, fraction, confidence)
+    if not isinstance(df, pd.DataFrame):
+        df = as_arrow_table(df)
+        if df is None:
+            raise TypeError("Input must be a pandas DataFrame or an Arrow-compatible table.")
+    if len(df) == 0:
+        raise ValueError("The input DataFrame is empty.")
+    return sample_frame(df, sample, fraction, stratify, random_state), len(df)
+
+def _missing_counts(df: pd.DataFrame, columns, n_groups: int, n_jobs: Optional[int],
+                    executor: Optional[Executor]) -> pd.Series:
+    """Count missing values of ``columns``, checking blocks of columns concurrently."""
+    groups = column_groups(len(df), columns, n_groups)
+    if not groups or (n_groups <= 1 and not instrumentation.enabled()):
+        # Serially, blocks would only add overhead
+        return missing_counts(df, columns)
+
+    def count(cols):
+        with instrumentation.stage('detect_anomalies', 'missing_values', cols, len(df)):
+            return missing_counts(df, cols)
+
+    return pd.concat(map_blocks(count, groups, n_jobs, executor))
+
+def _outlier_counts(df: pd.DataFrame, columns, n_groups: int, n_jobs: Optional[int],
+                    executor: Optional[Executor], thresholds: Optional[Dict[str, float]] = None,
+                    masks: Optional[str] = None) -> tuple:
+    """
+    Count values of each numeric column outside the fences of each outlier method, in column order.
+
+    Returns ``(counts, masks)``: per column, a dict from method to count and,
+    if ``masks`` is given, a dict from method to encoded row mask.
+    """
+    thresholds = thresholds or {'iqr': 1.5}
+    if len(df) == 0:
+        # No rows to sort, and no outliers
+        empty = np.zeros(0, dtype=bool)
+        return ({col: dict.fromkeys(thresholds, 0) for col in columns},
+                {col: {method: encode_mask(empty, masks) for method in thresholds} for col in columns}
+                if masks else None)
+    outlier_counts = {}
+    outlier_masks = {} if masks else None
+    real_cols, other_cols = split_columns(df, columns)
+    groups = column_groups(len(df), real_cols, n_groups)
+
+    def count(cols):
+        with instrumentation.stage('detect_anomalies', 'outliers', cols, len(df)):
+            return block_outliers(df, cols, thresholds, masks)
+
+    for group, (counts, group_masks) in zip(groups, map_blocks(count, groups, n_jobs, executor)):
+        for i, col in enumerate(group):
+            outlier_counts[col] = {method: int(counts[method][i]) for method in thresholds}
+            if masks:
+                outlier_masks[col] = {method: group_masks[method][i] for method in thresholds}
+    for col in other_cols:
+        with instrumentation.stage('detect_anomalies', 'outliers', [col], len(df)):
+            col_masks = {method: series_outlier_mask(df[col], method, t).to_numpy()
+                         for method, t in thresholds.items()}
+        outlier_counts[col] = {method: int(mask.sum()) for method, mask in col_masks.items()}
+        if masks:
+            outlier_masks[col] = {method: encode_mask(mask, masks) for method, mask in col_masks.items()}
+    order = [col for col in columns if col in outlier_counts]
+    return ({col: outlier_counts[col] for col in order},
+            None if outlier_masks is None else {col: outlier_masks[col] for col in order})
+
+def _detect_table_anomalies(table, anomaly_type: Optional[str], thresholds: Dict[str, float],
+                            by_method: bool, masks: Optional[str], n_jobs: Optional[int],
+                            executor: Optional[Executor], subset: Optional[List] = None) -> Dict:
+    """``detect_anomalies`` for an Arrow table, reading its buffers directly."""
+    report = {}
+    total_rows = table.num_rows
+    if anomaly_type is None or anomaly_type == 'missing_values':
+        report['missing_values'] = missing_report(table_missing_counts(table, table.column_names), total_rows)
+    if anomaly_type is None or anomaly_type == 'outliers':
+        counts, column_masks = table_outliers(table, thresholds, masks, n_jobs, executor)
+        report.update(outlier_entries(counts, column_masks, list(thresholds), by_method, total_rows))
+    if anomaly_type is None or anomaly_type == 'duplicates':
+        keys = table if subset is None else table.select(subset)
+        with instrumentation.stage('detect_anomalies', 'duplicates', keys.column_names, total_rows):
+            report['duplicates'] = duplicate_report(table_duplicate_count(keys), total_rows)
+    return report
+
+def detect_anomalies(df: pd.DataFrame, anomaly_type: Optional[str] = None, approximate_duplicates: bool = False, precision: int = 14, n_jobs: Optional[int] = None, executor: Optional[Executor] = None, cache: Optional[ProfileCache] = None, outlier_method: Union[str, List[str]] = 'iqr', outlier_threshold: Optional[Union[float, Dict[str, float]]] = None, outlier_masks: Optional[str] = None, sample: Optional[int] = None, fraction: Optional[float] = None, stratify: Optional[str] = None, confidence: float = 0.95, random_state: Optional[int] = None, compact: bool = False, subset: Optional[List] = None, near_duplicates: bool = False, similarity: float = 0.8) -> Dict[str, Union[Dict[str, Dict[str, Union[int, float]]], str]]:
     """
     Detect anomalies in a dataframe, including missing values, outliers, and duplicates.
     
     Parameters
     ----------
-    df : pandas.DataFrame
-        The input dataframe to analyze.
+    df : pandas.DataFrame or Arrow-compatible table
+        The input dataframe to analyze. Arrow tables, Polars DataFrames and
+        other ``__arrow_c_stream__`` producers are read without conversion to
+        pandas: missing counts come from the validity bitmaps (plus NaNs in
+        float columns) and exact duplicates from Arrow's hash grouping. Only
+        ``approximate_duplicates`` and ``near_duplicates`` convert the table
+        to pandas.
     anomaly_type : str, optional
         Specify which anomaly to check ('missing_values', 'outliers', or 'duplicates').
         If None, all anomaly types will be checked.
+    approximate_duplicates : bool, optional
+        If True, estimate the number of distinct rows with a fixed-size
+        HyperLogLog sketch instead of comparing rows exactly. The duplicates
+        entry then also carries an ``error_bound`` (in rows, ~95% confidence)
+        and ``approximate: True``. Default is False.
+    precision : int, optional
+        HyperLogLog precision used when ``approximate_duplicates`` is True;
+        the sketch takes ``2**precision`` bytes. Default is 14.
+    n_jobs : int, optional
+        Number of threads used to check missing values and outliers on blocks
+        of columns concurrently. -1 uses every CPU. Default is None (serial).
+    executor : concurrent.futures.ThreadPoolExecutor, optional
+        A thread pool to run the column blocks on instead of creating one.
+        Other executors, such as process pools, raise ``TypeError``.
+    cache : ProfileCache, optional
+        Reuse missing and outlier counts of columns with unchanged content,
+        and the duplicate count of an unchanged DataFrame, from earlier calls.
+        Applies to pandas input only. Default is None.
+    outlier_method : str or list of str, optional
+        How outliers are detected: 'iqr' (outside ``t`` x IQR of the
+        quartiles), 'zscore' (more than ``t`` population standard deviations
+        from the mean) or 'mad' (modified z-score, ``0.6745 * |x - median| /
+        MAD``, above ``t``). A list runs several methods on the same sorted
+        column blocks, and the ``outliers`` entry is then keyed by method.
+        Default is 'iqr'.
+    outlier_threshold : float or dict, optional
+        The threshold ``t`` of the method, or a dict from method to threshold.
+        Defaults are 1.5 for 'iqr', 3.0 for 'zscore' and 3.5 for 'mad'.
+    outlier_masks : str, optional
+        Also return which rows are outliers, under ``outlier_masks``, for each
+        column with outliers: 'bitset' gives the mask packed into bytes
+        (restore it with ``np.unpackbits(bits, count=len(df),
+        bitorder='little').astype(bool)``), 'indices' the row positions.
+        Default is None.
+    sample : int, optional
+        Quick-profile mode: estimate the anomalies from a random sample of
+        this many rows, so the time taken depends on the sample size rather
+        than on the table. Each entry then carries counts scaled to the whole
+        table, a ``confidence_interval`` (in percent, Wilson score intervals
+        for missing and outlier rates) and ``approximate: True``. Outlier
+        fences come from the sample. Duplicates are estimated from the
+        identical pairs in the sample, which assumes most duplicated rows
+        have a single copy. Default is None (use every row).
+    fraction : float, optional
+        Like ``sample``, with the sample size given as a fraction of the rows.
+    stratify : str, optional
+        Column whose groups are sampled in proportion to their size (at least
+        one row each). Default is None.
+    confidence : float, optional
+        Confidence level of the intervals in quick-profile mode. Default is 0.95.
+    random_state : int, optional
+        Seed for the sample, for reproducible results.
+    compact : bool, optional
+        Profile a compacted copy of a pandas DataFrame (see
+        ``compact_dataframe``): integers and floats in the narrowest lossless
+        type, low-cardinality strings as categoricals and other strings
+        Arrow-backed. The counts are unchanged, duplicate detection runs on
+        the smaller columns, and the report gains a ``compaction`` entry with
+        ``bytes_before``, ``bytes_after`` and ``saved_percentage``. The copy
+        sits next to the original for the duration of the call, so peak
+        memory goes up, not down; memory is only saved by compacting once
+        with ``compact_dataframe`` and keeping the result in place of the
+        original. Default is False.
+    subset : list, optional
+        Columns that identify a row for the duplicate checks: rows equal in
+        these columns are duplicates whatever their other values. Default is
+        None (every column).
+    near_duplicates : bool, optional
+        Also group rows that are nearly identical, such as copies differing
+        in whitespace, case or a few characters, with MinHash signatures and
+        locality-sensitive hashing (see ``near_duplicate_clusters``). The
+        report gains a ``near_duplicates`` entry with
+        ``near_duplicate_count`` (rows beyond the first of each cluster),
+        ``near_duplicate_percentage``, ``cluster_count`` and ``clusters``,
+        the index labels and size of the ten largest clusters. Rows are
+        compared on ``subset`` when given. Default is False.
+    similarity : float, optional
+        Smallest estimated Jaccard similarity of two rows' character 3-grams
+        for them to be near duplicates. Default is 0.8.
     
     Returns
     -------
     dict
         A dictionary containing detected anomalies based on the specified anomaly_type.
     
+    Raises
+    ------
+    TypeError
+        If ``executor`` is not a thread pool.
+    ValueError
+        If ``outlier_method`` or ``outlier_masks`` is not a supported value,
+        or if ``outlier_masks`` or ``near_duplicates`` is combined with sampling.
+    KeyError
+        If a column of ``subset`` is not in the DataFrame.
+    
     Example
     -------
     >>> import pandas as pd
@@ -88,49 +365,94 @@ def detect_anomalies(df: pd.DataFrame, anomaly_type: Optional[str] = None) -> Di
     >>> detect_anomalies(df, anomaly_type='missing_values')
     {'missing_values': {'A': {'missing_count': 1, 'missing_percentage': 25.0}}}
     """
+    check_executor(executor)
+    thresholds = resolve_outlier_methods(outlier_method, outlier_threshold, outlier_masks)
+    by_method = not isinstance(outlier_method, str)
+
+    if sample is not None or fraction is not None:
+        if outlier_masks is not None:
+            raise ValueError("outlier_masks cannot be combined with sampling.")
+        if near_duplicates:
+            raise ValueError("near_duplicates cannot be combined with sampling.")
+        rows, total_rows = _draw_sample(df, sample, fraction, stratify, confidence, random_state)
+        return sampled_anomalies(rows, total_rows, anomaly_type, thresholds, by_method, confidence, subset)
+
     if not isinstance(df, pd.DataFrame):
-        raise TypeError("Input must be a pandas DataFrame.")
+        table = as_arrow_table(df)
+        if table is None:
+            raise TypeError("Input must be a pandas DataFrame or an Arrow-compatible table.")
+        if approximate_duplicates or near_duplicates:
+            # Row fingerprints and signatures are computed by pandas
+            df = table.to_pandas()
+        else:
+            return _detect_table_anomalies(table, anomaly_type, thresholds, by_method, outlier_masks,
+                                           n_jobs, executor, subset)
     
     report = {}
     total_rows = len(df)
+    if compact:
+        with instrumentation.stage('detect_anomalies', 'compact', df.columns, total_rows):
+            df = compact_dataframe(df)
+    # With hooks registered, each column is its own block so events can name the slow one
+    n_groups = len(df.columns) if instrumentation.enabled() else worker_count(n_jobs, executor)
+    fingerprints = cache.fingerprints(df) if cache is not None and df.columns.is_unique else None
     
     if anomaly_type is None or anomaly_type == 'missing_values':
-        missing_values = df.isnull().sum()
-        missing_info = {
-            col: {
-                "missing_count": int(missing_values[col]),
-                "missing_percentage": round((missing_values[col] / total_rows) * 100, 2)
-            }
-            for col in df.columns if missing_values[col] > 0
-        }
-        report['missing_values'] = missing_info if missing_info else "No missing values detected."
+        if fingerprints is not None:
+            missing_values = cache.per_column(
+                'missing_values', list(df.columns), fingerprints,
+                lambda cols: _missing_counts(df, cols, n_groups, n_jobs, executor)
+            )
+        else:
+            missing_values = _missing_counts(df, df.columns, n_groups, n_jobs, executor)
+        report['missing_values'] = missing_report(missing_values, total_rows)
     
     if anomaly_type is None or anomaly_type == 'outliers':
-        outlier_info = {}
-        for col in df.select_dtypes(include=[np.number]).columns:
-            Q1 = df[col].quantile(0.25)
-            Q3 = df[col].quantile(0.75)
-            IQR = Q3 - Q1
-            lower_bound = Q1 - 1.5 * IQR
-            upper_bound = Q3 + 1.5 * IQR
-            outliers = df[(df[col] < lower_bound) | (df[col] > upper_bound)][col]
-            if not outliers.empty:
-                outlier_info[col] = {
-                    "outlier_count": len(outliers),
-                    "outlier_percentage": round((len(outliers) / total_rows) * 100, 2)
-                }
-        report['outliers'] = outlier_info if outlier_info else "No outliers detected."
+        numeric_cols = df.iloc[:0].select_dtypes(include=[np.number]).columns
+        # Masks take memory in proportion to the rows, so they are not cached
+        if fingerprints is not None and outlier_masks is None:
+            outlier_counts = cache.per_column(
+                'outliers', list(numeric_cols), fingerprints,
+                lambda cols: _outlier_counts(df, cols, n_groups, n_jobs, executor, thresholds)[0],
+                options=tuple(thresholds.items())
+            )
+            column_masks = None
+        else:
+            outlier_counts, column_masks = _outlier_counts(df, numeric_cols, n_groups, n_jobs, executor,
+                                                           thresholds, outlier_masks)
+        report.update(outlier_entries(outlier_counts, column_masks, list(thresholds), by_method, total_rows))
     
     if anomaly_type is None or anomaly_type == 'duplicates':
-        duplicate_count = df.duplicated().sum()
-        report['duplicates'] = {
-            "duplicate_count": duplicate_count,
-            "duplicate_percentage": round((duplicate_count / total_rows) * 100, 2)
-        } if duplicate_count > 0 else "No duplicate rows detected."
+        checkpoint()
+        keys = df if subset is None else df[subset]
+
+        def count_duplicates():
+            with instrumentation.stage('detect_anomalies', 'duplicates', keys.columns, total_rows):
+                if approximate_duplicates:
+                    sketch = HyperLogLog(precision).update(row_hashes(keys)) if total_rows else HyperLogLog(precision)
+                    return approximate_duplicate_report(total_rows, sketch)
+                return duplicate_report(keys.duplicated().sum(), total_rows)
+        if fingerprints is not None:
+            # Duplicates depend on every compared column, so they are one entry
+            key = ('duplicates', (approximate_duplicates, precision), tuple(map(repr, keys.columns)),
+                   tuple(fingerprints[col] for col in keys.columns))
+            report['duplicates'] = cache.memoize(key, count_duplicates)
+        else:
+            report['duplicates'] = count_duplicates()
+        if near_duplicates:
+            checkpoint()
+            with instrumentation.stage('detect_anomalies', 'near_duplicates', keys.columns, total_rows):
+                report['near_duplicates'] = near_duplicate_report(
+                    near_duplicate_clusters(keys, similarity=similarity), total_rows
+                )
+    
+    if compact:
+        compaction = df.attrs['compaction']
+        report['compaction'] = {key: compaction[key] for key in ('bytes_before', 'bytes_after', 'saved_percentage')}
     
     return report
 
-def plotify(df: pd.DataFrame, plot_types: Optional[List[str]] = None, save: bool = False, save_path: str = "plots", file_prefix: str = "plot") -> Dict[str, alt.Chart]:
+def plotify(df: pd.DataFrame, plot_types: Optional[List[str]] = None, save: bool = False, save_path: str = "plots", file_prefix: str = "plot", aggregate: bool = False, shared_data: Optional[str] = None, lazy: bool = False, n_jobs: Optional[int] = None, executor: Optional[Executor] = None, cache: Optional[ProfileCache] = None, max_heatmap_columns: Optional[int] = 50, top_k: Optional[int] = 20, compact: bool = False) -> Union[Dict[str, "alt.Chart"], LazyCharts]:
     """
     Visualize a DataFrame by generating specified plots based on column datatypes.
 
@@ -159,15 +481,76 @@ def plotify(df: pd.DataFrame, plot_types: Optional[List[str]] = None, save: bool
     file_prefix : str, optional
         The prefix for saved plot filenames. Default is 'plot'.
     
+    aggregate : bool, optional
+        If True, compute bins, counts, densities, box-plot statistics and
+        crosstabs in pandas/NumPy and build each chart from that small table
+        instead of embedding every row in its spec. Chart size then depends on
+        the number of bins and categories, not rows, and Altair's 5,000-row
+        limit no longer applies. Scatter plots become 2D histograms and box
+        plots omit individual outlier points. Default is False.
+    
+    shared_data : str, optional
+        Write the plotted columns once to ``{save_path}/{file_prefix}_data.json``
+        (``'json'``) or ``.csv`` (``'csv'``) and make every chart reference that
+        file by URL instead of embedding its own copy of the rows. The file is
+        written even when ``save`` is False, since the charts need it to render.
+        Ignored when ``aggregate`` is True, as aggregated charts carry only
+        small tables. Default is None (each chart embeds the data).
+    
+    lazy : bool, optional
+        If True, return a ``LazyCharts`` mapping whose keys are all plot names
+        but whose charts are only built when first accessed, which avoids
+        constructing every pairwise chart of a wide DataFrame up front. Call
+        its ``materialize()`` method to build them all. Saving still builds
+        every chart. Default is False.
+    
+    n_jobs : int, optional
+        Number of threads used to build, render and write charts when ``save``
+        is True. None (the default) saves serially; -1 uses all CPUs.
+    
+    executor : concurrent.futures.ThreadPoolExecutor, optional
+        An existing thread pool to save charts on instead of a temporary one.
+        Overrides the worker count of ``n_jobs``. Other executors, such as
+        process pools, raise ``TypeError``.
+    
+    cache : ProfileCache, optional
+        Reuse charts built by earlier calls when the columns they draw on are
+        unchanged. Charts embedding raw rows depend on every column; charts
+        built with ``aggregate`` or ``shared_data`` only on their own columns.
+        Cached chart objects are shared between calls. Default is None.
+    
+    max_heatmap_columns : int, optional
+        Largest number of columns drawn in the correlation heatmap. Wider
+        tables show only this many columns, those most strongly correlated
+        with another, ordered so correlated columns sit together. The
+        correlations are computed in column blocks without building the full
+        matrix. None draws every numeric column. Default is 50.
+    
+    top_k : int, optional
+        Largest number of categories drawn per column in bar and stacked bar
+        charts. A column with more distinct values shows its ``top_k`` most
+        frequent ones, found with a heavy-hitter sketch, plus one "Other"
+        category for the rest, and its charts are built from these counts
+        instead of embedding every row. None draws every category. Default is 20.
+    
+    compact : bool, optional
+        Build the charts from a compacted copy of the DataFrame (see
+        ``compact_dataframe``), where low-cardinality strings are categoricals
+        and counting them for bar, stacked bar and box charts is faster.
+        Strings stay object columns, so the same charts are drawn. The copy
+        sits next to the original for the duration of the call, which raises
+        peak memory. Default is False.
+    
     Returns
     -------
-    dict
-        A dictionary where keys are plot names and values are Altair Chart objects.
+    dict or LazyCharts
+        A dictionary where keys are plot names and values are Altair Chart objects,
+        or a ``LazyCharts`` mapping with the same keys if ``lazy`` is True.
     
     Raises
     ------
     TypeError
-        If the input is not a pandas DataFrame.
+        If the input is not a pandas DataFrame, or ``executor`` is not a thread pool.
     ValueError
         If the input DataFrame is empty.
 
@@ -175,6 +558,9 @@ def plotify(df: pd.DataFrame, plot_types: Optional[List[str]] = None, save: bool
     -----
     - Numeric columns are those of types 'int64', 'float64'.
     - Categorical columns are those of types 'object', 'category', and 'bool'.
+    - Saving is incremental: a SHA-256 hash of each chart's HTML is recorded in
+      ``{save_path}/{file_prefix}_manifest.json``, and on later runs charts
+      whose hash is unchanged are not rewritten.
 
     Examples
     --------
@@ -184,14 +570,32 @@ def plotify(df: pd.DataFrame, plot_types: Optional[List[str]] = None, save: bool
     >>> charts['histogram_A'].show()
     """
     import os
+
+    # The plotting stack is imported on first use, so profiling-only callers never load Altair
+    from datpro._charts import (
+        build_bar, build_box, build_correlation, build_density, build_histogram,
+        build_scatter, build_stacked_bar, write_shared_dataset
+    )
     
     # Validate input
     if not isinstance(df, pd.DataFrame):
         raise TypeError("Input must be a pandas DataFrame.")
     if df.empty:
         raise ValueError("Input DataFrame is empty.")
+    check_executor(executor)
     
-    if save and not os.path.exists(save_path):
+    if shared_data is not None and shared_data not in ('json', 'csv'):
+        raise ValueError("shared_data must be 'json' or 'csv'.")
+    if shared_data and aggregate:
+        shared_data = None
+    if top_k is not None and top_k < 1:
+        raise ValueError("top_k must be a positive integer.")
+    if compact:
+        with instrumentation.stage('plotify', 'compact', df.columns, len(df)):
+            # Arrow strings would fall outside the categorical columns
+            df = compact_dataframe(df, arrow_strings=False)
+
+    if (save or shared_data) and not os.path.exists(save_path):
         os.makedirs(save_path)
 
     # Set default plot types if not specified
@@ -199,86 +603,76 @@ def plotify(df: pd.DataFrame, plot_types: Optional[List[str]] = None, save: bool
         plot_types = ['histogram', 'density', 'bar', 'scatter', 'correlation', 'box', 'stacked_bar']
     
     # Analyze columns
-    numeric_cols = df.select_dtypes(include='number').columns.tolist()
-    categorical_cols = df.select_dtypes(include=['object', 'category', 'bool']).columns.tolist()
+    numeric_cols = df.iloc[:0].select_dtypes(include='number').columns.tolist()
+    categorical_cols = df.iloc[:0].select_dtypes(include=['object', 'category', 'bool']).columns.tolist()
     
-    plots = {}
+    data = None
+    if shared_data:
+        data = write_shared_dataset(df, numeric_cols + categorical_cols,
+                                    f"{save_path}/{file_prefix}_data.{shared_data}", shared_data)
+
+    builders = {}
+    chart_columns = {}
+    chart_families = {}
+
+    def add(family, builder, *cols, **options):
+        name = '_'.join([family, *map(str, cols)])
+        builders[name] = partial(builder, df, *cols, aggregate, data, **options)
+        chart_columns[name] = list(cols)
+        chart_families[name] = family
 
     # Individual column visualizations
     if 'histogram' in plot_types or 'density' in plot_types:
         for col in numeric_cols:
             if 'histogram' in plot_types:
-                hist_chart = alt.Chart(df).mark_bar().encode(
-                    x=alt.X(col, bin=True, title=f"{col} (binned)"),
-                    y=alt.Y('count()', title='Count')
-                ).properties(title=f"Histogram of {col}")
-                plots[f'histogram_{col}'] = hist_chart
-                if save:
-                    hist_chart.save(f"{save_path}/{file_prefix}_histogram_{col}.html")
+                add('histogram', build_histogram, col)
             if 'density' in plot_types:
-                density_chart = alt.Chart(df).transform_density(
-                    col, as_=[col, 'density']
-                ).mark_area(opacity=0.5).encode(
-                    x=alt.X(col, title=col),
-                    y=alt.Y('density:Q', title='Density')
-                ).properties(title=f"Density Plot of {col}")
-                plots[f'density_{col}'] = density_chart
-                if save:
-                    density_chart.save(f"{save_path}/{file_prefix}_density_{col}.html")
+                add('density', build_density, col)
     
     if 'bar' in plot_types:
         for col in categorical_cols:
-            bar_chart = alt.Chart(df).mark_bar().encode(
-                x=alt.X(col, title=col),
-                y=alt.Y('count()', title='Count')
-            ).properties(title=f"Bar Chart of {col}")
-            plots[f'bar_{col}'] = bar_chart
-            if save:
-                bar_chart.save(f"{save_path}/{file_prefix}_bar_{col}.html")
+            add('bar', build_bar, col, top_k=top_k)
     
     if 'scatter' in plot_types:
         for col1, col2 in combinations(numeric_cols, 2):
-            scatter_chart = alt.Chart(df).mark_circle(size=60).encode(
-                x=alt.X(col1, title=col1),
-                y=alt.Y(col2, title=col2),
-                tooltip=[col1, col2]
-            ).properties(title=f"Scatter Plot: {col1} vs {col2}")
-            plots[f'scatter_{col1}_{col2}'] = scatter_chart
-            if save:
-                scatter_chart.save(f"{save_path}/{file_prefix}_scatter_{col1}_{col2}.html")
+            add('scatter', build_scatter, col1, col2)
     
     if 'correlation' in plot_types and len(numeric_cols) > 1:
-        corr_matrix = df[numeric_cols].corr().stack().reset_index()
-        corr_matrix.columns = ['Variable 1', 'Variable 2', 'Correlation']
-        heatmap = alt.Chart(corr_matrix).mark_rect().encode(
-            x=alt.X('Variable 1:N'),
-            y=alt.Y('Variable 2:N'),
-            color=alt.Color('Correlation:Q', scale=alt.Scale(scheme='viridis'))
-        ).properties(title='Correlation Heatmap')
-        plots['correlation_heatmap'] = heatmap
-        if save:
-            heatmap.save(f"{save_path}/{file_prefix}_correlation_heatmap.html")
+        builders['correlation_heatmap'] = partial(build_correlation, df, numeric_cols, max_heatmap_columns)
+        chart_columns['correlation_heatmap'] = numeric_cols
+        chart_families['correlation_heatmap'] = 'correlation'
     
     if 'box' in plot_types:
         for numeric_col in numeric_cols:
             for categorical_col in categorical_cols:
-                box_plot = alt.Chart(df).mark_boxplot().encode(
-                    x=alt.X(categorical_col, title=categorical_col),
-                    y=alt.Y(numeric_col, title=numeric_col)
-                ).properties(title=f"Box Plot of {numeric_col} by {categorical_col}")
-                plots[f'box_{numeric_col}_{categorical_col}'] = box_plot
-                if save:
-                    box_plot.save(f"{save_path}/{file_prefix}_box_{numeric_col}_{categorical_col}.html")
+                add('box', build_box, numeric_col, categorical_col)
     
     if 'stacked_bar' in plot_types:
         for col1, col2 in combinations(categorical_cols, 2):
-            stacked_bar_chart = alt.Chart(df).mark_bar().encode(
-                x=alt.X(col1, title=col1),
-                y=alt.Y('count()', title='Count'),
-                color=alt.Color(col2, title=col2)
-            ).properties(title=f"Stacked Bar Chart of {col1} vs {col2}")
-            plots[f'stacked_bar_{col1}_{col2}'] = stacked_bar_chart
-            if save:
-                stacked_bar_chart.save(f"{save_path}/{file_prefix}_stacked_bar_{col1}_{col2}.html")
-    
-    return plots
\ No newline at end of file
+            add('stacked_bar', build_stacked_bar, col1, col2, top_k=top_k)
+    
+    if cache is not None and df.columns.is_unique:
+        fingerprints = cache.fingerprints(df)
+        options = (aggregate, None if data is None else data.to_json(), max_heatmap_columns, top_k)
+        for name, builder in builders.items():
+            cols = chart_columns[name]
+            # Charts that embed raw rows carry every column, so they depend on all of them
+            if not aggregate and data is None and name != 'correlation_heatmap':
+                cols = list(df.columns)
+            key = ('plotify', options, name, tuple(map(repr, cols)), tuple(fingerprints[col] for col in cols))
+            builders[name] = partial(cache.memoize, key, builder)
+    
+    if instrumentation.enabled():
+        def timed(name, builder):
+            with instrumentation.stage('plotify', chart_families[name], chart_columns[name], len(df)):
+                return builder()
+
+        builders = {name: partial(timed, name, builder) for name, builder in builders.items()}
+    
+    plots = LazyCharts(builders)
+
+    # Saving needs every chart, so it builds them all
+    if save:
+        save_charts(plots, save_path, file_prefix, n_jobs, executor, columns=chart_columns)
+    
+    return plots if lazy else plots.materialize()
@@ -0,0 +1,166 @@
+"""
+Structured timing and memory events for the stages of datpro's profiling functions.
+
+Register a callback with ``add_hook`` (or use the ``profile_stages`` context
+manager) and every instrumented stage reports a ``StageEvent`` when it
+finishes: the missing-value, outlier and duplicate checks of
+``detect_anomalies``, the quantile blocks of ``summarize_data``, each chart
+``plotify`` builds and each file it saves. While no hook is registered the
+stages skip all bookkeeping.
+"""
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from typing import Callable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+
+class StageEvent(NamedTuple):
+    """
+    One finished stage of a profiling call.
+
+    Attributes
+    ----------
+    function : str
+        The public function the stage belongs to, e.g. ``'detect_anomalies'``.
+    stage : str
+        The stage, e.g. ``'missing_values'``, ``'outliers'``, ``'duplicates'``,
+        ``'quantiles'``, a chart family such as ``'scatter'``, or ``'save'``.
+    columns : tuple
+        The columns the stage processed.
+    seconds : float
+        Wall time of the stage.
+    rows : int
+        Number of rows the stage processed.
+    memory_delta : int or None
+        Peak traced memory during the stage minus the traced memory at its
+        start, in bytes. None unless ``tracemalloc`` is tracing. Stages running
+        concurrently on threads share one trace, so their deltas overlap.
+    """
+    function: str
+    stage: str
+    columns: Tuple
+    seconds: float
+    rows: int
+    memory_delta: Optional[int]
+
+
+_hooks: List[Callable[[StageEvent], None]] = []
+_lock = threading.Lock()
+# Peaks of the stages currently open, innermost last; see _Stage
+_open_peaks: List[List[int]] = []
+
+
+def add_hook(callback: Callable[[StageEvent], None]) -> None:
+    """Call ``callback`` with a ``StageEvent`` whenever an instrumented stage finishes."""
+    with _lock:
+        _hooks.append(callback)
+
+
+def remove_hook(callback: Callable[[StageEvent], None]) -> None:
+    """Unregister a callback added with ``add_hook``."""
+    with _lock:
+        _hooks.remove(callback)
+
+
+def enabled() -> bool:
+    """True if at least one hook is registered."""
+    return bool(_hooks)
+
+
+class _Stage:
+    def __init__(self, function: str, name: str, columns: Sequence, rows: int):
+        self.event = (function, name, tuple(columns), rows)
+
+    def __enter__(self):
+        self.tracing = tracemalloc.is_tracing()
+        if self.tracing:
+            # reset_peak() also clears the peak of enclosing stages, so each
+            # open stage keeps the highest peak seen while it was innermost
+            with _lock:
+                if _open_peaks:
+                    _open_peaks[-1][0] = max(_open_peaks[-1][0], tracemalloc.get_traced_memory()[1])
+                self.start_memory = tracemalloc.get_traced_memory()[0]
+                self.peak = [self.start_memory]
+                _open_peaks.append(self.peak)
+                tracemalloc.reset_peak()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        seconds = time.perf_counter() - self.start
+        memory_delta = None
+        if self.tracing and tracemalloc.is_tracing():
+            with _lock:
+                peak = max(self.peak[0], tracemalloc.get_traced_memory()[1])
+                if self.peak in _open_peaks:
+                    _open_peaks.remove(self.peak)
+                if _open_peaks:
+                    _open_peaks[-1][0] = max(_open_peaks[-1][0], peak)
+            memory_delta = peak - self.start_memory
+        event = StageEvent(*self.event[:3], seconds, self.event[3], memory_delta)
+        for hook in list(_hooks):
+            hook(event)
+        return False
+
+
+_DISABLED = nullcontext()
+
+
+def stage(function: str, name: str, columns: Sequence = (), rows: int = 0):
+    """
+    Context manager that reports a ``StageEvent`` for the enclosed block to every hook.
+
+    Returns a shared no-op context when no hook is registered.
+    """
+    if not _hooks:
+        return _DISABLED
+    return _Stage(function, name, columns, rows)
+
+
+@contextmanager
+def profile_stages(callback: Optional[Callable[[StageEvent], None]] = None,
+                   trace_memory: bool = False) -> Iterator[List[StageEvent]]:
+    """
+    Collect the ``StageEvent`` of every stage run inside the ``with`` block.
+
+    Parameters
+    ----------
+    callback : callable, optional
+        Also call this with each event as it happens, e.g. to forward it to a
+        metrics pipeline.
+    trace_memory : bool, optional
+        Start ``tracemalloc`` for the duration of the block (if it is not
+        already tracing) so events carry ``memory_delta``. Tracing slows
+        Python allocations down noticeably. Default is False.
+
+    Yields
+    ------
+    list of StageEvent
+        The events, in the order the stages finished.
+
+    Example
+    -------
+    >>> from datpro import detect_anomalies, profile_stages
+    >>> with profile_stages() as events:
+    ...     detect_anomalies(df)
+    >>> max(events, key=lambda event: event.seconds)
+    StageEvent(function='detect_anomalies', stage='duplicates', columns=('A', 'B'), ...)
+    """
+    events: List[StageEvent] = []
+
+    def record(event: StageEvent) -> None:
+        events.append(event)
+        if callback is not None:
+            callback(event)
+
+    started = trace_memory and not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    add_hook(record)
+    try:
+        yield events
+    finally:
+        remove_hook(record)
+        if started:
+            tracemalloc.stop()
@@ -0,0 +1,175 @@
+import os
+import pandas as pd
+from typing import Dict, List, Optional, Union
+
+from datpro._arrow import numeric_columns
+from datpro._io import ParquetSource, iter_chunks
+from datpro._report import missing_report
+from datpro.streaming import ProfileState, detect_anomalies_stream, summarize_stream
+
+ParquetPath = Union[str, os.PathLike, List[Union[str, os.PathLike]]]
+
+
+def _statistics_null_counts(metadata: list, columns: List) -> Dict:
+    """
+    Null count per column from row-group statistics, without reading data pages.
+
+    A column gets None if any row group lacks a null count for it. A file
+    that does not contain a column contributes all of its rows as missing.
+    """
+    counts: Dict = {col: 0 for col in columns}
+    for meta in metadata:
+        index = {meta.schema.column(i).path: i for i in range(meta.num_columns)}
+        for col in columns:
+            if counts[col] is None:
+                continue
+            if col not in index:
+                counts[col] += meta.num_rows
+                continue
+            for row_group in range(meta.num_row_groups):
+                stats = meta.row_group(row_group).column(index[col]).statistics
+                if stats is None or not stats.has_null_count:
+                    counts[col] = None
+                    break
+                counts[col] += stats.null_count
+    return counts
+
+
+def summarize_parquet(path: ParquetPath, columns: Optional[List] = None, chunksize: Optional[int] = None,
+                      error: float = 0.01, random_state: Optional[int] = None) -> pd.DataFrame:
+    """
+    Summarize the numeric columns of a Parquet file or dataset, reading only those columns.
+
+    The numeric columns are picked from the file schema, and only their
+    column chunks are read, row group by row group through memory-mapped
+    I/O, into the quantile sketches of ``summarize_stream``. Minimum and
+    maximum are exact; quartiles are exact while a column has fewer values
+    than its sketch holds, and within ``error`` in rank beyond that.
+
+    Parameters
+    ----------
+    path : str, os.PathLike or list of them
+        A Parquet file, a directory of Parquet files (searched recursively,
+        as in a partitioned lake) or a list of files.
+    columns : list, optional
+        Columns to consider. Default is None (all numeric columns).
+    chunksize : int, optional
+        Number of rows read per batch. Default is 100,000.
+    error : float, optional
+        Target normalized rank error of the quartiles. Default is 0.01.
+    random_state : int, optional
+        Seed for the sketches, for reproducible results.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The same min, 25%, 50%, 75% and max table as ``summarize_data``.
+
+    Raises
+    ------
+    ValueError
+        If the data is empty or contains no numeric columns.
+
+    Example
+    -------
+    >>> summarize_parquet("lake/events/", columns=['latency_ms', 'bytes'])
+    """
+    source = ParquetSource(path, columns, chunksize)
+    if sum(meta.num_rows for meta in source.metadata()) == 0:
+        raise ValueError("The input DataFrame is empty.")
+    numeric = numeric_columns(source.schema)
+    if not numeric:
+        raise ValueError("The DataFrame contains no numeric columns.")
+    return summarize_stream(source.project(numeric), error=error, random_state=random_state)
+
+
+def detect_anomalies_parquet(path: ParquetPath, anomaly_type: Optional[str] = None,
+                             columns: Optional[List] = None, chunksize: Optional[int] = None,
+                             error: float = 0.01, exact_outliers: bool = False,
+                             approximate_duplicates: bool = False, precision: int = 14,
+                             random_state: Optional[int] = None,
+                             use_statistics: bool = True) -> Dict[str, Union[Dict, str]]:
+    """
+    Detect missing values, outliers and duplicates in a Parquet file or dataset.
+
+    Missing values come from the null counts in the row-group statistics of
+    the file footers, so no data page is read; only columns whose statistics
+    lack a null count are scanned. Outliers read only the numeric columns,
+    and duplicates only the selected ones, streaming row groups through
+    memory-mapped I/O as in ``detect_anomalies_stream``.
+
+    Parameters
+    ----------
+    path : str, os.PathLike or list of them
+        A Parquet file, a directory of Parquet files (searched recursively,
+        as in a partitioned lake) or a list of files.
+    anomaly_type : str, optional
+        Specify which anomaly to check ('missing_values', 'outliers', or 'duplicates').
+        If None, all anomaly types will be checked.
+    columns : list, optional
+        Columns to check. Duplicates are judged on these columns only.
+        Default is None (all columns).
+    chunksize : int, optional
+        Number of rows read per batch. Default is 100,000.
+    error : float, optional
+        Target normalized rank error of the quartile sketches. Default is 0.01.
+    exact_outliers : bool, optional
+        If True, re-read the numeric columns to make outlier counts exact.
+        Default is False.
+    approximate_duplicates : bool, optional
+        If True, estimate duplicates with a HyperLogLog sketch. Default is False.
+    precision : int, optional
+        HyperLogLog precision used when ``approximate_duplicates`` is True. Default is 14.
+    random_state : int, optional
+        Seed for the sketches, for reproducible results.
+    use_statistics : bool, optional
+        If False, count missing values by scanning the columns instead of
+        reading row-group statistics. Default is True.
+
+    Returns
+    -------
+    dict
+        A dictionary in the same format as ``detect_anomalies``.
+
+    Notes
+    -----
+    Parquet statistics count nulls only. A float NaN stored as a value (not
+    as a null) is missing to pandas but not to the statistics; pandas-written
+    files store NaN as null. Pass ``use_statistics=False`` for files written
+    by tools that keep NaN values.
+
+    Example
+    -------
+    >>> detect_anomalies_parquet("lake/events/", anomaly_type='missing_values')
+    """
+    source = ParquetSource(path, columns, chunksize)
+    check_missing = anomaly_type is None or anomaly_type == 'missing_values'
+    check_outliers = anomaly_type is None or anomaly_type == 'outliers'
+    check_duplicates = anomaly_type is None or anomaly_type == 'duplicates'
+
+    report = {}
+    if check_missing:
+        metadata = source.metadata()
+        total_rows = sum(meta.num_rows for meta in metadata)
+        selected = source.schema.names
+        if use_statistics:
+            counts = _statistics_null_counts(metadata, selected)
+        else:
+            counts = dict.fromkeys(selected)
+        unknown = [col for col, count in counts.items() if count is None]
+        if unknown:
+            state = ProfileState(track_quantiles=False, track_duplicates=False)
+            for chunk in iter_chunks(source.project(unknown)):
+                state.update(chunk)
+            counts.update({col: state.missing_counts.get(col, total_rows) for col in unknown})
+        report['missing_values'] = missing_report(counts, total_rows)
+
+    if check_outliers:
+        numeric = numeric_columns(source.schema)
+        report.update(detect_anomalies_stream(source.project(numeric), 'outliers', error=error,
+                                              exact_outliers=exact_outliers, random_state=random_state))
+
+    if check_duplicates:
+        report.update(detect_anomalies_stream(source, 'duplicates', approximate_duplicates=approximate_duplicates,
+                                              precision=precision))
+    return report
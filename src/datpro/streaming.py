@@ -0,0 +1,652 @@
+import os
+import pickle
+
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional, Union
+
+from datpro._hashing import column_hashes, row_hashes
+from datpro._io import ChunkSource, is_reiterable, iter_chunks
+from datpro._missing import MissingnessState, missing_counts
+from datpro._numeric import SUMMARY_LABELS, SUMMARY_LEVELS, _lerp, is_real_numeric
+from datpro._report import approximate_duplicate_report, duplicate_report, missing_report, outlier_report
+from datpro._sampling import check_sampling, sample_chunks, sampled_anomalies, sampled_summary
+from datpro._sketches import HyperLogLog, KLLSketch, RowHashSet, SpaceSaving
+
+
+def _numeric_values(series: pd.Series) -> np.ndarray:
+    """Return a chunk column as float64, coercing values that did not parse as numbers."""
+    if not is_real_numeric(series.dtype):
+        series = pd.to_numeric(series, errors='coerce')
+    return series.to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+class ProfileState:
+    """
+    Incremental profile of a growing table that absorbs new rows without revisiting old ones.
+
+    The state keeps, per column, the row and missing-value counts and a KLL
+    quantile sketch with exact minimum and maximum (numeric columns), plus a
+    sketch of row fingerprints for duplicate detection. ``update`` folds in a
+    chunk of new rows at a cost proportional to the chunk, and ``summary`` and
+    ``anomalies`` report in the same shapes as ``summarize_data`` and
+    ``detect_anomalies``. The state can be saved to disk and loaded again, so
+    an append-only table is profiled once and then only its daily delta.
+
+    Parameters
+    ----------
+    error : float, optional
+        Target normalized rank error of the quantile sketches. While a column
+        holds fewer values than its sketch, its quartiles are exact. Default is 0.01.
+    approximate_duplicates : bool, optional
+        If True, track duplicates with a fixed-size HyperLogLog sketch instead
+        of one 64-bit fingerprint per distinct row. Default is False.
+    precision : int, optional
+        HyperLogLog precision used when ``approximate_duplicates`` is True. Default is 14.
+    random_state : int, optional
+        Seed for the quantile sketches, for reproducible results.
+    track_missing : bool, optional
+        Count missing values. Default is True.
+    track_quantiles : bool, optional
+        Keep quantile sketches, needed for ``summary`` and outliers. Default is True.
+    track_duplicates : bool, optional
+        Track row fingerprints for duplicate detection. Default is True.
+
+    Example
+    -------
+    >>> state = ProfileState()
+    >>> state.update(pd.read_csv("history.csv"))
+    >>> state.save("profile.pkl")
+    >>> # next day
+    >>> state = ProfileState.load("profile.pkl").update(pd.read_csv("today.csv"))
+    >>> state.anomalies(anomaly_type='duplicates')
+    """
+
+    def __init__(self, error: float = 0.01, approximate_duplicates: bool = False, precision: int = 14,
+                 random_state: Optional[int] = None, track_missing: bool = True,
+                 track_quantiles: bool = True, track_duplicates: bool = True):
+        self.error = error
+        self.random_state = random_state
+        self.total_rows = 0
+        self.missing_counts: Optional[Dict[str, int]] = {} if track_missing else None
+        self.sketches: Optional[Dict[str, KLLSketch]] = {} if track_quantiles else None
+        self.approximate_duplicates = approximate_duplicates
+        self.seen_rows = None
+        if track_duplicates:
+            self.seen_rows = HyperLogLog(precision) if approximate_duplicates else RowHashSet()
+        self.duplicate_count = 0
+
+    def __repr__(self) -> str:
+        return f"ProfileState({self.total_rows} rows, {len(self.columns)} columns)"
+
+    @property
+    def columns(self) -> List[str]:
+        """Columns seen so far, in order of first appearance."""
+        seen = dict.fromkeys(self.missing_counts or [])
+        seen.update(dict.fromkeys(self.sketches or []))
+        return list(seen)
+
+    def update(self, chunk: pd.DataFrame) -> "ProfileState":
+        """
+        Absorb a chunk of new rows.
+
+        Columns that first appear in a later chunk count as missing in earlier
+        rows, and columns absent from a chunk count as missing in its rows.
+        """
+        if not isinstance(chunk, pd.DataFrame):
+            raise TypeError("Input must be a pandas DataFrame.")
+        if self.missing_counts is not None:
+            chunk_missing = missing_counts(chunk)
+            for col in chunk.columns:
+                self.missing_counts[col] = (self.missing_counts.get(col, self.total_rows)
+                                            + int(chunk_missing[col]))
+            for col in self.missing_counts:
+                if col not in chunk.columns:
+                    self.missing_counts[col] += len(chunk)
+        if self.sketches is not None:
+            for col in chunk.columns:
+                if col not in self.sketches and is_real_numeric(chunk[col].dtype):
+                    self.sketches[col] = KLLSketch(self.error, seed=self.random_state)
+            for col, sketch in self.sketches.items():
+                if col in chunk.columns:
+                    sketch.update(_numeric_values(chunk[col]))
+        if self.seen_rows is not None and len(chunk):
+            if self.approximate_duplicates:
+                self.seen_rows.update(row_hashes(chunk))
+            else:
+                self.duplicate_count += self.seen_rows.add(row_hashes(chunk))
+        self.total_rows += len(chunk)
+        return self
+
+    def summary(self) -> pd.DataFrame:
+        """
+        Return the min, 25%, 50%, 75% and max table of ``summarize_data``.
+
+        Raises
+        ------
+        ValueError
+            If no rows or no numeric columns have been absorbed, or quantiles
+            are not tracked by this state.
+        """
+        if self.sketches is None:
+            raise ValueError("Quantiles are not tracked by this ProfileState.")
+        if self.total_rows == 0:
+            raise ValueError("The input DataFrame is empty.")
+        if not self.sketches:
+            raise ValueError("The DataFrame contains no numeric columns.")
+        return pd.DataFrame(
+            [sketch.quantiles(SUMMARY_LEVELS) for sketch in self.sketches.values()],
+            index=list(self.sketches),
+            columns=SUMMARY_LABELS
+        )
+
+    def outlier_counts(self) -> Dict[str, int]:
+        """Number of values outside the 1.5 x IQR fences per numeric column, read from the sketches."""
+        if self.sketches is None:
+            raise ValueError("Quantiles are not tracked by this ProfileState.")
+        outlier_counts = {}
+        for col, sketch in self.sketches.items():
+            if sketch.count == 0:
+                continue
+            Q1, Q3 = sketch.quantiles([0.25, 0.75])
+            IQR = Q3 - Q1
+            below = sketch.rank([Q1 - 1.5 * IQR])[0]
+            above = sketch.count - sketch.rank([Q3 + 1.5 * IQR], inclusive=True)[0]
+            outlier_counts[col] = int(below + above)
+        return outlier_counts
+
+    def anomalies(self, anomaly_type: Optional[str] = None) -> Dict[str, Union[Dict, str]]:
+        """
+        Return a report in the format of ``detect_anomalies``.
+
+        Raises
+        ------
+        ValueError
+            If the requested anomaly type was not tracked by this state.
+        """
+        report = {}
+        if anomaly_type is None or anomaly_type == 'missing_values':
+            if self.missing_counts is None:
+                raise ValueError("Missing values are not tracked by this ProfileState.")
+            report['missing_values'] = missing_report(self.missing_counts, self.total_rows)
+        if anomaly_type is None or anomaly_type == 'outliers':
+            report['outliers'] = outlier_report(self.outlier_counts(), self.total_rows)
+        if anomaly_type is None or anomaly_type == 'duplicates':
+            if self.seen_rows is None:
+                raise ValueError("Duplicates are not tracked by this ProfileState.")
+            if self.approximate_duplicates:
+                report['duplicates'] = approximate_duplicate_report(self.total_rows, self.seen_rows)
+            else:
+                report['duplicates'] = duplicate_report(self.duplicate_count, self.total_rows)
+        return report
+
+    def save(self, path: Union[str, os.PathLike]) -> None:
+        """Write the state to ``path`` with pickle."""
+        with open(path, "wb") as f:
+            pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path: Union[str, os.PathLike]) -> "ProfileState":
+        """Read a state written by ``save``. Only load files from trusted sources."""
+        with open(path, "rb") as f:
+            state = pickle.load(f)
+        if not isinstance(state, cls):
+            raise TypeError(f"{path} does not contain a ProfileState.")
+        return state
+
+
+def _sample_stream(source: ChunkSource, chunksize: Optional[int], sample: Optional[int],
+                   fraction: Optional[float], stratify: Optional[str], confidence: float,
+                   random_state: Optional[int]) -> tuple:
+    """Validate the quick-profile options and sample the rows of a chunked source in one pass."""
+    check_sampling(sample, fraction, confidence)
+    rows, total_rows = sample_chunks(iter_chunks(source, chunksize), sample, fraction, stratify, random_state)
+    if total_rows == 0:
+        raise ValueError("The input DataFrame is empty.")
+    if len(rows) == 0:
+        raise ValueError("The sample is empty; increase sample or fraction.")
+    return rows, total_rows
+
+
+def summarize_stream(source: ChunkSource, chunksize: Optional[int] = None, error: float = 0.01,
+                     random_state: Optional[int] = None, sample: Optional[int] = None,
+                     fraction: Optional[float] = None, stratify: Optional[str] = None,
+                     confidence: float = 0.95) -> pd.DataFrame:
+    """
+    Summarize numeric columns of data that does not fit in memory.
+
+    The data is read one chunk at a time and each numeric column is folded
+    into a mergeable KLL quantile sketch, so memory depends on ``error``
+    rather than on the number of rows. Minimum and maximum are always exact;
+    the quartiles are exact too while a column has fewer values than the
+    sketch holds, and approximate beyond that.
+
+    Parameters
+    ----------
+    source : pandas.DataFrame, str, os.PathLike or iterable of pandas.DataFrame
+        The data to summarize: an iterator of DataFrame chunks, or the path of
+        a CSV or Parquet file to be read in chunks of ``chunksize`` rows.
+    chunksize : int, optional
+        Number of rows read per chunk from a file. Default is 100,000.
+    error : float, optional
+        Target normalized rank error of the quartiles, e.g. 0.01 means each
+        reported quartile lies within +/- 1% of the requested rank. Default is 0.01.
+    random_state : int, optional
+        Seed for the sketches (or the sample), for reproducible results.
+    sample : int, optional
+        Quick-profile mode: keep a reservoir sample of this many rows while
+        reading and estimate the statistics from it, with confidence
+        intervals, as ``summarize_data`` does with ``sample``. Memory and the
+        statistics' cost depend on the sample size; the source is still read
+        once. Default is None.
+    fraction : float, optional
+        Like ``sample``, keeping each row with this probability.
+    stratify : str, optional
+        Column whose groups are sampled in proportion to their size.
+    confidence : float, optional
+        Confidence level of the intervals in quick-profile mode. Default is 0.95.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The same min, 25%, 50%, 75% and max table as ``summarize_data``
+        (with estimate, lower and upper sub-columns in quick-profile mode).
+
+    Raises
+    ------
+    TypeError
+        If the source is not a DataFrame, a file path or an iterable of DataFrames.
+    ValueError
+        If the data is empty or contains no numeric columns.
+
+    Example
+    -------
+    >>> chunks = pd.read_csv("data/example_data.csv", chunksize=500)
+    >>> summarize_stream(chunks)
+    """
+    if sample is not None or fraction is not None:
+        rows, total_rows = _sample_stream(source, chunksize, sample, fraction, stratify, confidence, random_state)
+        return sampled_summary(rows, total_rows, confidence)
+
+    state = ProfileState(error, random_state=random_state, track_missing=False, track_duplicates=False)
+    for chunk in iter_chunks(source, chunksize):
+        state.update(chunk)
+    return state.summary()
+
+
+class _QuartileWindows:
+    """
+    Second-pass state that turns approximate quartiles into exact IQR outlier counts.
+
+    The sketch brackets Q1 and Q3 between two values each. The pass keeps the
+    values inside those brackets (enough to read the exact quartiles) and the
+    values inside the ranges where the outlier fences can possibly fall;
+    values beyond those ranges are counted without being stored.
+    """
+
+    def __init__(self, sketch: KLLSketch, width: float):
+        self.count = sketch.count
+        a1, b1, a3, b3 = sketch.quantiles([
+            max(0.0, 0.25 - width), min(1.0, 0.25 + width),
+            max(0.0, 0.75 - width), min(1.0, 0.75 + width)
+        ])
+        self.quartile_ranges = [(a1, b1), (a3, b3)]
+        self.fence_ranges = [(a1 - 1.5 * (b3 - a1), b1 - 1.5 * (a3 - b1)),
+                             (a3 + 1.5 * (a3 - b1), b3 + 1.5 * (b3 - a1))]
+        self.below_quartile = [0, 0]
+        self.quartile_values: List[List[np.ndarray]] = [[], []]
+        self.below_lower_fence = 0
+        self.above_upper_fence = 0
+        self.fence_values: List[List[np.ndarray]] = [[], []]
+
+    def update(self, values: np.ndarray) -> None:
+        values = values[~np.isnan(values)]
+        for i, (low, high) in enumerate(self.quartile_ranges):
+            self.below_quartile[i] += int(np.count_nonzero(values < low))
+            self.quartile_values[i].append(values[(values >= low) & (values <= high)])
+        (lower_low, lower_high), (upper_low, upper_high) = self.fence_ranges
+        self.below_lower_fence += int(np.count_nonzero(values < lower_low))
+        self.above_upper_fence += int(np.count_nonzero(values > upper_high))
+        self.fence_values[0].append(values[(values >= lower_low) & (values <= lower_high)])
+        self.fence_values[1].append(values[(values >= upper_low) & (values <= upper_high)])
+
+    def _quartile(self, i: int, level: float) -> Optional[float]:
+        window = np.sort(np.concatenate(self.quartile_values[i]))
+        position = level * (self.count - 1)
+        below = int(np.floor(position)) - self.below_quartile[i]
+        above = min(int(np.floor(position)) + 1, self.count - 1) - self.below_quartile[i]
+        if below < 0 or above >= window.size:
+            return None
+        return float(_lerp(window[below], window[above], np.float64(position - np.floor(position))))
+
+    def outlier_count(self) -> Optional[int]:
+        """Exact number of IQR outliers, or None if the brackets missed a quartile."""
+        Q1, Q3 = self._quartile(0, 0.25), self._quartile(1, 0.75)
+        if Q1 is None or Q3 is None:
+            return None
+        IQR = Q3 - Q1
+        lower = np.concatenate(self.fence_values[0])
+        upper = np.concatenate(self.fence_values[1])
+        return (self.below_lower_fence + int(np.count_nonzero(lower < Q1 - 1.5 * IQR))
+                + self.above_upper_fence + int(np.count_nonzero(upper > Q3 + 1.5 * IQR)))
+
+
+def _exact_outlier_counts(source: ChunkSource, chunksize: Optional[int],
+                          sketches: Dict[str, KLLSketch], error: float) -> Dict[str, int]:
+    """Re-read ``source`` until every column's IQR outlier count is exact."""
+    counts: Dict[str, int] = {}
+    pending = [col for col, sketch in sketches.items() if sketch.count > 0]
+    width = 2 * error
+    while pending:
+        windows = {col: _QuartileWindows(sketches[col], width) for col in pending}
+        for chunk in iter_chunks(source, chunksize, columns=pending):
+            for col, window in windows.items():
+                if col in chunk.columns:
+                    window.update(_numeric_values(chunk[col]))
+        for col, window in windows.items():
+            count = window.outlier_count()
+            if count is not None:
+                counts[col] = count
+        pending = [col for col in pending if col not in counts]
+        # Brackets spanning [0, 1] hold every value, so this always terminates
+        width = 1.0 if width >= 0.25 else width * 4
+    return counts
+
+
+def detect_anomalies_stream(source: ChunkSource, anomaly_type: Optional[str] = None,
+                            chunksize: Optional[int] = None, error: float = 0.01,
+                            exact_outliers: bool = False, approximate_duplicates: bool = False,
+                            precision: int = 14,
+                            random_state: Optional[int] = None, sample: Optional[int] = None,
+                            fraction: Optional[float] = None, stratify: Optional[str] = None,
+                            confidence: float = 0.95) -> Dict[str, Union[Dict, str]]:
+    """
+    Detect missing values, outliers and duplicates in data read chunk by chunk.
+
+    Missing values are counted exactly. Duplicate rows are found exactly (up
+    to 64-bit hash collisions) by keeping one fingerprint per distinct row
+    rather than the rows themselves. Outliers use the 1.5 x IQR rule of
+    ``detect_anomalies``, with quartiles and counts estimated from a quantile
+    sketch in a single pass, or computed exactly with ``exact_outliers=True``
+    at the cost of re-reading the source.
+
+    Parameters
+    ----------
+    source : pandas.DataFrame, str, os.PathLike or iterable of pandas.DataFrame
+        The data to analyze: an iterable of DataFrame chunks, or the path of a
+        CSV or Parquet file to be read in chunks of ``chunksize`` rows.
+    anomaly_type : str, optional
+        Specify which anomaly to check ('missing_values', 'outliers', or 'duplicates').
+        If None, all anomaly types will be checked.
+    chunksize : int, optional
+        Number of rows read per chunk from a file. Default is 100,000.
+    error : float, optional
+        Target normalized rank error of the quartile sketches. Default is 0.01.
+    exact_outliers : bool, optional
+        If True, make extra passes over the source to compute the quartiles and
+        outlier counts exactly. The source must then be re-readable (a path, a
+        DataFrame or a list of chunks, not a one-shot iterator). Default is False.
+    approximate_duplicates : bool, optional
+        If True, estimate duplicates with a HyperLogLog sketch of fixed size
+        ``2**precision`` bytes instead of keeping a fingerprint per distinct
+        row. The duplicates entry then carries an ``error_bound`` in rows.
+        Default is False.
+    precision : int, optional
+        HyperLogLog precision used when ``approximate_duplicates`` is True. Default is 14.
+    random_state : int, optional
+        Seed for the sketches (or the sample), for reproducible results.
+    sample : int, optional
+        Quick-profile mode: keep a reservoir sample of this many rows while
+        reading and estimate the anomalies from it, with confidence
+        intervals, as ``detect_anomalies`` does with ``sample``. Default is None.
+    fraction : float, optional
+        Like ``sample``, keeping each row with this probability.
+    stratify : str, optional
+        Column whose groups are sampled in proportion to their size.
+    confidence : float, optional
+        Confidence level of the intervals in quick-profile mode. Default is 0.95.
+
+    Returns
+    -------
+    dict
+        A dictionary in the same format as ``detect_anomalies``.
+
+    Raises
+    ------
+    TypeError
+        If the source is not a DataFrame, a file path or an iterable of DataFrames.
+    ValueError
+        If ``exact_outliers`` is requested on a source that can only be read once.
+
+    Example
+    -------
+    >>> detect_anomalies_stream("data/example_data.csv", chunksize=500, anomaly_type='duplicates')
+    {'duplicates': {'duplicate_count': 10, 'duplicate_percentage': 0.99}}
+    """
+    if sample is not None or fraction is not None:
+        rows, total_rows = _sample_stream(source, chunksize, sample, fraction, stratify, confidence, random_state)
+        return sampled_anomalies(rows, total_rows, anomaly_type, {'iqr': 1.5}, False, confidence)
+
+    if exact_outliers and anomaly_type in (None, 'outliers') and not is_reiterable(source):
+        raise ValueError("exact_outliers requires a source that can be read twice, such as a file path.")
+
+    check_missing = anomaly_type is None or anomaly_type == 'missing_values'
+    check_outliers = anomaly_type is None or anomaly_type == 'outliers'
+    check_duplicates = anomaly_type is None or anomaly_type == 'duplicates'
+
+    state = ProfileState(error, approximate_duplicates, precision, random_state,
+                         track_missing=check_missing, track_quantiles=check_outliers,
+                         track_duplicates=check_duplicates)
+    for chunk in iter_chunks(source, chunksize):
+        state.update(chunk)
+
+    report = {}
+    if check_missing:
+        report.update(state.anomalies('missing_values'))
+    if check_outliers:
+        if exact_outliers:
+            outlier_counts = _exact_outlier_counts(source, chunksize, state.sketches, error)
+            report['outliers'] = outlier_report(outlier_counts, state.total_rows)
+        else:
+            report.update(state.anomalies('outliers'))
+    if check_duplicates:
+        report.update(state.anomalies('duplicates'))
+    return report
+
+
+def estimate_cardinality(source: ChunkSource, columns: Optional[List] = None,
+                         chunksize: Optional[int] = None,
+                         precision: int = 14) -> Dict[str, Dict[str, int]]:
+    """
+    Estimate the number of distinct values in each column with HyperLogLog.
+
+    Each column gets one fixed-size sketch (``2**precision`` bytes), so memory
+    does not grow with the data. Sketches are mergeable: profiling partitions
+    separately with ``HyperLogLog`` and merging gives the same estimate as
+    profiling them together.
+
+    Parameters
+    ----------
+    source : pandas.DataFrame, str, os.PathLike or iterable of pandas.DataFrame
+        The data to analyze, in memory or read chunk by chunk.
+    columns : list, optional
+        Columns to estimate. If None, all columns are estimated.
+    chunksize : int, optional
+        Number of rows read per chunk from a file. Default is 100,000.
+    precision : int, optional
+        Number of HyperLogLog index bits, between 4 and 18. Default is 14
+        (16 KiB per column, about 0.8% relative standard error).
+
+    Returns
+    -------
+    dict
+        For each column, ``distinct_estimate`` and ``error_bound`` (two
+        standard errors, about 95% confidence).
+
+    Example
+    -------
+    >>> df = pd.DataFrame({'A': [1, 2, 2, 3], 'B': ['x', 'x', 'x', 'y']})
+    >>> estimate_cardinality(df)
+    {'A': {'distinct_estimate': 3, 'error_bound': 1}, 'B': {'distinct_estimate': 2, 'error_bound': 1}}
+    """
+    sketches: Dict[str, HyperLogLog] = {}
+    for chunk in iter_chunks(source, chunksize, columns=columns):
+        for col in chunk.columns:
+            if col not in sketches:
+                sketches[col] = HyperLogLog(precision)
+            sketches[col].update(column_hashes(chunk[col]))
+    result = {}
+    for col, sketch in sketches.items():
+        estimate = sketch.estimate()
+        result[col] = {
+            "distinct_estimate": int(round(estimate)),
+            "error_bound": int(np.ceil(2 * sketch.relative_error * estimate))
+        }
+    return result
+
+
+def profile_categoricals(source: ChunkSource, columns: Optional[List] = None, top_k: int = 10,
+                         chunksize: Optional[int] = None, capacity: int = 1000,
+                         precision: int = 14) -> Dict[str, Dict]:
+    """
+    Profile categorical columns: most frequent values and approximate distinct count.
+
+    Each column keeps a Space-Saving heavy-hitter sketch of ``capacity``
+    values and a HyperLogLog sketch, so memory stays bounded however many
+    distinct values an ID-like column has. Values that are not among the
+    ``top_k`` most frequent are lumped into ``other_count``.
+
+    Parameters
+    ----------
+    source : pandas.DataFrame, str, os.PathLike or iterable of pandas.DataFrame
+        The data to analyze, in memory or read chunk by chunk.
+    columns : list, optional
+        Columns to profile. If None, the object, category and bool columns
+        are profiled.
+    top_k : int, optional
+        Number of most frequent values reported per column. Default is 10.
+    chunksize : int, optional
+        Number of rows read per chunk from a file. Default is 100,000.
+    capacity : int, optional
+        Number of values monitored by each heavy-hitter sketch; must be at
+        least ``top_k``. Any value making up more than ``1 / capacity`` of the
+        rows is guaranteed to be monitored, and counts are exact while a
+        column has fewer distinct values. Default is 1,000.
+    precision : int, optional
+        Number of HyperLogLog index bits, between 4 and 18. Default is 14.
+
+    Returns
+    -------
+    dict
+        For each column: ``count`` (rows), ``missing_count``,
+        ``distinct_estimate`` and ``error_bound`` as in ``estimate_cardinality``,
+        ``top_values`` (a list of ``{'value', 'count', 'error'}`` records, where
+        the true count lies between ``count - error`` and ``count``) and
+        ``other_count`` (rows holding any other value).
+
+    Raises
+    ------
+    ValueError
+        If ``top_k`` is not positive or exceeds ``capacity``.
+
+    Example
+    -------
+    >>> df = pd.DataFrame({'city': ['Paris', 'Lima', 'Paris', 'Oslo']})
+    >>> profile_categoricals(df, top_k=1)['city']['top_values']
+    [{'value': 'Paris', 'count': 2, 'error': 0}]
+    """
+    if top_k < 1 or top_k > capacity:
+        raise ValueError("top_k must be a positive integer no larger than capacity.")
+    heavy_hitters: Dict[str, SpaceSaving] = {}
+    sketches: Dict[str, HyperLogLog] = {}
+    missing: Dict[str, int] = {}
+    for chunk in iter_chunks(source, chunksize, columns=columns):
+        targets = list(chunk.columns)
+        if columns is None:
+            # A column stays profiled once any chunk shows it as categorical
+            categorical = chunk.iloc[:0].select_dtypes(include=['object', 'category', 'bool']).columns
+            targets = [col for col in targets if col in heavy_hitters or col in categorical]
+        chunk_missing = missing_counts(chunk, targets)
+        for col in targets:
+            if col not in heavy_hitters:
+                heavy_hitters[col], sketches[col], missing[col] = SpaceSaving(capacity), HyperLogLog(precision), 0
+            series = chunk[col]
+            heavy_hitters[col].update(series)
+            sketches[col].update(column_hashes(series))
+            missing[col] += int(chunk_missing[col])
+
+    result = {}
+    for col, hitters in heavy_hitters.items():
+        top = hitters.top(top_k)
+        estimate = sketches[col].estimate()
+        result[col] = {
+            "count": hitters.total,
+            "missing_count": missing[col],
+            "distinct_estimate": int(round(estimate)),
+            "error_bound": int(np.ceil(2 * sketches[col].relative_error * estimate)),
+            "top_values": [
+                {"value": None if pd.isna(value) else value, "count": int(count), "error": int(error)}
+                for value, count, error in top.itertuples(index=False)
+            ],
+            "other_count": hitters.total - int(top['count'].sum())
+        }
+    return result
+
+
+def missing_patterns(source: ChunkSource, top_k: int = 10, columns: Optional[List] = None,
+                     chunksize: Optional[int] = None, capacity: int = 1000) -> Dict[str, Union[List, pd.DataFrame]]:
+    """
+    Find the most frequent combinations of missing columns and how often columns are missing together.
+
+    Null masks are packed one bit per cell and counted with popcounts, so
+    wide tables stay cheap: per chunk, 1,000 columns of 100,000 rows take
+    about 12 MB of masks. The pattern frequencies are tracked by a
+    Space-Saving sketch, so memory stays bounded however many distinct
+    patterns the rows show.
+
+    Parameters
+    ----------
+    source : pandas.DataFrame, str, os.PathLike or iterable of pandas.DataFrame
+        The data to analyze, in memory or read chunk by chunk.
+    top_k : int, optional
+        Number of most frequent patterns reported. Default is 10.
+    columns : list, optional
+        Columns to analyze. If None, all columns are analyzed.
+    chunksize : int, optional
+        Number of rows read per chunk from a file. Default is 100,000.
+    capacity : int, optional
+        Number of patterns tracked; must be at least ``top_k``. Pattern counts
+        are exact while there are fewer distinct patterns. Default is 1,000.
+
+    Returns
+    -------
+    dict
+        ``patterns``: a list of ``{'columns', 'count', 'percentage'}`` records,
+        most frequent first, where ``columns`` lists the columns missing in
+        those rows (empty for complete rows). ``co_missing``: a DataFrame
+        over the columns with missing values giving, for each pair, the
+        number of rows where both are missing; the diagonal holds each
+        column's missing count.
+
+    Raises
+    ------
+    ValueError
+        If ``top_k`` is not positive or exceeds ``capacity``.
+
+    Example
+    -------
+    >>> df = pd.DataFrame({'A': [1, None, None, 4], 'B': [2, None, None, None]})
+    >>> result = missing_patterns(df, top_k=1)
+    >>> result['patterns']
+    [{'columns': ['A', 'B'], 'count': 2, 'percentage': 50.0}]
+    >>> result['co_missing']
+       A  B
+    A  2  2
+    B  2  3
+    """
+    if top_k < 1 or top_k > capacity:
+        raise ValueError("top_k must be a positive integer no larger than capacity.")
+    state = MissingnessState(capacity)
+    for chunk in iter_chunks(source, chunksize, columns=columns):
+        state.update(chunk)
+    return state.report(top_k)
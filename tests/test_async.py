@@ -0,0 +1,83 @@
+import asyncio
+import threading
+import time
+import pytest
+import pandas as pd
+from datpro import AsyncProfiler, ProfilerBusyError, detect_anomalies, detect_anomalies_async, summarize_data
+from datpro._parallel import checkpoint
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({'A': [1, 2, None, 4, 1000], 'B': [5, 6, 7, 8, 5], 'C': list('abcda')})
+
+def test_async_matches_sync(df):
+    """Test that the async functions return what the blocking ones do."""
+    async def main():
+        profiler = AsyncProfiler(max_concurrency=2)
+        return await asyncio.gather(profiler.summarize_data(df), detect_anomalies_async(df),
+                                    profiler.plotify(df, plot_types=['histogram']))
+
+    summary, report, charts = asyncio.run(main())
+    pd.testing.assert_frame_equal(summary, summarize_data(df))
+    assert report == detect_anomalies(df)
+    assert list(charts) == ['histogram_A', 'histogram_B']
+
+def test_async_concurrency_limit():
+    """Test that no more than max_concurrency calls run at once."""
+    active = []
+    peak = []
+
+    def work():
+        active.append(1)
+        peak.append(len(active))
+        time.sleep(0.02)
+        active.pop()
+
+    async def main():
+        profiler = AsyncProfiler(max_concurrency=2)
+        await asyncio.gather(*(profiler.run(work) for _ in range(6)))
+
+    asyncio.run(main())
+    assert max(peak) == 2
+
+def test_async_backpressure():
+    """Test that calls beyond max_pending waiters are rejected."""
+    release = threading.Event()
+
+    async def main():
+        profiler = AsyncProfiler(max_concurrency=1, max_pending=1)
+        running = asyncio.ensure_future(profiler.run(release.wait))
+        await asyncio.sleep(0.01)
+        waiting = asyncio.ensure_future(profiler.run(lambda: None))
+        await asyncio.sleep(0)
+        with pytest.raises(ProfilerBusyError):
+            await profiler.run(lambda: None)
+        release.set()
+        await asyncio.gather(running, waiting)
+
+    asyncio.run(main())
+
+def test_async_cancellation():
+    """Test that cancelling a call stops its worker and frees its slot."""
+    stopped = threading.Event()
+
+    def work():
+        try:
+            while True:
+                checkpoint()
+                time.sleep(0.001)
+        finally:
+            stopped.set()
+
+    async def main():
+        profiler = AsyncProfiler(max_concurrency=1)
+        task = asyncio.ensure_future(profiler.run(work))
+        await asyncio.sleep(0.02)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert stopped.is_set()
+        assert profiler.running == 0
+        return await profiler.run(lambda: 'free')
+
+    assert asyncio.run(main()) == 'free'
@@ -0,0 +1,51 @@
+import json
+import pandas as pd
+from datpro.cli import expand_paths, main
+
+def _write_files(tmp_path):
+    df = pd.DataFrame({'A': [1, 2, None, 4, 1000, 1], 'B': list('xyzxyx')})
+    df.to_csv(tmp_path / 'one.csv', index=False)
+    df.to_parquet(tmp_path / 'two.parquet')
+    return df
+
+def test_cli_writes_reports(tmp_path):
+    """Test that every file gets a JSON report and an entry in index.json."""
+    _write_files(tmp_path)
+    out = tmp_path / 'reports'
+    assert main([str(tmp_path / '*.csv'), str(tmp_path / '*.parquet'), '-o', str(out), '-w', '1', '-q']) == 0
+    index = json.loads((out / 'index.json').read_text())
+    assert [entry['status'] for entry in index['files']] == ['ok', 'ok']
+    assert index['failed'] == 0
+    report = json.loads((out / 'one.csv.json').read_text())
+    assert report['rows'] == 6
+    assert report['summary']['A']['max'] == 1000.0
+    assert report['anomalies']['missing_values']['A']['missing_count'] == 1
+    assert report == {**json.loads((out / 'two.parquet.json').read_text()),
+                      'path': report['path'], 'seconds': report['seconds']}
+
+def test_cli_stdout_and_stream(tmp_path, capsys):
+    """Test that --output - prints one JSON record per file, also with --stream."""
+    _write_files(tmp_path)
+    assert main([str(tmp_path / 'one.csv'), '--stream', '--anomaly-type', 'duplicates', '-o', '-', '-q']) == 0
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert len(records) == 1
+    assert records[0]['anomalies'] == {'duplicates': {'duplicate_count': 1, 'duplicate_percentage': 16.67}}
+
+def test_cli_failure_exit_status(tmp_path):
+    """Test that a file that cannot be profiled is recorded and gives exit status 1."""
+    _write_files(tmp_path)
+    (tmp_path / 'bad.csv').write_text('a,b\n1,2,3,4\n"')
+    out = tmp_path / 'reports'
+    assert main([str(tmp_path / '*.csv'), '-o', str(out), '-q']) == 1
+    index = json.loads((out / 'index.json').read_text())
+    assert index['failed'] == 1
+    assert {entry['path'].rsplit('/', 1)[-1]: entry['status'] for entry in index['files']} == {
+        'bad.csv': 'error', 'one.csv': 'ok'}
+
+def test_expand_paths(tmp_path):
+    """Test that recursive patterns match nested files once each."""
+    (tmp_path / 'sub').mkdir()
+    for name in ['a.csv', 'sub/b.csv', 'sub/c.txt']:
+        (tmp_path / name).write_text('x\n1\n')
+    paths = expand_paths([str(tmp_path / '**' / '*.csv'), str(tmp_path / 'a.csv')])
+    assert sorted(p.rsplit('/', 1)[-1] for p in paths) == ['a.csv', 'b.csv']
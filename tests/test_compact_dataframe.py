@@ -0,0 +1,44 @@
+import pytest
+import numpy as np
+import pandas as pd
+from datpro import compact_dataframe, detect_anomalies
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(0)
+    n = 1000
+    df = pd.DataFrame({
+        'id': np.arange(n),
+        'team': rng.choice(['red', 'green', 'blue'], n).astype(object),
+        'name': [f"user{i}" for i in rng.permutation(n)],
+        'score': rng.integers(0, 100, n).astype(float),
+        'value': rng.normal(size=n)
+    })
+    df.loc[::7, 'score'] = np.nan
+    df.loc[::11, 'team'] = np.nan
+    return pd.concat([df, df.iloc[:10]], ignore_index=True)
+
+def test_compact_dataframe_dtypes(df):
+    """Test that columns get the smallest lossless dtypes and the saving is reported."""
+    result = compact_dataframe(df)
+    assert result['id'].dtype == np.int16
+    assert isinstance(result['team'].dtype, pd.CategoricalDtype)
+    assert result['name'].dtype == pd.StringDtype('pyarrow')
+    assert result['score'].dtype == np.float32
+    assert result['value'].dtype == np.float64
+    compaction = result.attrs['compaction']
+    assert compaction['bytes_after'] < compaction['bytes_before'] / 2
+    assert set(compaction['converted']) == {'id', 'team', 'name', 'score'}
+    pd.testing.assert_frame_equal(result.astype(df.dtypes), df)
+
+def test_detect_anomalies_compact(df):
+    """Test that profiling the compacted frame gives the same report plus the memory saved."""
+    report = detect_anomalies(df, compact=True)
+    compaction = report.pop('compaction')
+    assert report == detect_anomalies(df)
+    assert compaction['saved_percentage'] > 50
+
+def test_compact_dataframe_invalid_input():
+    """Test that a non-DataFrame input raises a TypeError."""
+    with pytest.raises(TypeError):
+        compact_dataframe([1, 2, 3])
@@ -1,5 +1,7 @@
 import pytest
 import pandas as pd
+import numpy as np
+import tracemalloc
 from datpro.datpro import detect_anomalies
 
 def test_missing_values():
@@ -78,3 +80,151 @@ def test_non_dataframe_input():
     """Test that a non-DataFrame input raises an error."""
     with pytest.raises(TypeError, match="Input must be a pandas DataFrame."):
         detect_anomalies([1, 2, 3])
+
+def test_outliers_ignore_missing_values():
+    """Test that outlier bounds are computed on non-missing values only."""
+    data = {
+        'col1': [1, 2, None, 3, 2, 1000],
+        'col2': [None, None, None, None, None, None]
+    }
+    df = pd.DataFrame(data)
+    result = detect_anomalies(df, anomaly_type='outliers')
+    assert result['outliers'] == {'col1': {'outlier_count': 1, 'outlier_percentage': 16.67}}
+
+def test_approximate_duplicates():
+    """Test that the HyperLogLog estimate reports duplicates with an error bound."""
+    data = {
+        'col1': list(range(5000)) * 2,
+        'col2': ['x', 'y'] * 5000
+    }
+    df = pd.DataFrame(data)
+    result = detect_anomalies(df, anomaly_type='duplicates', approximate_duplicates=True)
+    duplicates = result['duplicates']
+    assert duplicates['approximate'] is True
+    assert abs(duplicates['duplicate_count'] - 5000) <= duplicates['error_bound']
+
+def test_parallel_matches_serial():
+    """Test that checking column blocks concurrently gives the serial report."""
+    data = {f'col{i}': [1, 2, None, 4, 5, 1000 * i] for i in range(8)}
+    data['label'] = ['a', 'b', 'a', 'b', 'a', 'b']
+    df = pd.DataFrame(data)
+    assert detect_anomalies(df, n_jobs=4) == detect_anomalies(df)
+
+def test_detect_anomalies_arrow_table():
+    """
+    Test that an Arrow table gives the same report as the equivalent DataFrame.
+    """
+    pa = pytest.importorskip("pyarrow")
+    df = pd.DataFrame({
+        'A': [1.0, 2.0, np.nan, 4.0, 1.0, 1000.0, np.nan],
+        'B': pd.array([5, 6, 7, 8, 5, 9, None], dtype='Int64'),
+        'C': ['a', 'b', 'c', None, 'a', 'e', None]
+    })
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    assert detect_anomalies(table) == detect_anomalies(df)
+    assert detect_anomalies(table, approximate_duplicates=True) == detect_anomalies(df, approximate_duplicates=True)
+
+def test_detect_anomalies_arrow_nan_and_null():
+    """
+    Test that NaN and null both count as missing and compare equal for duplicates.
+    """
+    pa = pytest.importorskip("pyarrow")
+    table = pa.table({'A': pa.array([1.0, float('nan'), None, 2.0], from_pandas=False)})
+    report = detect_anomalies(table)
+    assert report['missing_values']['A']['missing_count'] == 2
+    assert report['duplicates']['duplicate_count'] == 1
+
+def test_outlier_methods():
+    """Test z-score and MAD outliers against their formulas, in one call."""
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({'col1': rng.standard_t(2, size=500), 'col2': rng.normal(size=500)})
+    result = detect_anomalies(df, anomaly_type='outliers', outlier_method=['zscore', 'mad'],
+                              outlier_threshold={'zscore': 2.5})
+    s = df['col1']
+    zscore = ((s - s.mean()).abs() / s.std(ddof=0) > 2.5).sum()
+    mad = (0.6745 * (s - s.median()).abs() / (s - s.median()).abs().median() > 3.5).sum()
+    assert result['outliers']['zscore']['col1']['outlier_count'] == zscore
+    assert result['outliers']['mad']['col1']['outlier_count'] == mad
+
+def test_outlier_masks():
+    """Test that bitset and index masks mark the outlier rows."""
+    df = pd.DataFrame({'col1': [1, 2, None, 1000, 3, -500], 'col2': [5, 6, 7, 8, 9, 10]})
+    indices = detect_anomalies(df, anomaly_type='outliers', outlier_masks='indices')['outlier_masks']
+    bits = detect_anomalies(df, anomaly_type='outliers', outlier_masks='bitset')['outlier_masks']
+    assert list(indices) == ['col1']
+    assert indices['col1'].tolist() == [3, 5]
+    mask = np.unpackbits(bits['col1'], count=len(df), bitorder='little').astype(bool)
+    assert np.flatnonzero(mask).tolist() == [3, 5]
+
+def test_invalid_outlier_method():
+    """Test that an unknown outlier method raises a ValueError."""
+    with pytest.raises(ValueError, match="outlier_method"):
+        detect_anomalies(pd.DataFrame({'col1': [1, 2]}), outlier_method='grubbs')
+
+def test_detect_anomalies_sample():
+    """Test that sampled rates come with intervals covering the exact rates."""
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({'col1': rng.normal(size=50000), 'col2': rng.choice(list('abc'), 50000)})
+    df.loc[rng.random(50000) < 0.1, 'col1'] = np.nan
+    result = detect_anomalies(df, sample=5000, random_state=0, anomaly_type='missing_values')
+    entry = result['missing_values']['col1']
+    assert entry['approximate']
+    lower, upper = entry['confidence_interval']
+    assert lower <= df['col1'].isnull().mean() * 100 <= upper
+
+def test_detect_anomalies_sample_stratified():
+    """Test that a stratified sample keeps at least one row of every group."""
+    df = pd.DataFrame({'col1': [None] + list(range(999)), 'group': ['rare'] + ['common'] * 999})
+    result = detect_anomalies(df, sample=10, stratify='group', random_state=0, anomaly_type='missing_values')
+    assert result['missing_values']['col1']['missing_percentage'] == 10.0
+
+def test_detect_anomalies_sample_no_duplicate_pairs():
+    """Test that a sample without identical pairs still bounds the duplicate rate."""
+    df = pd.DataFrame({'col1': np.arange(10000)})
+    entry = detect_anomalies(df, sample=2000, random_state=0, anomaly_type='duplicates')['duplicates']
+    assert entry['duplicate_count'] == 0
+    assert entry['approximate']
+    lower, upper = entry['confidence_interval']
+    assert lower == 0.0 and 0.5 < upper < 1.0
+
+def test_detect_anomalies_subset():
+    """Test duplicate checks restricted to a subset of columns."""
+    df = pd.DataFrame({'id': [1, 1, 2, 3], 'name': ['a', 'a', 'b', 'c'], 'seen': [1, 2, 3, 4]})
+    assert detect_anomalies(df, anomaly_type='duplicates')['duplicates'] == "No duplicate rows detected."
+    report = detect_anomalies(df, anomaly_type='duplicates', subset=['id', 'name'])
+    assert report['duplicates'] == {'duplicate_count': 1, 'duplicate_percentage': 25.0}
+    with pytest.raises(KeyError):
+        detect_anomalies(df, subset=['missing'])
+
+def test_detect_anomalies_near_duplicates():
+    """Test the near-duplicate clusters entry."""
+    df = pd.DataFrame({'name': ['Ann Lee', 'ann lee ', 'Bo Chan', 'Cy Diaz'], 'seen': [1, 2, 3, 4]},
+                      index=list('wxyz'))
+    report = detect_anomalies(df, anomaly_type='duplicates', near_duplicates=True, subset=['name'])
+    assert report['near_duplicates'] == {
+        'near_duplicate_count': 1, 'near_duplicate_percentage': 25.0, 'cluster_count': 1,
+        'clusters': [{'rows': ['w', 'x'], 'count': 2}]
+    }
+    with pytest.raises(ValueError):
+        detect_anomalies(df, near_duplicates=True, sample=2)
+
+def test_detect_anomalies_empty_numeric():
+    """Test that a DataFrame with numeric columns but no rows has no outliers."""
+    df = pd.DataFrame({'a': pd.Series([], dtype=float)})
+    assert detect_anomalies(df)['outliers'] == "No outliers detected."
+
+def test_missing_values_memory(monkeypatch):
+    """Test that missing values are counted in column blocks, never through a mask of the whole frame."""
+    monkeypatch.setattr('datpro._missing._MASK_BYTES', 1 << 16)
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(size=(20_000, 100)))
+    df = df.mask(df > 2)
+    tracemalloc.start()
+    try:
+        result = detect_anomalies(df, anomaly_type='missing_values')
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert [result['missing_values'][col]['missing_count'] for col in df.columns] == df.isna().sum().tolist()
+    # The whole frame's boolean mask alone would take 2 MB
+    assert peak < df.size / 5
@@ -0,0 +1,76 @@
+import pytest
+import numpy as np
+import pandas as pd
+from datpro.datpro import detect_anomalies
+from datpro.streaming import detect_anomalies_stream
+
+@pytest.fixture
+def anomalous_df():
+    """DataFrame with missing values, an outlier and duplicate rows."""
+    return pd.DataFrame({
+        'col1': [1, 2, None, 4, 1, 3, 2, 1000],
+        'col2': [5, 6, 7, 8, 5, 7, 6, 9],
+        'col3': ['a', 'b', 'c', 'd', 'a', 'c', 'b', 'e']
+    })
+
+def _chunks(df, size):
+    return [df.iloc[i:i + size] for i in range(0, len(df), size)]
+
+def test_stream_matches_detect_anomalies(anomalous_df):
+    """Test that small streams give the same report as detect_anomalies."""
+    result = detect_anomalies_stream(_chunks(anomalous_df, 3))
+    assert result == detect_anomalies(anomalous_df)
+
+def test_stream_duplicates_across_chunks(anomalous_df):
+    """Test that duplicates split across chunks are counted."""
+    result = detect_anomalies_stream(iter(_chunks(anomalous_df, 1)), anomaly_type='duplicates')
+    assert result['duplicates']['duplicate_count'] == 2
+
+def test_stream_duplicates_with_dtype_change():
+    """Test that a row parsed as int in one chunk and float in another is a duplicate."""
+    chunks = [pd.DataFrame({'A': [1, 2]}), pd.DataFrame({'A': [1.0, np.nan]})]
+    result = detect_anomalies_stream(chunks, anomaly_type='duplicates')
+    assert result['duplicates']['duplicate_count'] == 1
+
+def test_stream_missing_values_from_csv(anomalous_df, tmp_path):
+    """Test exact missing counts when reading a CSV file in chunks."""
+    path = tmp_path / "data.csv"
+    anomalous_df.to_csv(path, index=False)
+    result = detect_anomalies_stream(path, anomaly_type='missing_values', chunksize=2)
+    assert result['missing_values'] == {'col1': {'missing_count': 1, 'missing_percentage': 12.5}}
+
+def test_stream_exact_outliers():
+    """Test that the multi-pass mode reproduces detect_anomalies on sketched columns."""
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({'A': rng.standard_cauchy(50_000), 'B': rng.normal(size=50_000)})
+    result = detect_anomalies_stream(_chunks(df, 5_000), anomaly_type='outliers', exact_outliers=True)
+    assert result == detect_anomalies(df, anomaly_type='outliers')
+
+def test_stream_approximate_outliers():
+    """Test that single-pass outlier counts stay within the rank error bound."""
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame({'A': rng.standard_cauchy(50_000)})
+    exact = detect_anomalies(df, anomaly_type='outliers')['outliers']['A']['outlier_count']
+    result = detect_anomalies_stream(_chunks(df, 5_000), anomaly_type='outliers', error=0.01, random_state=0)
+    assert abs(result['outliers']['A']['outlier_count'] - exact) <= 0.02 * len(df)
+
+def test_stream_exact_outliers_requires_reiterable(anomalous_df):
+    """Test that exact outliers on a one-shot iterator raise a ValueError."""
+    with pytest.raises(ValueError, match="exact_outliers"):
+        detect_anomalies_stream(iter(_chunks(anomalous_df, 3)), exact_outliers=True)
+
+def test_stream_empty():
+    """Test that an empty stream reports no anomalies."""
+    result = detect_anomalies_stream([])
+    assert result['missing_values'] == "No missing values detected."
+    assert result['outliers'] == "No outliers detected."
+    assert result['duplicates'] == "No duplicate rows detected."
+
+def test_stream_duplicates_large_integers():
+    """Test that distinct integers above 2**53 are not merged into duplicates."""
+    df = pd.DataFrame({'id': [2**53, 2**53 + 1, 2**53 + 2, 2**53 + 3]})
+    assert detect_anomalies_stream(df, 'duplicates')['duplicates'] == "No duplicate rows detected."
+    assert detect_anomalies(df, 'duplicates', approximate_duplicates=True)['duplicates'] == "No duplicate rows detected."
+    # A copy of a large integer in a chunk parsed as float still matches
+    chunks = [df, pd.DataFrame({'id': [float(2**53 + 2), np.nan]})]
+    assert detect_anomalies_stream(chunks, 'duplicates')['duplicates']['duplicate_count'] == 1
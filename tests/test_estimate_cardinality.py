@@ -0,0 +1,42 @@
+import pytest
+import numpy as np
+import pandas as pd
+from datpro._hashing import column_hashes
+from datpro._sketches import HyperLogLog
+from datpro.streaming import estimate_cardinality
+
+def test_estimate_cardinality_small():
+    """Test that small cardinalities are estimated exactly."""
+    df = pd.DataFrame({'A': [1, 2, 2, 3, None], 'B': ['x', 'x', 'x', 'y', 'y']})
+    result = estimate_cardinality(df)
+    assert result['A']['distinct_estimate'] == 4
+    assert result['B']['distinct_estimate'] == 2
+
+def test_estimate_cardinality_chunks_within_error():
+    """Test that streamed estimates stay within the reported error bound."""
+    rng = np.random.default_rng(0)
+    values = rng.integers(0, 100_000, size=300_000)
+    chunks = (pd.DataFrame({'id': part}) for part in np.array_split(values, 10))
+    result = estimate_cardinality(chunks)
+    assert abs(result['id']['distinct_estimate'] - len(np.unique(values))) <= result['id']['error_bound']
+
+def test_estimate_cardinality_columns():
+    """Test that only the requested columns are estimated."""
+    df = pd.DataFrame({'A': [1, 2], 'B': [3, 4]})
+    assert list(estimate_cardinality(df, columns=['B'])) == ['B']
+
+def test_hyperloglog_merge():
+    """Test that merging partition sketches equals sketching all partitions together."""
+    series = pd.Series(np.arange(50_000))
+    whole = HyperLogLog().update(column_hashes(series))
+    left = HyperLogLog().update(column_hashes(series[:20_000]))
+    right = HyperLogLog().update(column_hashes(series[15_000:]))
+    assert left.merge(right).estimate() == whole.estimate()
+    assert whole.registers.nbytes == 2 ** 14
+
+def test_hyperloglog_invalid_precision():
+    """Test that precision outside 4-18 raises a ValueError."""
+    with pytest.raises(ValueError):
+        HyperLogLog(precision=30)
+    with pytest.raises(ValueError):
+        HyperLogLog(10).merge(HyperLogLog(12))
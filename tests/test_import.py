@@ -0,0 +1,25 @@
+import subprocess
+import sys
+
+def _run(code):
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout.split()
+
+def test_import_does_not_load_plotting_stack():
+    """Test that importing datpro and profiling data leaves Altair unloaded."""
+    loaded = _run(
+        "import sys, pandas as pd, datpro; "
+        "datpro.summarize_data(pd.DataFrame({'A': [1, 2, 3]})); "
+        "datpro.detect_anomalies(pd.DataFrame({'A': [1, 2, 3]})); "
+        "print(*[m for m in ('altair', 'jsonschema', 'importlib.metadata', 'asyncio') if m in sys.modules])"
+    )
+    assert loaded == []
+
+def test_plotify_loads_altair():
+    """Test that the first plotify call imports Altair and the version is still available."""
+    output = _run(
+        "import sys, pandas as pd, datpro; "
+        "datpro.plotify(pd.DataFrame({'A': [1, 2, 3]}), plot_types=['histogram']); "
+        "print('altair' in sys.modules, datpro.__version__)"
+    )
+    assert output[0] == 'True'
+    assert output[1]
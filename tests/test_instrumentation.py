@@ -0,0 +1,47 @@
+import pytest
+import pandas as pd
+from datpro import add_hook, profile_stages, remove_hook
+from datpro.datpro import detect_anomalies, plotify, summarize_data
+from datpro.instrumentation import stage
+
+@pytest.fixture
+def sample_df():
+    """DataFrame with numeric and categorical columns."""
+    return pd.DataFrame({
+        'A': [1, 2, None, 4, 1, 100],
+        'B': [5.0, 6.0, 7.0, 8.0, 5.0, 9.0],
+        'C': ['x', 'y', 'x', 'y', 'x', 'y']
+    })
+
+def test_detect_anomalies_events(sample_df):
+    """Test that every stage of detect_anomalies reports per-column events."""
+    with profile_stages() as events:
+        detect_anomalies(sample_df)
+    stages = {(event.stage, event.columns) for event in events}
+    assert {('missing_values', ('A',)), ('missing_values', ('C',)), ('outliers', ('A',)),
+            ('outliers', ('B',)), ('duplicates', ('A', 'B', 'C'))} <= stages
+    assert all(event.function == 'detect_anomalies' and event.rows == 6 for event in events)
+    assert all(event.seconds >= 0 and event.memory_delta is None for event in events)
+
+def test_plotify_events(sample_df, tmp_path):
+    """Test that plotify reports one event per chart built and per file saved."""
+    with profile_stages() as events:
+        charts = plotify(sample_df, plot_types=['scatter', 'bar'], save=True, save_path=str(tmp_path))
+    built = [(event.stage, event.columns) for event in events if event.stage != 'save']
+    assert sorted(built) == [('bar', ('C',)), ('scatter', ('A', 'B'))]
+    assert len([event for event in events if event.stage == 'save']) == len(charts)
+
+def test_trace_memory(sample_df):
+    """Test that memory deltas are reported when tracing memory."""
+    with profile_stages(trace_memory=True) as events:
+        summarize_data(sample_df)
+    assert events and all(event.memory_delta >= 0 for event in events)
+
+def test_hooks_disabled(sample_df):
+    """Test that a removed hook receives no events and stages are no-ops."""
+    events = []
+    add_hook(events.append)
+    remove_hook(events.append)
+    detect_anomalies(sample_df)
+    assert events == []
+    assert stage('detect_anomalies', 'outliers') is stage('plotify', 'save')
@@ -0,0 +1,41 @@
+import pytest
+import numpy as np
+import pandas as pd
+from datpro import missing_patterns
+from datpro._missing import null_bitsets, popcount
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(size=(2003, 12)), columns=[f"c{i}" for i in range(12)])
+    df = df.mask(rng.random(df.shape) < np.linspace(0, 0.05, 12))
+    df.iloc[:300, 2:5] = np.nan
+    df['label'] = ['x', None, 'y'] * 667 + ['x', 'y']
+    return df
+
+def test_missing_patterns_small():
+    """Test the patterns and co-missingness matrix of a small frame."""
+    df = pd.DataFrame({'A': [1, None, None, 4, None], 'B': [None, None, 3, 4, None], 'C': [1, 2, 3, 4, 5]})
+    result = missing_patterns(df, top_k=4)
+    assert result['patterns'][0] == {'columns': ['A', 'B'], 'count': 2, 'percentage': 40.0}
+    assert sorted(entry['columns'] for entry in result['patterns'][1:]) == [[], ['A'], ['B']]
+    expected = pd.DataFrame([[3, 2], [2, 3]], index=['A', 'B'], columns=['A', 'B'])
+    pd.testing.assert_frame_equal(result['co_missing'], expected)
+
+def test_missing_patterns_stream_matches_exact(df):
+    """Test that streamed pattern counts and co-missingness equal the exact ones."""
+    chunks = (df.iloc[start:start + 301] for start in range(0, len(df), 301))
+    result = missing_patterns(chunks, top_k=5)
+    mask = df.isna()
+    exact = mask.value_counts().head(5)
+    assert [entry['count'] for entry in result['patterns']] == exact.tolist()
+    assert ['c2', 'c3', 'c4'] in [entry['columns'] for entry in result['patterns']]
+    cols = result['co_missing'].columns
+    co_missing = mask[cols].T.astype(int) @ mask[cols].astype(int)
+    np.testing.assert_array_equal(result['co_missing'].to_numpy(), co_missing.to_numpy())
+
+def test_null_bitsets_popcount(df):
+    """Test that packed masks take one bit per cell and count missing values exactly."""
+    bits = null_bitsets(df, df.columns)
+    assert bits.shape == (df.shape[1], (len(df) + 7) // 8)
+    np.testing.assert_array_equal(popcount(bits), df.isna().sum().to_numpy())
@@ -0,0 +1,52 @@
+import pytest
+import numpy as np
+import pandas as pd
+from datpro import near_duplicate_clusters
+from datpro._minhash import _bucket_pairs, lsh_bands, row_texts
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(0)
+    n = 3000
+    base = pd.DataFrame({
+        'name': [f"customer {i} {w}" for i, w in zip(range(n), rng.choice(['smith', 'jones', 'garcia'], n))],
+        'city': rng.choice(['Paris', 'Lima', 'Oslo'], n),
+        'time': (pd.Timestamp('2024-01-01') + pd.to_timedelta(rng.integers(0, 10**7, n), unit='s')).astype(str)
+    })
+    copies = base.iloc[:100].copy()
+    copies['name'] = copies['name'].str.upper() + '  '
+    return pd.concat([base, copies], ignore_index=True)
+
+def test_near_duplicate_clusters_small():
+    """Test that copies differing in case and whitespace form one cluster."""
+    df = pd.DataFrame({'name': ['Ann Lee', 'ann  lee ', 'Bo Chan', 'Cy Diaz'], 'city': ['Oslo', 'oslo', 'Lima', 'Rome']})
+    result = near_duplicate_clusters(df)
+    assert result.name == 'cluster'
+    assert result.tolist() == [0, 0, -1, -1]
+
+def test_near_duplicate_clusters_finds_copies(df):
+    """Test that altered copies join their originals and unrelated rows stay apart."""
+    clusters = near_duplicate_clusters(df).to_numpy()
+    assert (clusters[3000:] == np.arange(100)).mean() >= 0.95
+    assert (clusters[100:3000] == -1).all()
+
+def test_near_duplicate_clusters_columns(df):
+    """Test that only the chosen columns are compared."""
+    df = df.assign(noise=[f"{value:032x}" for value in np.random.default_rng(1).integers(0, 2**62, len(df))])
+    assert (near_duplicate_clusters(df)[3000:] == -1).all()
+    clusters = near_duplicate_clusters(df, columns=['name', 'city', 'time']).to_numpy()
+    assert (clusters[3000:] == np.arange(100)).mean() >= 0.95
+
+def test_near_duplicate_helpers():
+    """Test the band split, text normalization and bucket pairing."""
+    assert lsh_bands(64, 0.8) == (16, 4)
+    assert row_texts(pd.DataFrame({'a': [' X  y', None], 'b': ['Z', 'w']})).tolist() == ['x y\x02z', '\x02w']
+    first, second = _bucket_pairs(np.array([1, 1, 1, 2, 3, 3]))
+    assert sorted(zip(first, second)) == [(0, 1), (0, 2), (1, 2), (4, 5)]
+
+def test_near_duplicate_clusters_invalid():
+    """Test that invalid arguments are rejected."""
+    with pytest.raises(TypeError):
+        near_duplicate_clusters([1, 2])
+    with pytest.raises(ValueError):
+        near_duplicate_clusters(pd.DataFrame({'a': [1]}), similarity=1.5)
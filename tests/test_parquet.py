@@ -0,0 +1,59 @@
+import pytest
+import numpy as np
+import pandas as pd
+from datpro import detect_anomalies_parquet, summarize_parquet
+from datpro.datpro import detect_anomalies, summarize_data
+
+pytest.importorskip("pyarrow")
+
+@pytest.fixture
+def lake_df():
+    """DataFrame with missing values, an outlier and duplicate rows."""
+    return pd.DataFrame({
+        'col1': [1, 2, None, 4, 1, 3, 2, 1000],
+        'col2': [5, 6, 7, 8, 5, 7, 6, 9],
+        'col3': ['a', 'b', 'c', 'd', 'a', 'c', 'b', 'e']
+    })
+
+@pytest.fixture
+def lake(lake_df, tmp_path):
+    """Directory of Parquet files partitioned in two, with a metadata file to skip."""
+    (tmp_path / "part=0").mkdir()
+    (tmp_path / "part=1").mkdir()
+    lake_df.iloc[:5].to_parquet(tmp_path / "part=0" / "data.parquet", index=False, row_group_size=2)
+    lake_df.iloc[5:].to_parquet(tmp_path / "part=1" / "data.parquet", index=False)
+    (tmp_path / "_SUCCESS").write_text("")
+    return tmp_path
+
+def test_summarize_parquet_directory(lake, lake_df):
+    """Test that summarizing a directory of files matches summarize_data."""
+    result = summarize_parquet(lake)
+    pd.testing.assert_frame_equal(result, summarize_data(lake_df), check_dtype=False)
+
+def test_summarize_parquet_projection(lake):
+    """Test that only the requested numeric columns are summarized."""
+    result = summarize_parquet(lake, columns=['col2', 'col3'])
+    assert list(result.index) == ['col2']
+
+def test_detect_anomalies_parquet_matches_in_memory(lake, lake_df):
+    """Test that the Parquet report matches detect_anomalies on the same data."""
+    assert detect_anomalies_parquet(lake, chunksize=3) == detect_anomalies(lake_df)
+
+def test_missing_values_from_statistics(lake, lake_df):
+    """Test that footer null counts agree with a full scan."""
+    from_stats = detect_anomalies_parquet(lake, anomaly_type='missing_values')
+    scanned = detect_anomalies_parquet(lake, anomaly_type='missing_values', use_statistics=False)
+    assert from_stats == scanned == detect_anomalies(lake_df, anomaly_type='missing_values')
+
+def test_missing_column_in_one_file(tmp_path):
+    """Test that a column absent from one file counts as missing for its rows."""
+    pd.DataFrame({'a': [1.0, 2.0]}).to_parquet(tmp_path / "0.parquet", index=False)
+    pd.DataFrame({'a': [3.0], 'b': [np.nan]}).to_parquet(tmp_path / "1.parquet", index=False)
+    result = detect_anomalies_parquet([tmp_path / "1.parquet", tmp_path / "0.parquet"], anomaly_type='missing_values')
+    assert result['missing_values'] == {'b': {'missing_count': 3, 'missing_percentage': 100.0}}
+
+def test_summarize_parquet_empty(tmp_path):
+    """Test that an empty file raises a ValueError."""
+    pd.DataFrame({'a': pd.Series([], dtype=float)}).to_parquet(tmp_path / "empty.parquet", index=False)
+    with pytest.raises(ValueError, match="The input DataFrame is empty."):
+        summarize_parquet(tmp_path / "empty.parquet")
@@ -1,6 +1,8 @@
 from datpro.datpro import plotify
 import pytest
-import pandas as pd 
+import pandas as pd
+import numpy as np
+import altair as alt
 import shutil
 import os
 
@@ -87,6 +89,18 @@ def test_plotify_correlation_heatmap(valid_df):
     result = plotify(valid_df, plot_types=['correlation'])
     assert 'correlation_heatmap' in result
 
+def test_plotify_correlation_heatmap_reduced():
+    """
+    Test that a wide table's heatmap shows only the most correlated columns.
+    """
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(size=(100, 8)), columns=list('abcdefgh'))
+    df['h'] = df['b'] + rng.normal(scale=0.01, size=100)
+    chart = plotify(df, plot_types=['correlation'], max_heatmap_columns=3)['correlation_heatmap']
+    shown = set(chart.data['Variable 1'])
+    assert len(shown) == 3 and {'b', 'h'} <= shown
+    assert chart.to_dict()['encoding']['x']['sort'][:2] in (['b', 'h'], ['h', 'b'])
+
 def test_plotify_box_plot(valid_df):
     """
     Test that plotify generates box plots for numeric vs categorical columns.
@@ -144,6 +158,8 @@ def test_plot_saving():
     assert len(saved_files) > 0, "No plots were saved."
 
     for file in saved_files:
+        if file == "test_manifest.json":
+            continue
         assert file.endswith(".html"), f"Unexpected file format: {file}"
 
     shutil.rmtree(save_path)
@@ -166,4 +182,145 @@ def test_plotify_creates_save_directory():
     
     assert os.path.exists(test_save_path), "Save directory was not created."
     
-    shutil.rmtree(test_save_path)
\ No newline at end of file
+    shutil.rmtree(test_save_path)
+def test_plotify_aggregate_large_df():
+    """
+    Test that aggregated charts render past Altair's row limit with small specs.
+    """
+    rng = np.random.default_rng(0)
+    n = 20_000
+    df = pd.DataFrame({
+        'x': rng.normal(size=n),
+        'y': rng.exponential(size=n),
+        'g': rng.choice(['a', 'b', 'c'], size=n),
+        'h': rng.choice(['p', 'q'], size=n)
+    })
+    result = plotify(df, aggregate=True)
+    assert set(result) == set(plotify(df.head(10)))
+    for chart in result.values():
+        assert len(chart.to_json()) < 100_000
+
+def test_plotify_aggregate_histogram_counts(valid_df):
+    """
+    Test that aggregated histogram bins count every non-missing value.
+    """
+    df = valid_df.copy()
+    df.loc[0, 'age'] = np.nan
+    chart = plotify(df, plot_types=['histogram'], aggregate=True)['histogram_age']
+    assert chart.data['count'].sum() == 4
+
+def test_plotify_shared_data(tmp_path):
+    """
+    Test that shared_data writes the dataset once and charts reference it by URL.
+    """
+    df = pd.DataFrame({
+        'Age': [25, 30, 35, 40],
+        'Income': [50000, 60000, 70000, 80000],
+        'Gender': ['Male', 'Female', 'Male', 'Female']
+    })
+    result = plotify(df, save=True, save_path=str(tmp_path), file_prefix="test", shared_data='json')
+    data_file = tmp_path / "test_data.json"
+    assert data_file.exists()
+    assert len(pd.read_json(data_file)) == 4
+    for name in ['histogram_Age', 'scatter_Age_Income', 'box_Income_Gender']:
+        assert result[name].to_dict()['data']['url'] == "test_data.json"
+    assert "80000" not in (tmp_path / "test_histogram_Age.html").read_text()
+
+def test_plotify_invalid_shared_data(valid_df):
+    """
+    Test that an unsupported shared_data format raises a ValueError.
+    """
+    with pytest.raises(ValueError):
+        plotify(valid_df, shared_data='xlsx')
+
+def test_plotify_lazy(valid_df):
+    """
+    Test that lazy mode lists every plot up front but builds charts on access.
+    """
+    result = plotify(valid_df, lazy=True)
+    assert set(result) == set(plotify(valid_df))
+    assert result.built == 0
+    chart = result['scatter_age_income']
+    assert isinstance(chart, alt.Chart)
+    assert result['scatter_age_income'] is chart
+    assert result.built == 1
+    materialized = result.materialize()
+    assert isinstance(materialized, dict)
+    assert len(materialized) == len(result) == result.built
+
+def test_plotify_lazy_save(valid_df, tmp_path):
+    """
+    Test that saving in lazy mode still writes every chart.
+    """
+    result = plotify(valid_df, save=True, save_path=str(tmp_path), file_prefix="test", lazy=True)
+    for name in result:
+        assert (tmp_path / f"test_{name}.html").exists()
+
+def test_plotify_incremental_save(tmp_path):
+    """
+    Test that re-saving skips unchanged charts and rewrites changed ones.
+    """
+    df = pd.DataFrame({'A': [1, 2, 3, 4], 'B': [4, 3, 2, 1], 'C': ['x', 'y', 'x', 'y']})
+    plotify(df, save=True, save_path=str(tmp_path), file_prefix="test")
+    assert (tmp_path / "test_manifest.json").exists()
+    for path in tmp_path.glob("*.html"):
+        os.utime(path, ns=(0, 0))
+    plotify(df, save=True, save_path=str(tmp_path), file_prefix="test", n_jobs=2)
+    assert all(path.stat().st_mtime_ns == 0 for path in tmp_path.glob("*.html"))
+    df.loc[0, 'A'] = 10
+    plotify(df, plot_types=['histogram'], save=True, save_path=str(tmp_path), file_prefix="test", n_jobs=2)
+    assert (tmp_path / "test_histogram_A.html").stat().st_mtime_ns != 0
+    assert (tmp_path / "test_bar_C.html").stat().st_mtime_ns == 0
+
+def test_plotify_save_skips_rendering_unchanged(tmp_path, monkeypatch):
+    """
+    Test that a second save of unchanged charts does not render them to HTML.
+    """
+    import altair as alt
+    df = pd.DataFrame({'A': [1, 2, 3, 4], 'C': ['x', 'y', 'x', 'y']})
+    options = dict(plot_types=['histogram', 'bar'], aggregate=True, save=True, save_path=str(tmp_path), file_prefix="test")
+    plotify(df, **options)
+    rendered = []
+    to_html = alt.TopLevelMixin.to_html
+    monkeypatch.setattr(alt.TopLevelMixin, 'to_html', lambda self, *a, **k: rendered.append(self) or to_html(self, *a, **k))
+    plotify(df, **options)
+    assert rendered == []
+    df.loc[0, 'A'] = 10
+    # Only the histogram's counts changed
+    plotify(df, **options)
+    assert len(rendered) == 1
+
+def test_plotify_save_missing_file_rewritten(tmp_path):
+    """
+    Test that a chart listed in the manifest is rewritten if its file was deleted.
+    """
+    df = pd.DataFrame({'A': [1, 2, 3, 4]})
+    plotify(df, plot_types=['histogram'], save=True, save_path=str(tmp_path), file_prefix="test")
+    (tmp_path / "test_histogram_A.html").unlink()
+    plotify(df, plot_types=['histogram'], save=True, save_path=str(tmp_path), file_prefix="test")
+    assert (tmp_path / "test_histogram_A.html").exists()
+
+def test_plotify_top_k_other_bucket():
+    """Test that high-cardinality bar and stacked bar charts show the top categories and an Other bucket."""
+    df = pd.DataFrame({'id': [f"user{i}" for i in range(500)] + ['hot'] * 100,
+                       'group': ['a', 'b', 'c'] * 200})
+    result = plotify(df, plot_types=['bar', 'stacked_bar'], top_k=5)
+    bar = result['bar_id'].data
+    assert len(bar) == 6
+    assert bar['value'].iloc[0] == 'hot'
+    assert bar['value'].iloc[-1] == 'Other'
+    assert bar['count'].sum() == len(df)
+    stacked = result['stacked_bar_id_group'].data
+    assert set(stacked['x']) <= set(bar['value'])
+    assert stacked['count'].sum() == len(df)
+    # Low-cardinality columns still embed their rows
+    assert len(plotify(df, plot_types=['bar'])['bar_group'].data) == len(df)
+
+def test_plotify_compact():
+    """Test that charts of a compacted copy match those of the original."""
+    df = pd.DataFrame({'num': range(200), 'team': ['a', 'b', 'c', 'd'] * 50, 'id': [f"u{i}" for i in range(200)]})
+    charts = plotify(df, aggregate=True, top_k=3)
+    compacted = plotify(df, aggregate=True, top_k=3, compact=True)
+    assert charts.keys() == compacted.keys()
+    for name in charts:
+        assert charts[name].to_dict() == compacted[name].to_dict()
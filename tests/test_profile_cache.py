@@ -0,0 +1,99 @@
+import pytest
+import numpy as np
+import pandas as pd
+from datpro import ProfileCache
+from datpro.datpro import detect_anomalies, plotify, summarize_data
+
+@pytest.fixture
+def sample_df():
+    """DataFrame with numeric and categorical columns, a missing value and a duplicate row."""
+    return pd.DataFrame({
+        'A': [1, 2, None, 4, 1, 100],
+        'B': [5.0, 6.0, 7.0, 8.0, 5.0, 9.0],
+        'C': ['x', 'y', 'x', 'y', 'x', 'y']
+    })
+
+def test_cache_repeated_summary(sample_df):
+    """Test that a repeated summarize_data call is served from the cache and matches."""
+    cache = ProfileCache()
+    first = summarize_data(sample_df, cache=cache)
+    assert cache.hits == 0
+    second = summarize_data(sample_df.copy(), cache=cache)
+    assert cache.hits == 2
+    pd.testing.assert_frame_equal(first, second)
+    pd.testing.assert_frame_equal(first, summarize_data(sample_df))
+
+def test_cache_recomputes_changed_columns(sample_df):
+    """Test that only columns whose content changed are recomputed."""
+    cache = ProfileCache()
+    summarize_data(sample_df, cache=cache)
+    changed = sample_df.copy()
+    changed.loc[0, 'B'] = 50.0
+    misses = cache.misses
+    result = summarize_data(changed, cache=cache)
+    assert cache.misses == misses + 1
+    pd.testing.assert_frame_equal(result, summarize_data(changed))
+
+def test_cache_detect_anomalies(sample_df):
+    """Test that cached anomaly reports match uncached ones, before and after a change."""
+    cache = ProfileCache()
+    assert detect_anomalies(sample_df, cache=cache) == detect_anomalies(sample_df)
+    assert detect_anomalies(sample_df, cache=cache) == detect_anomalies(sample_df)
+    changed = sample_df.copy()
+    changed.loc[5, 'A'] = 3
+    assert detect_anomalies(changed, cache=cache) == detect_anomalies(changed)
+
+def test_cache_plotify(sample_df):
+    """Test that aggregated charts of unchanged columns are reused."""
+    cache = ProfileCache()
+    first = plotify(sample_df, plot_types=['histogram'], aggregate=True, cache=cache)
+    changed = sample_df.copy()
+    changed.loc[0, 'A'] = 3
+    second = plotify(changed, plot_types=['histogram'], aggregate=True, cache=cache)
+    assert second['histogram_B'] is first['histogram_B']
+    assert second['histogram_A'] is not first['histogram_A']
+
+def test_cache_eviction():
+    """Test that the in-memory store stays within max_bytes, evicting the oldest entries."""
+    cache = ProfileCache(max_bytes=2_000)
+    for i in range(10):
+        cache.set(('key', i), np.zeros(100))
+    assert cache.nbytes <= 2_000
+    assert ('key', 9) in cache
+    assert ('key', 0) not in cache
+
+def test_cache_disk_store(sample_df, tmp_path):
+    """Test that a new cache on the same directory reuses stored results."""
+    summarize_data(sample_df, cache=ProfileCache(directory=str(tmp_path)))
+    cache = ProfileCache(directory=str(tmp_path))
+    pd.testing.assert_frame_equal(summarize_data(sample_df, cache=cache), summarize_data(sample_df))
+    assert cache.misses == 0
+    cache.clear()
+    assert len(cache) == 0 and not list(tmp_path.glob("*.pkl"))
+
+def test_cache_full_fingerprints():
+    """Test that full fingerprints catch an in-place edit that the sampled ones skip."""
+    df = pd.DataFrame({'A': np.arange(100_000, dtype=float)})
+    sampled, full = ProfileCache(), ProfileCache(full_fingerprints=True)
+    summarize_data(df, cache=sampled)
+    summarize_data(df, cache=full)
+    # Row 1 lies between the strided sample positions 0 and 24
+    df.loc[1, 'A'] = -1.0
+    summarize_data(df, cache=sampled)
+    assert sampled.hits == 1
+    pd.testing.assert_frame_equal(summarize_data(df, cache=full), summarize_data(df))
+    assert full.hits == 0
+    df.loc[0, 'A'] = -2.0
+    summarize_data(df, cache=sampled)
+    assert sampled.misses == 2
+
+def test_cache_sizes_without_pickling(monkeypatch):
+    """Test that a memory-only cache measures entries without serializing them."""
+    def fail(*args, **kwargs):
+        raise AssertionError("pickled")
+    monkeypatch.setattr('datpro._cache.pickle.dumps', fail)
+    cache = ProfileCache()
+    frame = pd.DataFrame({'A': np.zeros(1_000), 'B': ['x'] * 1_000})
+    cache.set('frame', frame)
+    assert cache.nbytes >= frame['A'].nbytes + 1_000 * 50
+    assert cache.get('frame') is frame
@@ -0,0 +1,48 @@
+import pytest
+import numpy as np
+import pandas as pd
+from datpro._sketches import SpaceSaving
+from datpro.streaming import profile_categoricals
+
+@pytest.fixture
+def ids():
+    rng = np.random.default_rng(0)
+    # A few heavy values on top of many rare ones, like an ID column with hot keys
+    values = np.concatenate([np.repeat(['hot1', 'hot2', 'hot3'], [30_000, 20_000, 10_000]),
+                             rng.integers(0, 100_000, size=140_000).astype(str)])
+    return pd.Series(rng.permutation(values), name='id')
+
+def test_profile_categoricals_small():
+    """Test exact counts, the other bucket and missing values on a small column."""
+    df = pd.DataFrame({'city': ['Paris', 'Lima', 'Paris', 'Oslo', None], 'n': [1, 2, 3, 4, 5]})
+    result = profile_categoricals(df, top_k=1)
+    assert list(result) == ['city']
+    assert result['city'] == {
+        'count': 5, 'missing_count': 1, 'distinct_estimate': 4, 'error_bound': 1,
+        'top_values': [{'value': 'Paris', 'count': 2, 'error': 0}], 'other_count': 3
+    }
+
+def test_profile_categoricals_stream(ids):
+    """Test that heavy hitters of a streamed high-cardinality column are found with bounded memory."""
+    chunks = (ids.iloc[start:start + 10_000].to_frame() for start in range(0, len(ids), 10_000))
+    result = profile_categoricals(chunks, top_k=3, capacity=100)['id']
+    assert [entry['value'] for entry in result['top_values']] == ['hot1', 'hot2', 'hot3']
+    exact = ids.value_counts()
+    for entry in result['top_values']:
+        assert entry['count'] - entry['error'] <= exact[entry['value']] <= entry['count']
+    assert result['count'] == len(ids)
+    assert abs(result['distinct_estimate'] - ids.nunique()) <= result['error_bound']
+
+def test_space_saving_merge(ids):
+    """Test that merged partition sketches keep the heavy hitters and the total."""
+    left = SpaceSaving(50).update(ids[:120_000])
+    right = SpaceSaving(50).update(ids[120_000:])
+    merged = left.merge(right)
+    assert len(merged) == 50
+    assert merged.total == len(ids)
+    assert list(merged.top(3)['value']) == ['hot1', 'hot2', 'hot3']
+
+def test_profile_categoricals_invalid_top_k():
+    """Test that top_k larger than capacity raises a ValueError."""
+    with pytest.raises(ValueError):
+        profile_categoricals(pd.DataFrame({'A': ['x']}), top_k=10, capacity=5)
@@ -0,0 +1,49 @@
+import pytest
+import numpy as np
+import pandas as pd
+from datpro import ProfileState
+from datpro.datpro import detect_anomalies, summarize_data
+
+@pytest.fixture
+def history_df():
+    """DataFrame with missing values, an outlier and duplicate rows."""
+    return pd.DataFrame({
+        'col1': [1, 2, None, 4, 1, 3, 2, 1000],
+        'col2': [5, 6, 7, 8, 5, 7, 6, 9],
+        'col3': ['a', 'b', 'c', 'd', 'a', 'c', 'b', 'e']
+    })
+
+def test_state_matches_in_memory_functions(history_df):
+    """Test that updating in pieces gives the same reports as profiling the whole table."""
+    state = ProfileState()
+    for start in range(0, len(history_df), 3):
+        state.update(history_df.iloc[start:start + 3])
+    assert state.total_rows == len(history_df)
+    assert state.anomalies() == detect_anomalies(history_df)
+    pd.testing.assert_frame_equal(state.summary(), summarize_data(history_df), check_dtype=False)
+
+def test_state_save_and_resume(history_df, tmp_path):
+    """Test that a saved state resumes and counts duplicates against earlier rows."""
+    path = tmp_path / "profile.pkl"
+    ProfileState().update(history_df).save(path)
+    state = ProfileState.load(path)
+    state.update(history_df.head(2))
+    combined = pd.concat([history_df, history_df.head(2)])
+    assert state.anomalies() == detect_anomalies(combined)
+
+def test_state_new_column_counts_as_missing(history_df):
+    """Test that a column added in a later chunk is missing in the earlier rows."""
+    state = ProfileState().update(history_df)
+    state.update(history_df.assign(col4=1.0))
+    assert state.anomalies('missing_values')['missing_values']['col4']['missing_count'] == len(history_df)
+
+def test_state_untracked_anomaly(history_df):
+    """Test that asking for an untracked anomaly type raises a ValueError."""
+    state = ProfileState(track_duplicates=False).update(history_df)
+    with pytest.raises(ValueError):
+        state.anomalies('duplicates')
+
+def test_state_invalid_chunk():
+    """Test that a non-DataFrame chunk raises a TypeError."""
+    with pytest.raises(TypeError):
+        ProfileState().update([1, 2, 3])
@@ -1,5 +1,6 @@
 import pytest
 import pandas as pd
+import numpy as np
 from datpro.datpro import summarize_data
 
 def test_summarize_data_normal():
@@ -44,4 +45,105 @@ def test_summarize_data_invalid_input():
     with pytest.raises(TypeError, match="Input must be a pandas DataFrame."):
         summarize_data([1, 2, 3])  # Invalid input: list
     with pytest.raises(TypeError, match="Input must be a pandas DataFrame."):
-        summarize_data("not a dataframe")  # Invalid input: string
\ No newline at end of file
+        summarize_data("not a dataframe")  # Invalid input: string
+
+def test_summarize_data_matches_describe():
+    """Test that the quantile engine reproduces DataFrame.describe() exactly."""
+    df = pd.DataFrame({
+        'A': [1, 2, None, 4, 7, 11],
+        'B': [0.5, -3.25, 8.0, 8.0, 1e6, 2.0],
+        'C': [None] * 6,
+        'D': ['x', 'y', 'z', 'x', 'y', 'z']
+    })
+    expected = df.describe(percentiles=[0.25, 0.5, 0.75]).T[['min', '25%', '50%', '75%', 'max']]
+    pd.testing.assert_frame_equal(summarize_data(df), expected, check_exact=True)
+
+def test_summarize_data_parallel_matches_serial():
+    """Test that summarizing column blocks on a thread pool gives the serial result."""
+    from concurrent.futures import ThreadPoolExecutor
+    df = pd.DataFrame({f'col{i}': range(i, i + 20) for i in range(10)})
+    expected = summarize_data(df)
+    pd.testing.assert_frame_equal(summarize_data(df, n_jobs=3), expected)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        pd.testing.assert_frame_equal(summarize_data(df, executor=pool), expected)
+
+def test_process_pool_executor_rejected():
+    """Test that a process pool raises a clear TypeError before any work starts."""
+    from concurrent.futures import ProcessPoolExecutor
+    from datpro.datpro import detect_anomalies
+    df = pd.DataFrame({'A': [1, 2, 3]})
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        with pytest.raises(TypeError, match="ThreadPoolExecutor"):
+            summarize_data(df, executor=pool)
+        with pytest.raises(TypeError, match="ThreadPoolExecutor"):
+            detect_anomalies(df, executor=pool)
+
+def test_summarize_data_invalid_n_jobs():
+    """Test that n_jobs=0 raises a ValueError."""
+    df = pd.DataFrame({'A': [1, 2, 3]})
+    with pytest.raises(ValueError, match="n_jobs"):
+        summarize_data(df, n_jobs=0)
+
+def test_summarize_arrow_table():
+    """
+    Test that pyarrow Tables and RecordBatches are summarized like the equivalent DataFrame.
+    """
+    pa = pytest.importorskip("pyarrow")
+    df = pd.DataFrame({
+        'A': pd.array([1, None, 3, 4, 10], dtype='Int64'),
+        'B': [0.5, np.nan, 2.5, -1.0, 7.0],
+        'C': ['x', 'y', 'x', None, 'z']
+    })
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    expected = summarize_data(df)
+    pd.testing.assert_frame_equal(summarize_data(table), expected, check_dtype=False)
+    chunked = pa.concat_tables([table.slice(0, 2), table.slice(2)])
+    pd.testing.assert_frame_equal(summarize_data(chunked), expected, check_dtype=False)
+    pd.testing.assert_frame_equal(summarize_data(table.to_batches()[0]), expected, check_dtype=False)
+
+def test_summarize_arrow_stream_producer():
+    """
+    Test that any object exporting the Arrow C stream interface is accepted.
+    """
+    pa = pytest.importorskip("pyarrow")
+    table = pa.table({'A': [1, 2, 3, 4]})
+
+    class Producer:
+        def __arrow_c_stream__(self, requested_schema=None):
+            return table.__arrow_c_stream__(requested_schema)
+
+    assert summarize_data(Producer()).loc['A', '50%'] == 2.5
+
+def test_summarize_data_sample():
+    """Test that quick-profile mode brackets the exact quartiles and says it is approximate."""
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({'A': rng.normal(size=20000), 'B': rng.exponential(size=20000)})
+    exact = summarize_data(df)
+    result = summarize_data(df, sample=2000, confidence=0.999, random_state=0)
+    assert result.attrs['approximate'] and result.attrs['sample_rows'] == 2000
+    for label in ['25%', '50%', '75%']:
+        assert (result[(label, 'lower')] <= exact[label]).all()
+        assert (exact[label] <= result[(label, 'upper')]).all()
+    assert (result[('min', 'estimate')] >= exact['min']).all()
+
+def test_summarize_data_sample_whole_table():
+    """Test that a sample covering every row gives exact values with degenerate intervals."""
+    df = pd.DataFrame({'A': [1, 2, np.nan, 4], 'B': [100, 200, 300, 400]})
+    result = summarize_data(df, fraction=1.0)
+    assert not result.attrs['approximate']
+    pd.testing.assert_frame_equal(result.xs('estimate', axis=1, level=1), summarize_data(df),
+                                  check_names=False)
+    pd.testing.assert_frame_equal(result.xs('lower', axis=1, level=1), summarize_data(df),
+                                  check_names=False)
+
+def test_summarize_data_sample_invalid():
+    """Test that giving both sample and fraction raises a ValueError."""
+    with pytest.raises(ValueError, match="either sample or fraction"):
+        summarize_data(pd.DataFrame({'A': [1, 2]}), sample=1, fraction=0.5)
+
+def test_summarize_data_duplicate_labels():
+    """Test summarizing a DataFrame whose column labels repeat."""
+    df = pd.DataFrame([[1, 2, 'x'], [3, 4, 'y']], columns=['a', 'a', 'b'])
+    result = summarize_data(df)
+    assert list(result.index) == ['a', 'a']
+    assert result['max'].tolist() == [3.0, 4.0]
@@ -0,0 +1,77 @@
+import pytest
+import numpy as np
+import pandas as pd
+from datpro.datpro import summarize_data
+from datpro.streaming import summarize_stream
+
+@pytest.fixture
+def chunked_df():
+    """Small DataFrame with missing values and a non-numeric column."""
+    return pd.DataFrame({
+        'A': [1, 2, np.nan, 4, 10, 3, 8, 5],
+        'B': [100, 200, 300, 400, 500, 600, 700, 800],
+        'C': ['x', 'y', 'x', 'y', 'x', 'y', 'x', 'y']
+    })
+
+def test_summarize_stream_matches_summarize_data(chunked_df):
+    """Test that small streams are summarized exactly."""
+    chunks = [chunked_df.iloc[i:i + 3] for i in range(0, len(chunked_df), 3)]
+    result = summarize_stream(iter(chunks))
+    pd.testing.assert_frame_equal(result, summarize_data(chunked_df))
+
+def test_summarize_stream_from_csv(chunked_df, tmp_path):
+    """Test reading a CSV file in chunks."""
+    path = tmp_path / "data.csv"
+    chunked_df.to_csv(path, index=False)
+    result = summarize_stream(path, chunksize=2)
+    pd.testing.assert_frame_equal(result, summarize_data(chunked_df))
+
+def test_summarize_stream_from_parquet(chunked_df, tmp_path):
+    """Test reading a Parquet file in batches."""
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "data.parquet"
+    chunked_df.to_parquet(path, index=False)
+    result = summarize_stream(str(path), chunksize=2)
+    pd.testing.assert_frame_equal(result, summarize_data(chunked_df))
+
+def test_summarize_stream_approximate_error():
+    """Test that large streams keep exact extrema and quartiles within the error bound."""
+    rng = np.random.default_rng(0)
+    values = rng.exponential(size=200_000)
+    chunks = (pd.DataFrame({'A': part}) for part in np.array_split(values, 50))
+    result = summarize_stream(chunks, error=0.01, random_state=0)
+    assert result.loc['A', 'min'] == values.min()
+    assert result.loc['A', 'max'] == values.max()
+    ordered = np.sort(values)
+    for label, level in [('25%', 0.25), ('50%', 0.5), ('75%', 0.75)]:
+        rank = np.searchsorted(ordered, result.loc['A', label]) / len(values)
+        assert abs(rank - level) <= 0.01
+
+def test_summarize_stream_empty():
+    """Test that an empty stream raises a ValueError."""
+    with pytest.raises(ValueError, match="The input DataFrame is empty."):
+        summarize_stream(iter([]))
+
+def test_summarize_stream_no_numeric_columns():
+    """Test that a stream without numeric columns raises a ValueError."""
+    chunks = [pd.DataFrame({'A': ['x', 'y']})]
+    with pytest.raises(ValueError, match="The DataFrame contains no numeric columns."):
+        summarize_stream(chunks)
+
+def test_summarize_stream_invalid_chunks():
+    """Test that non-DataFrame chunks raise a TypeError."""
+    with pytest.raises(TypeError):
+        summarize_stream([1, 2, 3])
+    with pytest.raises(ValueError, match="Unsupported file type"):
+        summarize_stream("data.xlsx")
+
+def test_summarize_stream_sample():
+    """Test that a reservoir sample over chunks is bounded in size and counts every row."""
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({'A': rng.normal(size=10000)})
+    chunks = [df.iloc[start:start + 999] for start in range(0, len(df), 999)]
+    result = summarize_stream(chunks, sample=500, random_state=0)
+    assert result.attrs['sample_rows'] == 500
+    assert result.attrs['population_rows'] == 10000
+    median = df['A'].median()
+    assert result.loc['A', ('50%', 'lower')] <= median <= result.loc['A', ('50%', 'upper')]
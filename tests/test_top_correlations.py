@@ -0,0 +1,65 @@
+import pytest
+import numpy as np
+import pandas as pd
+from datpro import CorrelationState, top_correlations
+from datpro._correlation import correlation_matrix
+
+@pytest.fixture
+def wide_df():
+    """DataFrame with one strongly correlated pair, missing values and a constant column."""
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(size=(200, 10)), columns=[f"x{i}" for i in range(10)])
+    df['x7'] = -3 * df['x2'] + rng.normal(scale=0.1, size=200)
+    df.iloc[::7, 3] = np.nan
+    df.iloc[::5, 4] = np.nan
+    df['constant'] = 1.0
+    df['label'] = 'a'
+    return df
+
+def test_top_correlations_strongest_pair(wide_df):
+    """Test that the strongest pair comes first with its pandas correlation."""
+    result = top_correlations(wide_df, k=3, block_size=4)
+    assert list(result.columns) == ['Variable 1', 'Variable 2', 'Correlation']
+    assert len(result) == 3
+    assert (result.iloc[0]['Variable 1'], result.iloc[0]['Variable 2']) == ('x2', 'x7')
+    assert result.iloc[0]['Correlation'] == pytest.approx(wide_df['x2'].corr(wide_df['x7']), abs=1e-5)
+
+def test_top_correlations_match_pandas(wide_df):
+    """Test that blocked, pairwise-complete correlations match DataFrame.corr."""
+    expected = wide_df.corr(numeric_only=True).where(np.triu(np.ones((11, 11), dtype=bool), 1)).stack()
+    expected = expected.reindex(expected.abs().sort_values(ascending=False).index)
+    result = top_correlations(wide_df, k=len(expected), block_size=3, dtype=np.float64)
+    assert len(result) == len(expected)
+    np.testing.assert_allclose(result['Correlation'], expected.to_numpy(), atol=1e-12)
+
+def test_top_correlations_invalid_input():
+    """Test that non-DataFrame input raises a TypeError."""
+    with pytest.raises(TypeError, match="Input must be a pandas DataFrame."):
+        top_correlations([1, 2, 3])
+
+def test_correlation_state_matches_pandas(wide_df):
+    """Test that chunked accumulation gives the in-memory correlation and covariance."""
+    state = CorrelationState()
+    for start in range(0, len(wide_df), 64):
+        state.update(wide_df.iloc[start:start + 64])
+    numeric = wide_df.drop(columns='label')
+    pd.testing.assert_frame_equal(state.correlation(), numeric.corr(), atol=1e-12)
+    pd.testing.assert_frame_equal(state.covariance(), numeric.cov(), atol=1e-12)
+    assert state.top_pairs(1).iloc[0]['Variable 2'] == 'x7'
+
+@pytest.mark.parametrize('with_missing', [False, True])
+def test_correlation_constant_column_matches_pandas(with_missing):
+    """Test that a constant column correlates as NaN, as in DataFrame.corr, on both tile paths."""
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame(rng.normal(size=(500, 3)), columns=['x', 'y', 'z'])
+    df['y'] += 2 * df['x']
+    df['constant'] = 123.456
+    if with_missing:
+        df.iloc[::9, 2] = np.nan
+    expected = df.corr()
+    assert expected['constant'].isna().all()
+    pd.testing.assert_frame_equal(correlation_matrix(df, block_size=2), expected, atol=1e-10)
+    state = CorrelationState().update(df.iloc[:200]).update(df.iloc[200:])
+    pd.testing.assert_frame_equal(state.correlation(), expected, atol=1e-10)
+    pairs = top_correlations(df, k=10, block_size=2)
+    assert 'constant' not in set(pairs['Variable 1']) | set(pairs['Variable 2'])